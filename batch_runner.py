@@ -0,0 +1,93 @@
+import argparse
+import sys
+
+from core.batch import expand_specs, run_batch, print_result, print_index
+from core.case_store import REPORT_FORMATS
+from core.generator import CASE_TYPES, EXTRA_CASE_TYPES
+from core.payloads import PayloadEngine, MAX_SECURITY_CASES, DEFAULT_DEPTH
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate test cases for many API specs in one run')
+    parser.add_argument('specs', nargs='*', help='Spec files or glob patterns (quote them, e.g. "specs/**/*.yaml")')
+    parser.add_argument('--manifest', help='File listing one spec per line, or a JSON list of specs')
+    parser.add_argument('-o', '--output', default='output', help='Output directory (one subdirectory per spec)')
+    parser.add_argument('-j', '--jobs', type=int, default=0, help='Worker processes shared by all specs (0 = one per CPU)')
+    parser.add_argument('--format', choices=['openapi', 'postman', 'apifox'],
+                        help='Spec format for every spec (detected from the file content by default)')
+    parser.add_argument('--case-types', default='normal,error,boundary,security',
+                        help='Comma-separated case types to generate (add combinatorial for pairwise value combinations)')
+    parser.add_argument('--max-combinations', type=int, default=50,
+                        help='Upper bound on combinatorial cases per endpoint')
+    parser.add_argument('--security-categories',
+                        help='Comma-separated security payload categories, or "all" '
+                             '(default: sqli plus any --payloads categories)')
+    parser.add_argument('--payloads', action='append', default=[], metavar='PATH',
+                        help='Extra payload corpus file or directory; its categories replace built-ins of the same name')
+    parser.add_argument('--max-security-cases', type=int, default=MAX_SECURITY_CASES,
+                        help='Upper bound on security cases per endpoint (0 = no limit)')
+    parser.add_argument('--payload-depth', type=int, default=DEFAULT_DEPTH,
+                        help='Payloads sent per parameter and category (0 = every payload of the category)')
+    parser.add_argument('--cache-dir', help='Cache parsed specs here, keyed by file content hash')
+    parser.add_argument('--stream', action='store_true',
+                        help='Parse Postman collections incrementally (requires ijson) instead of loading them whole')
+    parser.add_argument('--json-format', choices=REPORT_FORMATS, default='json',
+                        help='Case dump layout (jsonl writes one case per line, sqlite an indexed test_cases.db)')
+    parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    parser.add_argument('--delta', action='store_true',
+                        help="Store each variant case as its parameter changes from the endpoint's normal case")
+    parser.add_argument('--metadata', choices=['trailer', 'sidecar', 'none'],
+                        help='Where to write report metadata such as total_cases')
+    parser.add_argument('--html', choices=['single', 'paged', 'none'], default='single',
+                        help='HTML report style (paged loads case pages on demand)')
+    parser.add_argument('--page-size', type=int, default=500, help='Cases per page of a paged HTML report')
+    parser.add_argument('--samples', choices=['fixed', 'schema', 'random'], default='fixed',
+                        help='Sample values: fixed constants, deterministic values built from the schema, or seeded random ones')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for --samples random')
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-stage and per-endpoint timings and peak memory in each spec's report metadata")
+    args = parser.parse_args()
+
+    security_categories = [c for c in (args.security_categories or '').split(',') if c]
+    try:
+        # Fail here rather than in every worker
+        PayloadEngine(security_categories, args.payloads)
+    except (ValueError, OSError) as exc:
+        parser.error(str(exc))
+
+    case_types = [t for t in args.case_types.split(',') if t]
+    unknown = [t for t in case_types if t not in CASE_TYPES + EXTRA_CASE_TYPES]
+    if unknown or not case_types:
+        parser.error(f"--case-types takes a comma-separated list of: {', '.join(CASE_TYPES + EXTRA_CASE_TYPES)}"
+                     + (f" (unknown: {', '.join(unknown)})" if unknown else ''))
+
+    jobs = expand_specs(args.specs, args.manifest)
+    if not jobs:
+        parser.error('no spec files matched')
+
+    options = {
+        'case_types': case_types,
+        'format': args.format,
+        'stream': args.stream,
+        'cache_dir': args.cache_dir,
+        'json_format': args.json_format,
+        'compact': args.compact,
+        'delta': args.delta,
+        'metadata': args.metadata,
+        'html': args.html,
+        'page_size': args.page_size,
+        'samples': args.samples,
+        'seed': args.seed,
+        'max_combinations': args.max_combinations,
+        'security_categories': security_categories,
+        'payloads': args.payloads,
+        'max_security_cases': args.max_security_cases,
+        'payload_depth': args.payload_depth,
+        'profile': args.profile
+    }
+
+    index = run_batch(jobs, args.output, args.jobs, options, on_result=print_result)
+    print_index(index, args.output)
+    sys.exit(1 if index['failed'] else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""Throughput benchmarks for the parse -> generate -> report pipeline.
+
+Builds synthetic OpenAPI, Postman and Apifox specs, times every stage
+separately and records each stage's peak traced memory. Results are
+written as JSON; pass --baseline to compare against an earlier run and
+exit non-zero when a stage regressed.
+
+    python benchmarks/bench_pipeline.py --sizes 10,1000 --params 2,20 -o bench.json
+    python benchmarks/bench_pipeline.py --baseline bench.json --threshold 0.25
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import yaml
+
+from core.parsers.parser import SwaggerParser
+from core.parsers.postman_parser import PostmanParser
+from core.parsers.apifox_parser import ApifoxParser
+from core.generator import TestCaseGenerator
+from core.report_generator import ReportGenerator
+
+FORMATS = ('openapi', 'postman', 'apifox')
+CASE_KINDS = ('normal', 'error', 'boundary', 'security')
+
+
+def _body_properties(params: int) -> Tuple[Dict[str, Any], List[str]]:
+    properties = {}
+    for i in range(params):
+        if i % 3 == 0:
+            properties[f"count{i}"] = {'type': 'integer', 'minimum': 0, 'maximum': 1000}
+        elif i % 3 == 1:
+            properties[f"name{i}"] = {'type': 'string', 'minLength': 1, 'maxLength': 64}
+        else:
+            properties[f"mode{i}"] = {'type': 'string', 'enum': ['a', 'b', 'c']}
+    return properties, list(properties)[::2]
+
+
+def build_openapi(operations: int, params: int) -> Dict[str, Any]:
+    """OpenAPI 3 spec with alternating GET (path + query) and POST (body) operations"""
+    properties, required = _body_properties(params)
+    paths = {}
+    for i in range(operations):
+        if i % 2 == 0:
+            paths.setdefault(f"/resources{i // 2}/{{id}}", {})['get'] = {
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}] + [
+                    {'name': f"q{j}", 'in': 'query', 'required': j % 2 == 0, 'type': 'integer', 'minimum': 1}
+                    for j in range(params)
+                ],
+                'responses': {'200': {'description': 'ok'}}
+            }
+        else:
+            paths.setdefault(f"/resources{i // 2}", {})['post'] = {
+                'requestBody': {'content': {'application/json': {'schema': {
+                    'type': 'object', 'properties': properties, 'required': required}}}},
+                'responses': {'201': {'description': 'created'}}
+            }
+    return {'openapi': '3.0.0', 'info': {'title': 'bench', 'version': '1.0.0'}, 'paths': paths}
+
+
+def build_postman(operations: int, params: int) -> Dict[str, Any]:
+    """Postman v2.1 collection with query and raw JSON body parameters"""
+    items = []
+    for i in range(operations):
+        request = {
+            'method': 'GET' if i % 2 == 0 else 'POST',
+            'header': [{'key': 'X-Request-Id', 'value': '1'}],
+            'url': {
+                'raw': f"http://localhost/resources/{i}",
+                'path': ['resources', str(i)],
+                'query': [{'key': f"q{j}", 'value': '1'} for j in range(params)]
+            }
+        }
+        if i % 2:
+            request['body'] = {'mode': 'raw', 'raw': json.dumps({f"field{j}": j for j in range(params)})}
+        items.append({'name': f"op{i}", 'request': request, 'response': []})
+    return {
+        'info': {'name': 'bench', 'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json'},
+        'item': items
+    }
+
+
+def build_apifox(operations: int, params: int) -> Dict[str, Any]:
+    """Apifox export with path parameters and JSON request bodies"""
+    properties, required = _body_properties(params)
+    interfaces = []
+    for i in range(operations):
+        interfaces.append({
+            'name': f"op{i}",
+            'method': 'GET' if i % 2 == 0 else 'POST',
+            'path': f"/resources{i}/{{id}}",
+            'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'type': 'integer'}],
+            'requestBody': {'content': {'application/json': {'schema': {
+                'type': 'object', 'properties': properties, 'required': required}}}},
+            'responses': {'200': {'description': 'ok'}}
+        })
+    return {'name': 'bench', 'version': '1.0.0', 'interfaces': interfaces}
+
+
+def write_spec(fmt: str, operations: int, params: int, directory: str) -> Tuple[str, Any]:
+    """Write a synthetic spec to disk and return (path, parser)"""
+    if fmt == 'openapi':
+        path = os.path.join(directory, f"openapi_{operations}_{params}.yaml")
+        with open(path, 'w') as f:
+            yaml.safe_dump(build_openapi(operations, params), f, sort_keys=False)
+        return path, SwaggerParser()
+    if fmt == 'postman':
+        path = os.path.join(directory, f"postman_{operations}_{params}.json")
+        with open(path, 'w') as f:
+            json.dump(build_postman(operations, params), f)
+        return path, PostmanParser()
+    path = os.path.join(directory, f"apifox_{operations}_{params}.json")
+    with open(path, 'w') as f:
+        json.dump(build_apifox(operations, params), f)
+    return path, ApifoxParser()
+
+
+def measure(func: Callable[[], Any], repeat: int, trace_memory: bool) -> Dict[str, Any]:
+    """Best-of-N wall time plus peak traced memory from one extra run"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak, 'result': result}
+
+
+def bench_spec(fmt: str, operations: int, params: int, directory: str,
+               repeat: int, trace_memory: bool) -> List[Dict[str, Any]]:
+    """Run every stage for one synthetic spec"""
+    spec_path, parser = write_spec(fmt, operations, params, directory)
+    rows = []
+
+    def record(stage: str, outcome: Dict[str, Any], items: int):
+        rows.append({
+            'format': fmt,
+            'operations': operations,
+            'params': params,
+            'stage': stage,
+            'seconds': round(outcome['seconds'], 6),
+            'peak_bytes': outcome['peak_bytes'],
+            'items': items,
+            'items_per_second': round(items / outcome['seconds'], 1) if outcome['seconds'] else None
+        })
+
+    outcome = measure(lambda: parser.parse(spec_path), repeat, trace_memory)
+    api_def = parser.api_def
+    record('parse', outcome, len(api_def.endpoints))
+
+    generator = TestCaseGenerator(parser)
+    all_cases = []
+    for kind in CASE_KINDS:
+        method = getattr(generator, f"generate_{kind}_cases")
+
+        def run(method=method):
+            cases = []
+            for endpoint in api_def.endpoints:
+                cases.extend(method(endpoint['path'], endpoint['method']))
+            return cases
+        outcome = measure(run, repeat, trace_memory)
+        all_cases.extend(outcome['result'])
+        record(f"generate_{kind}_cases", outcome, len(outcome['result']))
+
+    report_generator = ReportGenerator(os.path.join(directory, f"report_{fmt}_{operations}_{params}"))
+    outcome = measure(lambda: report_generator.generate_json_report(all_cases), repeat, trace_memory)
+    record('generate_json_report', outcome, len(all_cases))
+    outcome = measure(lambda: report_generator.generate_html_report(all_cases), repeat, trace_memory)
+    record('generate_html_report', outcome, len(all_cases))
+    return rows
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            threshold: float, min_seconds: float) -> List[Dict[str, Any]]:
+    """Return stages whose time or peak memory grew by more than threshold"""
+    key = lambda row: (row['format'], row['operations'], row['params'], row['stage'])
+    previous = {key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            before, after = old.get(metric), row.get(metric)
+            if not before or after is None:
+                continue
+            if metric == 'seconds' and after < min_seconds:
+                # Sub-millisecond stages are dominated by timer noise
+                continue
+            change = (after - before) / before
+            if change > threshold:
+                regressions.append(dict(zip(('format', 'operations', 'params', 'stage'), key(row)),
+                                        metric=metric, baseline=before, current=after,
+                                        change=round(change, 3)))
+    return regressions
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(',') if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parse -> generate -> report throughput')
+    parser.add_argument('--sizes', type=_int_list, default=[10, 100, 1000],
+                        help='Comma-separated operation counts (e.g. 10,1000,100000)')
+    parser.add_argument('--params', type=_int_list, default=[2, 10],
+                        help='Comma-separated parameter counts per operation')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='Comma-separated spec formats')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run per stage')
+    parser.add_argument('-o', '--output', default='bench_results.json', help='Where to write results')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative slowdown / memory growth that counts as a regression')
+    parser.add_argument('--min-seconds', type=float, default=0.001,
+                        help='Ignore timing regressions for stages faster than this')
+    args = parser.parse_args()
+
+    formats = [f for f in args.formats.split(',') if f]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(sorted(unknown))}")
+
+    rows = []
+    with tempfile.TemporaryDirectory(prefix='testgen-bench-') as directory:
+        for fmt in formats:
+            for operations in args.sizes:
+                for params in args.params:
+                    for row in bench_spec(fmt, operations, params, directory,
+                                          args.repeat, not args.no_memory):
+                        rows.append(row)
+                        peak = f"{row['peak_bytes'] / 1e6:8.1f} MB" if row['peak_bytes'] is not None else ''
+                        print(f"{fmt:8} ops={operations:<7} params={params:<4} {row['stage']:26} "
+                              f"{row['seconds']:9.4f}s {row['items']:>9} items {peak}")
+
+    report = {
+        'metadata': {
+            'generated_at': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': rows
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(rows, baseline, args.threshold, args.min_seconds)
+        for r in regressions:
+            print(f"REGRESSION {r['format']} ops={r['operations']} params={r['params']} {r['stage']} "
+                  f"{r['metric']}: {r['baseline']} -> {r['current']} (+{r['change']:.0%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
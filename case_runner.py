@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+
+from core.parsers.registry import default_registry
+from core.executor import run_cases, iter_case_file
+
+def main():
+    parser = argparse.ArgumentParser(description='Run generated test cases against a live API')
+    parser.add_argument('cases_file', help='test_cases.json / test_cases.jsonl / test_cases.db produced by the generator')
+    parser.add_argument('--base-url', required=True, help='Target base URL, e.g. http://localhost:8080/api')
+    parser.add_argument('--spec', help='API spec the cases came from, used to place parameters in path/query/header/body')
+    parser.add_argument('--format', choices=['openapi', 'postman', 'apifox'],
+                        help='Spec format (detected from the file content by default)')
+    parser.add_argument('-c', '--concurrency', type=int, default=50, help='Requests in flight at once')
+    parser.add_argument('--rate', type=float, help='Maximum requests started per second')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    parser.add_argument('--no-response-schemas', dest='validate_responses', action='store_false',
+                        help='Skip checking response bodies against the schemas declared in --spec')
+    parser.add_argument('-o', '--output', default='output', help='Output directory')
+    args = parser.parse_args()
+
+    api_def = None
+    if args.spec:
+        spec_parser = default_registry().parser_for(args.spec, args.format)
+        api_def = spec_parser.parse(args.spec)
+
+    os.makedirs(args.output, exist_ok=True)
+    results_path = os.path.join(args.output, 'results.jsonl')
+    summary = run_cases(iter_case_file(args.cases_file), args.base_url, results_path,
+                        concurrency=args.concurrency, rate=args.rate,
+                        timeout=args.timeout, api_def=api_def, validate_responses=args.validate_responses)
+
+    print(f"Ran {summary['total']} cases in {summary['elapsed']}s "
+          f"({summary['requests_per_second']} req/s over {summary['connections']} connections)")
+    print(f"Passed: {summary['passed']}  Failed: {summary['failed']}  Errors: {summary['errors']}")
+    print(f"Results saved to: {results_path}")
+    sys.exit(0 if summary['failed'] == 0 and summary['errors'] == 0 else 1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+import datetime
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterable, Optional, Sequence
+from core.parsers.registry import default_registry
+from core.parallel import resolve_jobs
+from core.pipeline import DEFAULT_OPTIONS, payload_engine, generate_for_spec
+from core.report_generator import compile_template, get_environment, HTML_TEMPLATE
+
+INDEX_NAME = 'index.json'
+INDEX_HTML_NAME = 'index.html'
+
+_worker_registry = None
+_worker_payloads = None
+_worker_options = DEFAULT_OPTIONS
+
+
+def expand_specs(patterns: Iterable[str] = (), manifest: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Collect spec jobs from glob patterns and/or a manifest file.
+
+    A manifest is either a text file with one spec path per line (blank
+    lines and # comments ignored) or a JSON list whose entries are paths or
+    {"path": ..., "name": ..., "format": ...} objects. Relative paths are
+    taken from the manifest's directory. Each spec appears once, first
+    occurrence wins.
+    """
+    entries = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        entries.extend({'path': path} for path in matches if os.path.isfile(path))
+    if manifest:
+        base = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest) as f:
+            if manifest.endswith('.json'):
+                listed = json.load(f)
+            else:
+                listed = [line.strip() for line in f]
+                listed = [line for line in listed if line and not line.startswith('#')]
+        for item in listed:
+            entry = dict(item) if isinstance(item, dict) else {'path': item}
+            entry['path'] = os.path.join(base, entry['path'])
+            entries.append(entry)
+
+    return spec_jobs(entries)
+
+
+def spec_jobs(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Jobs for {"path", "name"?, "format"?} entries; each spec appears once and names are made unique"""
+    jobs = []
+    seen_paths = set()
+    used_names = set()
+    for entry in entries:
+        path = os.path.normpath(entry['path'])
+        if path in seen_paths:
+            continue
+        seen_paths.add(path)
+        name = base_name = entry.get('name') or Path(path).stem
+        suffix = 2
+        while name in used_names:
+            name = f"{base_name}-{suffix}"
+            suffix += 1
+        used_names.add(name)
+        jobs.append({'path': path, 'name': name, 'format': entry.get('format')})
+    return jobs
+
+
+def _init_worker(options: Dict[str, Any]):
+    """Warm up a pool worker once: parsers, templates, payload corpora and options are reused for every spec"""
+    global _worker_registry, _worker_options, _worker_payloads
+    _worker_options = options
+    _worker_registry = default_registry(streaming=options['stream'])
+    _worker_payloads = payload_engine(options)
+    get_environment().get_template('paged_report.html')
+    compile_template(HTML_TEMPLATE)
+
+
+def run_spec(job: Dict[str, str], output_dir: str) -> Dict[str, Any]:
+    """Parse, generate and report one spec; failures are returned, not raised"""
+    options = _worker_options
+    registry = _worker_registry or default_registry(streaming=options['stream'])
+    started = time.perf_counter()
+    summary = {'name': job['name'], 'spec': job['path'], 'output_dir': output_dir}
+    try:
+        parser = registry.parser_for(job['path'], job.get('format') or options['format'])
+        result = generate_for_spec(parser, job['path'], output_dir, options, _worker_payloads, log=None)
+        profile = result.pop('profile', None)
+        if profile:
+            # Stage times only; the full profile is in the spec's report metadata
+            result['profile'] = {name: stage['seconds'] for name, stage in profile['stages'].items()}
+        summary.update(status='ok', **result)
+    except Exception as exc:
+        summary.update(status='error', error=f"{type(exc).__name__}: {exc}")
+    summary['seconds'] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def run_batch(jobs: Sequence[Dict[str, str]], output_dir: str, workers: int = 0,
+              options: Optional[Dict[str, Any]] = None,
+              on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Process many specs over one shared process pool and write a combined index.
+
+    Each spec is its own task, so a slow spec only occupies one worker
+    while the rest keep draining the queue. Specs are submitted largest
+    first to keep the tail short. on_result is called as each spec finishes.
+    """
+    options = dict(DEFAULT_OPTIONS, **(options or {}))
+    options['case_types'] = tuple(options['case_types'])
+    os.makedirs(output_dir, exist_ok=True)
+    workers = min(resolve_jobs(workers), max(1, len(jobs)))
+    if workers > 1:
+        # Pool workers cannot start pools of their own, so each spec is generated in one process
+        options['jobs'] = 1
+    started = time.perf_counter()
+
+    def size(job):
+        try:
+            return os.path.getsize(job['path'])
+        except OSError:
+            return 0
+
+    results = []
+    if workers <= 1:
+        _init_worker(options)
+        for job in sorted(jobs, key=size, reverse=True):
+            results.append(run_spec(job, os.path.join(output_dir, job['name'])))
+            if on_result:
+                on_result(results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(options,)) as pool:
+            futures = {pool.submit(run_spec, job, os.path.join(output_dir, job['name'])): job
+                       for job in sorted(jobs, key=size, reverse=True)}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except BrokenProcessPool as exc:
+                    # A worker died (e.g. killed for memory); this and every unfinished spec fail,
+                    # but the index is still written
+                    job = futures[future]
+                    result = {'name': job['name'], 'spec': job['path'],
+                              'output_dir': os.path.join(output_dir, job['name']),
+                              'status': 'error', 'error': f"{type(exc).__name__}: {exc}",
+                              'seconds': round(time.perf_counter() - started, 3)}
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+    results.sort(key=lambda r: r['name'])
+    index = {
+        'generated_at': datetime.datetime.now().isoformat(),
+        'total_specs': len(results),
+        'succeeded': sum(1 for r in results if r['status'] == 'ok'),
+        'failed': sum(1 for r in results if r['status'] != 'ok'),
+        'total_cases': sum(r.get('cases', 0) for r in results),
+        'seconds': round(time.perf_counter() - started, 3),
+        'workers': workers,
+        'specs': results
+    }
+    write_index(index, output_dir)
+    return index
+
+
+def write_index(index: Dict[str, Any], output_dir: str) -> str:
+    """Write index.json plus an index.html linking every spec's reports"""
+    with open(os.path.join(output_dir, INDEX_NAME), 'w') as f:
+        json.dump(index, f, indent=2)
+
+    specs = []
+    for spec in index['specs']:
+        links = {}
+        for key in ('json_report', 'html_report'):
+            if spec.get(key):
+                links[key] = os.path.relpath(spec[key], output_dir)
+        specs.append(dict(spec, **links))
+    html = get_environment().get_template('batch_index.html').render(index=index, specs=specs)
+    index_path = os.path.join(output_dir, INDEX_HTML_NAME)
+    with open(index_path, 'w') as f:
+        f.write(html)
+    return index_path
+
+
+def print_result(result: Dict[str, Any]):
+    """One progress line per finished spec"""
+    if result['status'] == 'ok':
+        print(f"[ok]    {result['name']}: {result['cases']} cases from {result['endpoints']} endpoints "
+              f"in {result['seconds']}s")
+    else:
+        print(f"[error] {result['name']}: {result['error']}")
+
+
+def print_index(index: Dict[str, Any], output_dir: str):
+    print(f"Processed {index['total_specs']} specs ({index['failed']} failed), "
+          f"{index['total_cases']} test cases in {index['seconds']}s")
+    print(f"Summary index saved to: {os.path.join(output_dir, INDEX_HTML_NAME)}")
@@ -0,0 +1,221 @@
+import datetime
+import json
+import os
+import sqlite3
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+from core.records import as_dict
+from core.report_generator import JsonReportWriter, encode_compact
+
+STORE_NAME = 'test_cases.db'
+
+# Layouts accepted for the case dump; sqlite writes a CaseStoreWriter store
+REPORT_FORMATS = ('json', 'array', 'jsonl', 'sqlite')
+
+# Rows buffered before each executemany
+INSERT_BATCH = 5000
+
+_SCHEMA = """
+CREATE TABLE cases (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    expect TEXT NOT NULL
+);
+CREATE TABLE expected_statuses (
+    case_id INTEGER NOT NULL,
+    status INTEGER NOT NULL
+);
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Created after the bulk insert, which is much faster than maintaining them row by row
+_INDEXES = """
+CREATE INDEX idx_cases_endpoint ON cases (method, path, type);
+CREATE INDEX idx_cases_path ON cases (path);
+CREATE INDEX idx_cases_type ON cases (type);
+CREATE INDEX idx_expected_statuses ON expected_statuses (status, case_id);
+"""
+
+
+class CaseStoreWriter:
+    """Write cases to an indexed SQLite store instead of a JSON dump.
+
+    Drop-in for JsonReportWriter in the runners: write/tap/close and
+    total_cases behave the same. Each case is one row with its method,
+    path and type in indexed columns and its parameters and expect block as
+    compact JSON; expected statuses (a case may accept several) go to their
+    own indexed table. The file is rebuilt from scratch on every run, so
+    journaling is off while it is written.
+    """
+
+    def __init__(self, output_path: str, metadata: Optional[Dict] = None):
+        self.output_path = output_path
+        for stale in (output_path, output_path + '-journal'):
+            if os.path.exists(stale):
+                os.unlink(stale)
+        self._conn = sqlite3.connect(output_path)
+        self._conn.execute('PRAGMA journal_mode = OFF')
+        self._conn.execute('PRAGMA synchronous = OFF')
+        self._conn.executescript(_SCHEMA)
+        self.metadata = {
+            "version": "1.0",
+            "generated_at": datetime.datetime.now().isoformat()
+        }
+        self.metadata.update(metadata or {})
+        self.total_cases = 0
+        self._rows: List[Tuple] = []
+        self._statuses: List[Tuple[int, int]] = []
+
+    def write(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a single case to the store and return it in dict form"""
+        case = as_dict(case)
+        request = case['request']
+        expect = case.get('expect', {})
+        self.total_cases += 1
+        case_id = self.total_cases
+        self._rows.append((case_id, case['name'], case['type'], request['method'], request['path'],
+                           encode_compact(request.get('parameters', {})).decode('utf-8'),
+                           encode_compact(expect).decode('utf-8')))
+        status = expect.get('status')
+        for code in (status if isinstance(status, list) else [status]):
+            if isinstance(code, int):
+                self._statuses.append((case_id, code))
+        if len(self._rows) >= INSERT_BATCH:
+            self._flush()
+        return case
+
+    def write_all(self, cases: Iterable[Dict[str, Any]]):
+        for case in cases:
+            self.write(case)
+
+    def tap(self, cases: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Write each case as it passes through, so another consumer can share the stream"""
+        for case in cases:
+            yield self.write(case)
+
+    def _flush(self):
+        self._conn.executemany('INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?, ?)', self._rows)
+        self._conn.executemany('INSERT INTO expected_statuses VALUES (?, ?)', self._statuses)
+        self._rows = []
+        self._statuses = []
+
+    def close(self, metadata: Optional[Dict] = None) -> str:
+        """Finish the store: flush, build indexes and record metadata (plus any extra keys)"""
+        if self._conn is None:
+            return self.output_path
+        self._flush()
+        self.metadata.update(metadata or {})
+        self.metadata['total_cases'] = self.total_cases
+        self._conn.executescript(_INDEXES)
+        self._conn.executemany('INSERT INTO metadata VALUES (?, ?)',
+                               [(key, json.dumps(value)) for key, value in self.metadata.items()])
+        self._conn.commit()
+        self._conn.execute('ANALYZE')
+        self._conn.close()
+        self._conn = None
+        return self.output_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class CaseStore:
+    """Read-only queries over a store written by CaseStoreWriter.
+
+    Filters map onto the indexed columns, so selecting one endpoint's
+    cases of one type reads only those rows, not the whole store. Cases
+    come back as the same dicts the JSON report holds, in generation order.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def _where(self, method: Optional[str], path: Optional[str], case_type: Optional[str],
+               status: Optional[int], name: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, args = [], []
+        if method:
+            clauses.append('method = ?')
+            args.append(method.upper())
+        if path:
+            clauses.append('path = ?')
+            args.append(path)
+        if case_type:
+            clauses.append('type = ?')
+            args.append(case_type)
+        if status is not None:
+            clauses.append('id IN (SELECT case_id FROM expected_statuses WHERE status = ?)')
+            args.append(status)
+        if name:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            escaped = name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            args.append(f"%{escaped}%")
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', args
+
+    def query(self, method: Optional[str] = None, path: Optional[str] = None,
+              case_type: Optional[str] = None, status: Optional[int] = None, name: Optional[str] = None,
+              limit: Optional[int] = None, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Cases matching every given filter (name matches as a substring)"""
+        where, args = self._where(method, path, case_type, status, name)
+        sql = f"SELECT name, type, method, path, parameters, expect FROM cases{where} ORDER BY id"
+        if limit is not None or offset:
+            sql += ' LIMIT ? OFFSET ?'
+            args += [-1 if limit is None else limit, offset]
+        for name_, case_type_, method_, path_, parameters, expect in self._conn.execute(sql, args):
+            yield {
+                'name': name_,
+                'type': case_type_,
+                'request': {'method': method_, 'path': path_, 'parameters': json.loads(parameters)},
+                'expect': json.loads(expect)
+            }
+
+    def count(self, method: Optional[str] = None, path: Optional[str] = None,
+              case_type: Optional[str] = None, status: Optional[int] = None, name: Optional[str] = None) -> int:
+        where, args = self._where(method, path, case_type, status, name)
+        return self._conn.execute(f"SELECT COUNT(*) FROM cases{where}", args).fetchone()[0]
+
+    def endpoints(self) -> List[Tuple[str, str, int]]:
+        """(method, path, case count) for every endpoint in the store"""
+        return self._conn.execute(
+            'SELECT method, path, COUNT(*) FROM cases GROUP BY method, path ORDER BY MIN(id)').fetchall()
+
+    def metadata(self) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in self._conn.execute('SELECT key, value FROM metadata')}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.query()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def open_case_report(output_dir: str, fmt: str = 'json', compact: bool = False,
+                     metadata_mode: Optional[str] = None, delta: bool = False):
+    """Writer for the case dump in output_dir: a JSON report, or the SQLite store for fmt 'sqlite'.
+
+    The store keeps every case whole, so delta only applies to the JSON layouts.
+    """
+    if fmt == 'sqlite':
+        return CaseStoreWriter(os.path.join(output_dir, STORE_NAME))
+    filename = 'test_cases.jsonl' if fmt == 'jsonl' else 'test_cases.json'
+    return JsonReportWriter(os.path.join(output_dir, filename), fmt=fmt, compact=compact,
+                            metadata_mode=metadata_mode, delta=delta)
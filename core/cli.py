@@ -0,0 +1,104 @@
+import argparse
+import os
+from typing import Dict, Any
+from core.parsers.registry import default_registry
+from core.generator import CASE_TYPES, MAX_COMBINATIONS
+from core.payloads import MAX_SECURITY_CASES, DEFAULT_DEPTH
+from core.case_store import REPORT_FORMATS
+from core.pipeline import DEFAULT_OPTIONS, payload_engine, generate_for_spec
+from core.batch import spec_jobs, run_batch, print_result, print_index
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    """Options shared by the command-line runners, with the defaults of DEFAULT_OPTIONS"""
+    parser.add_argument('--format', choices=['openapi', 'postman', 'apifox'],
+                        help='Spec format (detected from the file content by default)')
+    parser.add_argument('-o', '--output', default='output', help='Output directory')
+    parser.add_argument('--cache-dir', help='Cache parsed specs here, keyed by file content hash')
+    parser.add_argument('--stream', action='store_true',
+                        help='Parse Postman collections incrementally (requires ijson) instead of loading them whole')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Worker processes for case generation, or for whole specs when given a directory (0 = one per CPU)')
+    parser.add_argument('--json-format', choices=REPORT_FORMATS, default=DEFAULT_OPTIONS['json_format'],
+                        help='Case dump layout (jsonl writes one case per line, sqlite an indexed test_cases.db)')
+    parser.add_argument('--compact', action='store_true', help='Write JSON without indentation')
+    parser.add_argument('--delta', action='store_true',
+                        help="Store each variant case as its parameter changes from the endpoint's normal case")
+    parser.add_argument('--metadata', choices=['trailer', 'sidecar', 'none'],
+                        help='Where to write report metadata such as total_cases')
+    parser.add_argument('--html', choices=['single', 'paged', 'none'], default=DEFAULT_OPTIONS['html'],
+                        help='HTML report style (paged loads case pages on demand)')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_OPTIONS['page_size'],
+                        help='Cases per page of a paged HTML report')
+    parser.add_argument('--samples', choices=['fixed', 'schema', 'random'], default=DEFAULT_OPTIONS['samples'],
+                        help='Sample values: fixed constants, deterministic values built from the schema, or seeded random ones')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for --samples random')
+    parser.add_argument('--combinatorial', action='store_true',
+                        help='Also generate pairwise combinations of boundary and enum values')
+    parser.add_argument('--max-combinations', type=int, default=MAX_COMBINATIONS,
+                        help='Upper bound on combinatorial cases per endpoint')
+    parser.add_argument('--no-security', dest='security', action='store_false',
+                        help='Skip security cases')
+    parser.add_argument('--security-categories',
+                        help='Comma-separated security payload categories, or "all" '
+                             '(default: sqli plus any --payloads categories)')
+    parser.add_argument('--payloads', action='append', default=[], metavar='PATH',
+                        help='Extra payload corpus file or directory; its categories replace built-ins of the same name')
+    parser.add_argument('--max-security-cases', type=int, default=MAX_SECURITY_CASES,
+                        help='Upper bound on security cases per endpoint (0 = no limit)')
+    parser.add_argument('--payload-depth', type=int, default=DEFAULT_DEPTH,
+                        help='Payloads sent per parameter and category (0 = every payload of the category)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record time, case counts and peak memory per stage and endpoint in the report metadata')
+    parser.add_argument('--profile-stats', metavar='PATH',
+                        help='Also write cProfile stats for the run to PATH (implies --profile)')
+    parser.add_argument('--validate', action='store_true',
+                        help='Validate cases against the case schema while writing reports')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only regenerate endpoints whose definition changed since the last run in this output directory')
+
+
+def options_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """Pipeline options from arguments parsed with add_arguments()"""
+    options = {key: getattr(args, key) for key in DEFAULT_OPTIONS if hasattr(args, key)}
+    options['security_categories'] = tuple(c for c in (args.security_categories or '').split(',') if c)
+    options['payloads'] = tuple(args.payloads)
+    case_types = tuple(t for t in CASE_TYPES if t != 'security' or args.security)
+    if args.combinatorial:
+        case_types += ('combinatorial',)
+    options['case_types'] = case_types
+    return dict(DEFAULT_OPTIONS, **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Swagger Test Case Generator')
+    parser.add_argument('swagger_file',
+                        help='Path to a Swagger/OpenAPI, Postman or Apifox file, or a directory of them')
+    add_arguments(parser)
+    args = parser.parse_args()
+    options = options_from_args(args)
+
+    try:
+        payloads = payload_engine(options)
+    except (ValueError, OSError) as exc:
+        parser.error(str(exc))
+
+    registry = default_registry(streaming=options['stream'])
+    if os.path.isdir(args.swagger_file):
+        # Batch mode: one output subdirectory per spec, with -j specs processed at once
+        entries = []
+        for spec_path in registry.spec_files(args.swagger_file):
+            try:
+                registry.parser_for(spec_path, options['format'])
+            except (ValueError, OSError) as exc:
+                print(f"Skipping {spec_path}: {exc}")
+                continue
+            entries.append({'path': spec_path})
+        index = run_batch(spec_jobs(entries), args.output, options['jobs'], options, on_result=print_result)
+        print_index(index, args.output)
+    else:
+        try:
+            spec_parser = registry.parser_for(args.swagger_file, options['format'])
+        except (ValueError, OSError) as exc:
+            parser.error(str(exc))
+        generate_for_spec(spec_parser, args.swagger_file, args.output, options, payloads)
@@ -0,0 +1,452 @@
+import asyncio
+import json
+import ssl
+import time
+import jsonschema
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Callable
+from urllib.parse import urlsplit, quote, urlencode
+from core.parsers.iapi_parser import ApiDefinition
+from core.parsers.loader import loads_json
+from core.responses import response_schema, to_json_schema
+from core.case_store import CaseStore
+from core.report_generator import JsonReportWriter, expand_deltas
+
+BUCKET_LOCATIONS = {
+    'path_params': 'path',
+    'query_params': 'query',
+    'header_params': 'header',
+    'body_params': 'body'
+}
+
+# Schema errors reported per response before the rest are summarised
+MAX_SCHEMA_ERRORS = 5
+
+# Methods whose unplaced parameters go to the query string rather than a JSON body
+QUERY_METHODS = ('GET', 'DELETE', 'HEAD', 'OPTIONS')
+
+
+class HttpError(Exception):
+    """Raised when a response cannot be read from the connection"""
+    pass
+
+
+def parameter_locations(endpoint: Optional[Dict]) -> Dict[str, str]:
+    """Map parameter name -> location ('path', 'query', 'header', 'body') for an endpoint"""
+    locations = {}
+    if not endpoint:
+        return locations
+    for bucket, location in BUCKET_LOCATIONS.items():
+        for param in endpoint.get('parameters', {}).get(bucket, []):
+            locations.setdefault(param.get('name'), location)
+    return locations
+
+
+def build_request(case: Dict[str, Any], endpoint: Optional[Dict] = None) -> Tuple[str, str, Dict[str, str], Optional[bytes]]:
+    """Turn a generated case into (method, target, headers, body).
+
+    Parameter locations come from the endpoint definition when one is
+    given; otherwise names found in the path template are path params and
+    the rest go to the query string (GET/DELETE/HEAD/OPTIONS) or a JSON body.
+    """
+    request = case['request']
+    method = request['method'].upper()
+    path = request['path']
+    locations = parameter_locations(endpoint)
+
+    query = []
+    headers = {}
+    body = {}
+    for name, value in (request.get('parameters') or {}).items():
+        location = locations.get(name)
+        if location is None:
+            if f"{{{name}}}" in path or f":{name}" in path:
+                location = 'path'
+            elif method in QUERY_METHODS:
+                location = 'query'
+            else:
+                location = 'body'
+
+        if location == 'path':
+            encoded = quote(str(value), safe='')
+            path = path.replace(f"{{{name}}}", encoded).replace(f":{name}", encoded)
+        elif location == 'query':
+            query.append((name, value if isinstance(value, str) else json.dumps(value)))
+        elif location == 'header':
+            headers[name] = str(value)
+        else:
+            body[name] = value
+
+    if not path.startswith('/'):
+        path = '/' + path
+    target = path + ('?' + urlencode(query) if query else '')
+    payload = None
+    if body:
+        payload = json.dumps(body).encode('utf-8')
+        headers.setdefault('Content-Type', 'application/json')
+    return method, target, headers, payload
+
+
+def check_expectations(case: Dict[str, Any], status: int, body: bytes) -> List[str]:
+    """Compare a response against the case's expect block and return failure messages"""
+    expect = case.get('expect', {})
+    failures = []
+    expected_status = expect.get('status')
+    allowed = expected_status if isinstance(expected_status, list) else [expected_status]
+    if expected_status is not None and status not in allowed:
+        failures.append(f"status {status} not in {allowed}")
+
+    if expect.get('not_contains'):
+        text = body.decode('utf-8', errors='replace')
+        for needle in expect['not_contains']:
+            if needle in text:
+                failures.append(f"response contains {needle!r}")
+    return failures
+
+
+class ResponseValidator:
+    """Check response bodies against the schemas each operation declares.
+
+    One JSON Schema validator is built per (operation, status) the first
+    time that pair is seen and reused for every later response, so checking
+    a response costs a dict lookup, a JSON decode and the validation walk.
+    Parsed models are converted once and shared by every validator.
+    """
+
+    def __init__(self, api_def: ApiDefinition):
+        self.api_def = api_def
+        self.compiled = 0
+        self.checked = 0
+        self._validators: Dict[Tuple[str, str, int], Any] = {}
+        self._definitions: Optional[Dict[str, Any]] = None
+
+    def validator_for(self, method: str, path: str, status: int):
+        """Compiled validator for an operation's response, or None if it declares no JSON schema"""
+        key = (method.upper(), path, status)
+        try:
+            return self._validators[key]
+        except KeyError:
+            pass
+        endpoint = self.api_def.get_endpoint(method, path)
+        schema = response_schema(endpoint.get('responses'), status) if endpoint else None
+        validator = self._compile(schema) if schema is not None else None
+        self._validators[key] = validator
+        return validator
+
+    def _compile(self, schema: Dict[str, Any]):
+        models = self.api_def.models
+        if self._definitions is None:
+            self._definitions = {name: to_json_schema(model, models) for name, model in models.items()}
+        root = to_json_schema(schema, models)
+        if self._definitions:
+            root = {'allOf': [root], 'definitions': self._definitions}
+        validator_cls = jsonschema.validators.validator_for(root, default=jsonschema.Draft4Validator)
+        self.compiled += 1
+        return validator_cls(root)
+
+    def check(self, method: str, path: str, status: int, body: bytes) -> List[str]:
+        """Failure messages for a response body that does not match its declared schema"""
+        validator = self.validator_for(method, path, status)
+        if validator is None:
+            return []
+        self.checked += 1
+        try:
+            instance = loads_json(body)
+        except ValueError:
+            return [f"response body is not valid JSON for status {status}"]
+        if validator.is_valid(instance):
+            return []
+        failures = []
+        for error in validator.iter_errors(instance):
+            if len(failures) == MAX_SCHEMA_ERRORS:
+                failures.append("response body has further schema errors")
+                break
+            location = '/'.join(str(part) for part in error.absolute_path)
+            failures.append(f"response body{' at ' + location if location else ''}: {error.message}")
+        return failures
+
+
+class RateLimiter:
+    """Token bucket limiting how many requests start per second"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostPool:
+    """Keep-alive HTTP/1.1 connections to a single host"""
+
+    def __init__(self, host: str, port: int, use_ssl: bool, max_connections: int):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.opened = 0
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def request(self, method: str, target: str, headers: Dict[str, str],
+                      body: Optional[bytes], timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request, reusing an idle connection when one is available"""
+        async with self._slots:
+            reused = bool(self._idle)
+            conn = self._idle.pop() if reused else await self._open()
+            try:
+                result, keep_alive = await asyncio.wait_for(
+                    self._exchange(conn, method, target, headers, body), timeout)
+            except (HttpError, ConnectionError, asyncio.IncompleteReadError):
+                self._close(conn)
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one
+                conn = await self._open()
+                try:
+                    result, keep_alive = await asyncio.wait_for(
+                        self._exchange(conn, method, target, headers, body), timeout)
+                except BaseException:
+                    self._close(conn)
+                    raise
+            except BaseException:
+                self._close(conn)
+                raise
+
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                self._close(conn)
+            return result
+
+    async def close(self):
+        while self._idle:
+            self._close(self._idle.pop())
+
+    async def _open(self):
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    def _close(self, conn):
+        conn[1].close()
+
+    async def _exchange(self, conn, method, target, headers, body):
+        reader, writer = conn
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 "Connection: keep-alive", f"Content-Length: {len(body) if body else 0}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b''))
+        await writer.drain()
+        return await read_response(reader, method)
+
+
+async def read_response(reader: asyncio.StreamReader, method: str = 'GET') -> Tuple[Tuple[int, Dict[str, str], bytes], bool]:
+    """Read one HTTP/1.x response; returns ((status, headers, body), keep_alive)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise HttpError("connection closed before response")
+    parts = status_line.decode('latin-1').split(' ', 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise HttpError(f"malformed status line: {status_line!r}")
+    version = parts[0]
+    try:
+        status = int(parts[1])
+    except ValueError:
+        raise HttpError(f"malformed status line: {status_line!r}")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+    if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+        body = b''
+    elif 'chunked' in headers.get('transfer-encoding', '').lower():
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(chunks)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return (status, headers, body), keep_alive
+
+
+class CaseRunner:
+    """Execute generated test cases concurrently against a live target.
+
+    Cases are pulled lazily from any iterable and handed to `concurrency`
+    worker tasks; each host gets its own keep-alive connection pool, and an
+    optional token bucket caps the request rate. Every result is passed to
+    on_result as soon as its response has been checked. Given the api_def
+    the cases came from, response bodies are also checked against the
+    schemas it declares (see ResponseValidator).
+    """
+
+    def __init__(self, base_url: str, concurrency: int = 50, rate: Optional[float] = None,
+                 timeout: float = 30.0, api_def: Optional[ApiDefinition] = None,
+                 validate_responses: bool = True):
+        parsed = urlsplit(base_url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            raise ValueError(f"Unsupported base URL: {base_url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        self.base_path = parsed.path.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.timeout = timeout
+        self.api_def = api_def
+        # Response bodies are checked against declared schemas whenever the spec is known
+        self.responses = ResponseValidator(api_def) if api_def is not None and validate_responses else None
+        self.pools: Dict[Tuple[str, str, int], HostPool] = {}
+        self.summary = {'total': 0, 'passed': 0, 'failed': 0, 'errors': 0}
+
+    def _pool(self) -> HostPool:
+        key = (self.scheme, self.host, self.port)
+        if key not in self.pools:
+            self.pools[key] = HostPool(self.host, self.port, self.scheme == 'https', self.concurrency)
+        return self.pools[key]
+
+    async def run(self, cases: Iterable[Dict[str, Any]],
+                  on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Run every case and return summary counts"""
+        self.summary = {'total': 0, 'passed': 0, 'failed': 0, 'errors': 0}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        limiter = RateLimiter(self.rate) if self.rate else None
+        started = time.perf_counter()
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if limiter:
+                    await limiter.acquire()
+                result = await self.execute(*item)
+                self._count(result)
+                if on_result:
+                    on_result(result)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            for index, case in enumerate(cases):
+                await queue.put((index, case))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            for pool in self.pools.values():
+                await pool.close()
+
+        elapsed = time.perf_counter() - started
+        self.summary['elapsed'] = round(elapsed, 3)
+        self.summary['requests_per_second'] = round(self.summary['total'] / elapsed, 1) if elapsed else None
+        self.summary['connections'] = sum(pool.opened for pool in self.pools.values())
+        return self.summary
+
+    async def execute(self, index: int, case: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single case and check its expectations"""
+        request = case['request']
+        endpoint = self.api_def.get_endpoint(request['method'], request['path']) if self.api_def else None
+        method, target, headers, body = build_request(case, endpoint)
+        result = {
+            'index': index,
+            'name': case.get('name'),
+            'type': case.get('type'),
+            'method': method,
+            'url': f"{self.scheme}://{self.host}:{self.port}{self.base_path}{target}",
+            'expected_status': case.get('expect', {}).get('status')
+        }
+
+        started = time.perf_counter()
+        try:
+            status, _, response_body = await self._pool().request(
+                method, self.base_path + target, headers, body, self.timeout)
+        except (OSError, ValueError, HttpError, asyncio.TimeoutError, asyncio.IncompleteReadError) as exc:
+            result.update(status=None, passed=False, error=f"{type(exc).__name__}: {exc}", failures=[])
+        else:
+            failures = check_expectations(case, status, response_body)
+            if self.responses is not None:
+                failures.extend(self.responses.check(request['method'], request['path'], status, response_body))
+            result.update(status=status, passed=not failures, failures=failures)
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return result
+
+    def _count(self, result: Dict[str, Any]):
+        self.summary['total'] += 1
+        if result.get('error'):
+            self.summary['errors'] += 1
+        elif result['passed']:
+            self.summary['passed'] += 1
+        else:
+            self.summary['failed'] += 1
+
+
+def iter_case_file(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Read cases from a JSON report (object or bare array), a JSON Lines file or a case store"""
+    # Reports written with delta=True store variants relative to the normal case
+    return expand_deltas(_iter_stored_cases(file_path))
+
+
+def _iter_stored_cases(file_path: str) -> Iterator[Dict[str, Any]]:
+    if file_path.endswith('.db'):
+        with CaseStore(file_path) as store:
+            yield from store
+        return
+    if file_path.endswith('.jsonl'):
+        with open(file_path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    if 'metadata' not in record or 'request' in record:
+                        yield record
+        return
+    with open(file_path) as f:
+        data = json.load(f)
+    yield from (data['test_cases'] if isinstance(data, dict) else data)
+
+
+def run_cases(cases: Iterable[Dict[str, Any]], base_url: str, results_path: Optional[str] = None,
+              **runner_options) -> Dict[str, Any]:
+    """Synchronously run cases, streaming each result to a JSON Lines file"""
+    runner = CaseRunner(base_url, **runner_options)
+    if results_path is None:
+        return asyncio.run(runner.run(cases))
+
+    writer = JsonReportWriter(results_path, fmt='jsonl', compact=True, metadata_mode='sidecar',
+                              metadata={'base_url': base_url})
+    try:
+        summary = asyncio.run(runner.run(cases, writer.write))
+    finally:
+        writer.close(runner.summary)
+    return summary
@@ -0,0 +1,88 @@
+import json
+import os
+from typing import Dict, List, Any, Iterable, Optional, Sequence
+from core.executor import build_request
+from core.parsers.iapi_parser import ApiDefinition
+from core.records import as_dict
+from core.report_generator import encode_compact, get_environment
+
+EXPORT_FORMATS = ('pytest', 'locust')
+
+DATA_NAME = 'cases.jsonl'
+INDEX_NAME = 'cases.index.json'
+
+# Generated module and the template it is rendered from, per format
+MODULES = {
+    'pytest': ('test_api.py', 'pytest_suite.py.j2'),
+    'locust': ('locustfile.py', 'locust_suite.py.j2')
+}
+
+
+def write_case_data(cases: Iterable[Dict[str, Any]], output_dir: str,
+                    api_def: Optional[ApiDefinition] = None) -> Dict[str, Any]:
+    """Write ready-to-send requests as JSON Lines plus an index of per-endpoint byte ranges.
+
+    Each line holds one case already turned into (method, target, headers,
+    body) by executor.build_request, so generated suites do no parameter
+    placement of their own. Consecutive cases of the same endpoint form one
+    block; the index lists every block's endpoint, byte offset, length and
+    case names, which is all a suite needs at import time.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    blocks: List[Dict[str, Any]] = []
+    total = 0
+    offset = 0
+    with open(os.path.join(output_dir, DATA_NAME), 'wb') as f:
+        for case in cases:
+            case = as_dict(case)
+            request = case['request']
+            endpoint = api_def.get_endpoint(request['method'], request['path']) if api_def else None
+            method, target, headers, body = build_request(case, endpoint)
+            expect = case.get('expect', {})
+            line = encode_compact({
+                'name': case.get('name'),
+                'method': method,
+                'target': target,
+                'headers': headers,
+                'body': body.decode('utf-8') if body is not None else None,
+                'status': expect.get('status'),
+                'not_contains': expect.get('not_contains') or []
+            }) + b'\n'
+            f.write(line)
+
+            key = f"{request['method'].upper()} {request['path']}"
+            if not blocks or blocks[-1]['endpoint'] != key:
+                blocks.append({'endpoint': key, 'offset': offset, 'length': 0, 'names': []})
+            blocks[-1]['length'] += len(line)
+            blocks[-1]['names'].append(case.get('name'))
+            offset += len(line)
+            total += 1
+
+    index = {'total': total, 'endpoints': len({block['endpoint'] for block in blocks}), 'blocks': blocks}
+    with open(os.path.join(output_dir, INDEX_NAME), 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    return index
+
+
+def export_suites(cases: Iterable[Dict[str, Any]], output_dir: str,
+                  formats: Sequence[str] = EXPORT_FORMATS, api_def: Optional[ApiDefinition] = None,
+                  base_url: str = 'http://localhost:8080', spec: Optional[str] = None) -> List[str]:
+    """Write the shared case data and one runnable module per format; returns the module paths"""
+    unknown = [fmt for fmt in formats if fmt not in MODULES]
+    if unknown:
+        raise ValueError(f"Unknown export format: {', '.join(unknown)}")
+    index = write_case_data(cases, output_dir, api_def)
+
+    environment = get_environment()
+    paths = []
+    for fmt in formats:
+        module_name, template_name = MODULES[fmt]
+        source = environment.get_template(template_name).render(
+            spec=os.path.basename(spec) if spec else None, total=index['total'],
+            endpoint_count=index['endpoints'], data_name=DATA_NAME, index_name=INDEX_NAME,
+            module_name=module_name, base_url=base_url)
+        path = os.path.join(output_dir, module_name)
+        with open(path, 'w') as f:
+            f.write(source + '\n')
+        paths.append(path)
+    return paths
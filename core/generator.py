@@ -1,10 +1,73 @@
-from typing import Dict, List, Any
+import random
+import sys
+from typing import Dict, List, Any, Callable, Optional, Iterable, Iterator
 from core.parsers.iapi_parser import IApiParser, ApiDefinition
+from core.records import Case
+from core.samples import SampleEngine
+from core.pairwise import pairwise_rows
+from core.payloads import PayloadEngine
+from core.responses import success_status, client_error_status
+
+CASE_TYPES = ('normal', 'error', 'boundary', 'security')
+
+# Opt-in case types, generated only when requested explicitly
+EXTRA_CASE_TYPES = ('combinatorial',)
+
+# Upper bound on combinatorial cases per endpoint
+MAX_COMBINATIONS = 50
+
+# Bump whenever a change to case generation alters the cases produced
+GENERATOR_VERSION = 5
 
 class TestCaseGenerator:
-    def __init__(self, parser: IApiParser):
+    def __init__(self, parser: IApiParser, samples: Optional[SampleEngine] = None,
+                 max_combinations: int = MAX_COMBINATIONS, payloads: Optional[PayloadEngine] = None):
         self.parser = parser
+        self.samples = samples or SampleEngine()
+        self.max_combinations = max_combinations
+        self.payloads = payloads or PayloadEngine()
         
+    def fingerprint(self) -> Dict[str, Any]:
+        """Settings that affect generated cases, for caches that reuse earlier output"""
+        fingerprint = {'version': GENERATOR_VERSION}
+        if self.samples.mode != 'fixed':
+            fingerprint['samples'] = self.samples.fingerprint()
+        if self.max_combinations != MAX_COMBINATIONS:
+            fingerprint['max_combinations'] = self.max_combinations
+        payloads = self.payloads.fingerprint()
+        if payloads:
+            fingerprint['payloads'] = payloads
+        return fingerprint
+
+    def _find_endpoint(self, path: str, method: str) -> Optional[Dict]:
+        """Look up an endpoint in the parsed definition via its (method, path) index"""
+        api_def = getattr(self.parser, 'api_def', None)
+        if api_def is None:
+            return None
+        return api_def.get_endpoint(method, path)
+
+    def generate_all(self, endpoint: Dict, case_types: Iterable[str] = CASE_TYPES) -> List[Case]:
+        """Generate every requested case type for an endpoint record"""
+        return list(self.iter_all(endpoint, case_types))
+
+    def iter_all(self, endpoint: Dict, case_types: Iterable[str] = CASE_TYPES) -> Iterator[Case]:
+        """Lazily yield every requested case type for an endpoint record"""
+        builders = {
+            'normal': self.iter_normal_cases,
+            'error': self.iter_error_cases,
+            'boundary': self.iter_boundary_cases,
+            'security': self.iter_security_cases,
+            'combinatorial': self.iter_combinatorial_cases
+        }
+        for case_type in case_types:
+            yield from builders[case_type](endpoint)
+
+    def iter_cases(self, endpoints: Iterable[Dict], case_types: Iterable[str] = CASE_TYPES) -> Iterator[Case]:
+        """Lazily yield cases for a sequence of endpoint records, in order"""
+        case_types = tuple(case_types)
+        for endpoint in endpoints:
+            yield from self.iter_all(endpoint, case_types)
+
     def _get_parameters_from_endpoint(self, endpoint: Dict) -> Dict[str, Any]:
         """Extract parameters from endpoint definition"""
         params = endpoint.get('parameters', {})
@@ -15,272 +78,245 @@ class TestCaseGenerator:
             'body_params': [p for p in params.get('body_params', [])]
         }
 
-    def generate_normal_cases(self, path: str, method: str) -> List[Dict[str, Any]]:
+    def generate_normal_cases(self, path: str, method: str) -> List[Case]:
         """Generate normal flow test cases"""
-        cases = []
-        # Use the original file path stored in parser
-        api_def = self.parser.api_def
-        endpoint = next((e for e in api_def.endpoints 
-                       if e['path'] == path and e['method'] == method.upper()), None)
+        endpoint = self._find_endpoint(path, method)
         if not endpoint:
-            return cases
-            
+            return []
+        return list(self.iter_normal_cases(endpoint))
+
+    def iter_normal_cases(self, endpoint: Dict) -> Iterator[Case]:
+        """Yield normal flow test cases for an endpoint record"""
+        path = endpoint['path']
+        method = sys.intern(endpoint['method'].upper())
         params = self._get_parameters_from_endpoint(endpoint)
         
-        # Generate case with all required parameters
-        case = {
-            'name': f"{method.upper()}_{path.replace('/', '_')}_normal",
-            'type': 'normal',
-            'request': {
-                'method': method.upper(),
-                'path': path,
-                'parameters': {}
-            },
-            'expect': {
-                'status': 200
-            }
-        }
+        # Generate case with all required parameters; it should get a declared success status
+        case = Case(f"{method}_{path.replace('/', '_')}_normal", 'normal', method, path,
+                    status=success_status(endpoint.get('responses')))
         
         # Add required parameters
         for param_type, param_list in params.items():
-            for param in param_list:
-                if param.get('required', False):
-                    case['request']['parameters'][param['name']] = self._get_sample_value(param)
+            case.parameters.update(self._required_values(endpoint, param_type, param_list))
         
-        cases.append(case)
-        return cases
+        yield case
     
-    def generate_error_cases(self, path: str, method: str) -> List[Dict[str, Any]]:
+    def _required_values(self, endpoint: Dict, param_type: str, param_list: List[Dict]) -> Dict[str, Any]:
+        """Sample values for the required parameters of one location, computed once per endpoint"""
+        # Random values are seeded per endpoint and location, so every case type sees the same baseline
+        rng = self.samples.rng(endpoint['method'].upper(), endpoint['path'], param_type)
+        return {p['name']: self._get_sample_value(p, rng) for p in param_list if p.get('required', False)}
+
+    @staticmethod
+    def _variant(baseline: Dict[str, Any], name: str, make_value: Callable[[], Any]) -> Dict[str, Any]:
+        """Copy of a baseline with one parameter overridden.
+
+        A parameter the baseline lacks (i.e. an optional one) stays absent,
+        and make_value is only called when the override is actually used.
+        """
+        parameters = dict(baseline)
+        if name in parameters:
+            parameters[name] = make_value()
+        return parameters
+
+    def generate_error_cases(self, path: str, method: str) -> List[Case]:
         """Generate error flow test cases"""
-        cases = []
-        api_def = self.parser.api_def
-        endpoint = next((e for e in api_def.endpoints 
-                       if e['path'] == path and e['method'] == method.upper()), None)
+        endpoint = self._find_endpoint(path, method)
         if not endpoint:
-            return cases
-            
+            return []
+        return list(self.iter_error_cases(endpoint))
+
+    def iter_error_cases(self, endpoint: Dict) -> Iterator[Case]:
+        """Yield error flow test cases for an endpoint record"""
+        path = endpoint['path']
+        method = sys.intern(endpoint['method'].upper())
         params = self._get_parameters_from_endpoint(endpoint)
         
+        status = client_error_status(endpoint.get('responses'))
+
         # Case 1: Missing required parameter
         for param_type, param_list in params.items():
+            baseline = None
             for param in param_list:
                 if param.get('required', False):
-                    case = {
-                        'name': f"{method.upper()}_{path.replace('/', '_')}_missing_{param['name']}",
-                        'type': 'error',
-                        'request': {
-                            'method': method.upper(),
-                            'path': path,
-                            'parameters': {}
-                        },
-                        'expect': {
-                            'status': 400
-                        }
-                    }
+                    if baseline is None:
+                        baseline = self._required_values(endpoint, param_type, param_list)
                     # Add other required params except the missing one
-                    for other_param in [p for p in param_list if p.get('required', False) and p['name'] != param['name']]:
-                        case['request']['parameters'][other_param['name']] = self._get_sample_value(other_param)
-                    
-                    cases.append(case)
-        
-        return cases
+                    parameters = {k: v for k, v in baseline.items() if k != param['name']}
+                    yield Case(f"{method}_{path.replace('/', '_')}_missing_{param['name']}",
+                               'error', method, path, parameters, status=status)
     
-    def _get_sample_value(self, param: Dict[str, Any]) -> Any:
+    @staticmethod
+    def _value_type(param: Dict[str, Any]) -> Optional[str]:
+        """Declared type of a parameter, falling back to its schema (OpenAPI 3 style)"""
+        schema = param.get('schema')
+        return param.get('type') or (schema.get('type') if isinstance(schema, dict) else None)
+
+    def _get_sample_value(self, param: Dict[str, Any], rng: Optional[random.Random] = None) -> Any:
         """Generate sample value based on parameter definition"""
-        if 'example' in param:
-            return param['example']
-        
-        param_type = param.get('type', 'string')
-        if param_type == 'integer':
-            return 123
-        elif param_type == 'boolean':
-            return True
-        elif param_type == 'number':
-            return 1.23
-        else:  # string
-            return "sample_value"
+        return self.samples.value(param, rng)
 
-    def generate_boundary_cases(self, path: str, method: str) -> List[Dict[str, Any]]:
+    def generate_boundary_cases(self, path: str, method: str) -> List[Case]:
         """Generate boundary value test cases"""
-        cases = []
-        api_def = self.parser.api_def
-        endpoint = next((e for e in api_def.endpoints 
-                       if e['path'] == path and e['method'] == method.upper()), None)
+        endpoint = self._find_endpoint(path, method)
         if not endpoint:
-            return cases
-            
+            return []
+        return list(self.iter_boundary_cases(endpoint))
+
+    def iter_boundary_cases(self, endpoint: Dict) -> Iterator[Case]:
+        """Yield boundary value test cases for an endpoint record"""
+        path = endpoint['path']
+        method = sys.intern(endpoint['method'].upper())
+        prefix = f"{method}_{path.replace('/', '_')}"
         params = self._get_parameters_from_endpoint(endpoint)
+        valid = success_status(endpoint.get('responses'))
+        invalid = client_error_status(endpoint.get('responses'))
         
         for param_type, param_list in params.items():
+            # Every variant carries all required params of this location
+            baseline = self._required_values(endpoint, param_type, param_list)
             for param in param_list:
+                name = param['name']
                 param_type = param.get('type', 'string')
                 
                 # Numeric boundary cases
                 if param_type in ['integer', 'number']:
                     # Zero value case
-                    case = {
-                        'name': f"{method.upper()}_{path.replace('/', '_')}_zero_{param['name']}",
-                        'type': 'boundary',
-                        'request': {
-                            'method': method.upper(),
-                            'path': path,
-                            'parameters': {}
-                        },
-                        'expect': {'status': 200}
-                    }
-                    # Add all required params
-                    for p in [p for p in param_list if p.get('required', False)]:
-                        if p['name'] == param['name']:
-                            value = 0
-                        else:
-                            value = self._get_sample_value(p)
-                        case['request']['parameters'][p['name']] = value
-                    cases.append(case)
+                    yield Case(f"{prefix}_zero_{name}", 'boundary', method, path,
+                               self._variant(baseline, name, lambda: 0), status=valid)
 
                     # Min boundary case
                     if 'minimum' in param:
-                        case = {
-                            'name': f"{method.upper()}_{path.replace('/', '_')}_min_{param['name']}",
-                            'type': 'boundary',
-                            'request': {
-                                'method': method.upper(),
-                                'path': path,
-                                'parameters': {}
-                            },
-                            'expect': {'status': 200}
-                        }
-                        # Add all required params
-                        for p in [p for p in param_list if p.get('required', False)]:
-                            if p['name'] == param['name']:
-                                value = param['minimum']
-                            else:
-                                value = self._get_sample_value(p)
-                            case['request']['parameters'][p['name']] = value
-                        cases.append(case)
+                        yield Case(f"{prefix}_min_{name}", 'boundary', method, path,
+                                   self._variant(baseline, name, lambda: param['minimum']), status=valid)
 
                     # Max boundary case
                     if 'maximum' in param:
-                        case = {
-                            'name': f"{method.upper()}_{path.replace('/', '_')}_max_{param['name']}",
-                            'type': 'boundary',
-                            'request': {
-                                'method': method.upper(),
-                                'path': path,
-                                'parameters': {}
-                            },
-                            'expect': {'status': 200}
-                        }
-                        # Add all required params
-                        for p in [p for p in param_list if p.get('required', False)]:
-                            if p['name'] == param['name']:
-                                value = param['maximum']
-                            else:
-                                value = self._get_sample_value(p)
-                            case['request']['parameters'][p['name']] = value
-                        cases.append(case)
+                        yield Case(f"{prefix}_max_{name}", 'boundary', method, path,
+                                   self._variant(baseline, name, lambda: param['maximum']), status=valid)
 
                 # String boundary cases
                 elif param_type == 'string':
                     # Enum invalid value case
                     if param.get('enum'):
-                        case = {
-                            'name': f"{method.upper()}_{path.replace('/', '_')}_invalid_enum_{param['name']}",
-                            'type': 'boundary',
-                            'request': {
-                                'method': method.upper(),
-                                'path': path,
-                                'parameters': {}
-                            },
-                            'expect': {'status': 400}
-                        }
-                        # Add all required params
-                        for p in [p for p in param_list if p.get('required', False)]:
-                            if p['name'] == param['name']:
-                                value = "INVALID_" + param['enum'][0]  # Generate invalid enum value
-                            else:
-                                value = self._get_sample_value(p)
-                            case['request']['parameters'][p['name']] = value
-                        cases.append(case)
+                        # Generate invalid enum value
+                        yield Case(f"{prefix}_invalid_enum_{name}", 'boundary', method, path,
+                                   self._variant(baseline, name, lambda: "INVALID_" + param['enum'][0]), status=invalid)
 
                     # Min length case
                     if param.get('minLength') is not None:
-                        case = {
-                            'name': f"{method.upper()}_{path.replace('/', '_')}_min_length_{param['name']}",
-                            'type': 'boundary',
-                            'request': {
-                                'method': method.upper(),
-                                'path': path,
-                                'parameters': {}
-                            },
-                            'expect': {'status': 200}
-                        }
-                        # Add all required params
-                        for p in [p for p in param_list if p.get('required', False)]:
-                            if p['name'] == param['name']:
-                                value = "a" * param['minLength']
-                            else:
-                                value = self._get_sample_value(p)
-                            case['request']['parameters'][p['name']] = value
-                        cases.append(case)
+                        yield Case(f"{prefix}_min_length_{name}", 'boundary', method, path,
+                                   self._variant(baseline, name, lambda: "a" * param['minLength']), status=valid)
 
                     # Max length case
                     if param.get('maxLength') is not None:
-                        case = {
-                            'name': f"{method.upper()}_{path.replace('/', '_')}_max_length_{param['name']}",
-                            'type': 'boundary',
-                            'request': {
-                                'method': method.upper(),
-                                'path': path,
-                                'parameters': {}
-                            },
-                            'expect': {'status': 200}
-                        }
-                        # Add all required params
-                        for p in [p for p in param_list if p.get('required', False)]:
-                            if p['name'] == param['name']:
-                                value = "a" * param['maxLength']
-                            else:
-                                value = self._get_sample_value(p)
-                            case['request']['parameters'][p['name']] = value
-                        cases.append(case)
-        
-        return cases
+                        yield Case(f"{prefix}_max_length_{name}", 'boundary', method, path,
+                                   self._variant(baseline, name, lambda: "a" * param['maxLength']), status=valid)
 
-    def generate_security_cases(self, path: str, method: str) -> List[Dict[str, Any]]:
+    def generate_security_cases(self, path: str, method: str) -> List[Case]:
         """Generate security test cases based on OWASP Top 10"""
-        cases = []
-        api_def = self.parser.api_def
-        endpoint = next((e for e in api_def.endpoints 
-                       if e['path'] == path and e['method'] == method.upper()), None)
+        endpoint = self._find_endpoint(path, method)
         if not endpoint:
-            return cases
-            
+            return []
+        return list(self.iter_security_cases(endpoint))
+
+    def iter_security_cases(self, endpoint: Dict) -> Iterator[Case]:
+        """Yield security test cases based on OWASP Top 10 for an endpoint record.
+
+        Each string parameter gets the payload categories that target its
+        location (see PayloadEngine), up to the engine's per-endpoint budget.
+        """
+        path = endpoint['path']
+        method = sys.intern(endpoint['method'].upper())
+        prefix = f"{method}_{path.replace('/', '_')}"
         params = self._get_parameters_from_endpoint(endpoint)
-        
-        # SQL Injection test cases
+
+        targets = [(param_type, param) for param_type, param_list in params.items()
+                   for param in param_list if self._value_type(param) == 'string']
+        baselines = {}
+        for param_type, param, category, rank in self.payloads.attacks(method, path, targets):
+            baseline = baselines.get(param_type)
+            if baseline is None:
+                baseline = baselines[param_type] = self._required_values(endpoint, param_type, params[param_type])
+            # Optional parameters are sent too when they carry the payload
+            parameters = dict(baseline)
+            parameters[param['name']] = category.payloads[rank]
+            yield Case(f"{prefix}_{category.label(rank)}_{param['name']}", 'security', method, path, parameters,
+                       status=list(category.status), not_contains=list(category.not_contains))
+
+    def generate_combinatorial_cases(self, path: str, method: str) -> List[Case]:
+        """Generate pairwise combinations of boundary values"""
+        endpoint = self._find_endpoint(path, method)
+        if not endpoint:
+            return []
+        return list(self.iter_combinatorial_cases(endpoint))
+
+    def iter_combinatorial_cases(self, endpoint: Dict) -> Iterator[Case]:
+        """Yield cases covering every pair of boundary/enum values across an endpoint's parameters.
+
+        Boundary cases vary one parameter at a time; these vary all of them
+        together so that interactions between two parameters are exercised.
+        The rows come from a pairwise covering array, capped at
+        max_combinations per endpoint.
+        """
+        path = endpoint['path']
+        method = sys.intern(endpoint['method'].upper())
+        params = self._get_parameters_from_endpoint(endpoint)
+
+        names, domains = [], []
+        parameters = {}
         for param_type, param_list in params.items():
+            baseline = self._required_values(endpoint, param_type, param_list)
+            parameters.update(baseline)
+            # Optional parameters draw from the same per-location random source as the baseline
+            rng = self.samples.rng(method, path, param_type)
             for param in param_list:
-                if param.get('type') == 'string':
-                    case = {
-                        'name': f"{method.upper()}_{path.replace('/', '_')}_sqli_{param['name']}",
-                        'type': 'security',
-                        'request': {
-                            'method': method.upper(),
-                            'path': path,
-                            'parameters': {}
-                        },
-                        'expect': {
-                            'status': [400, 401, 403, 500],  # Any of these would indicate proper handling
-                            'not_contains': ['SQL syntax', 'error in your SQL']
-                        }
-                    }
-                    # Add all parameters with attack vector in the target param
-                    for p in param_list:
-                        if p.get('required', False):
-                            if p['name'] == param['name']:
-                                case['request']['parameters'][p['name']] = "admin' OR '1'='1"
-                            else:
-                                case['request']['parameters'][p['name']] = self._get_sample_value(p)
-                    cases.append(case)
-        
-        return cases
+                domain = self._combination_values(param, baseline, rng)
+                if len(domain) > 1:
+                    names.append(param['name'])
+                    domains.append(domain)
+        if len(domains) < 2:
+            # A single varying parameter is already covered by the boundary cases
+            return
+
+        prefix = f"{method}_{path.replace('/', '_')}"
+        status = success_status(endpoint.get('responses'))
+        rows = pairwise_rows([len(domain) for domain in domains], self.max_combinations)
+        # The all-defaults row is the normal case
+        rows = [row for row in rows if any(row)]
+        for number, row in enumerate(rows, 1):
+            combination = dict(parameters)
+            for name, domain, index in zip(names, domains, row):
+                combination[name] = domain[index]
+            yield Case(f"{prefix}_combination_{number}", 'combinatorial', method, path, combination, status=status)
+
+    def _combination_values(self, param: Dict[str, Any], baseline: Dict[str, Any],
+                            rng: Optional[random.Random] = None) -> List[Any]:
+        """Valid values a parameter takes in combinations, its sample value first"""
+        name = param['name']
+        sample = baseline[name] if name in baseline else self._get_sample_value(param, rng)
+        param_type = param.get('type', 'string')
+        if param.get('enum'):
+            candidates = list(param['enum'])
+        elif param_type in ['integer', 'number']:
+            # Every combination expects success, so only values inside the declared range take part
+            low, high = param.get('minimum'), param.get('maximum')
+            candidates = [value for value in (sample, 0, low, high)
+                          if isinstance(value, (int, float)) and not isinstance(value, bool)
+                          and (low is None or value >= low) and (high is None or value <= high)]
+        elif param_type == 'string':
+            candidates = [sample]
+            if param.get('minLength') is not None:
+                candidates.append("a" * param['minLength'])
+            if param.get('maxLength') is not None:
+                candidates.append("a" * param['maxLength'])
+        elif param_type == 'boolean':
+            candidates = [sample, not sample] if isinstance(sample, bool) else [sample]
+        else:
+            candidates = [sample]
+
+        values = []
+        for value in candidates:
+            if value is not None and not any(type(v) is type(value) and v == value for v in values):
+                values.append(value)
+        return values
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterable, Iterator
+from core.records import as_dict
+
+MANIFEST_NAME = '.testgen_manifest.json'
+CASE_STORE_NAME = '.testgen_cases.jsonl'
+
+# Bump whenever the manifest or case store layout changes
+MANIFEST_VERSION = 2
+
+def endpoint_key(endpoint: Dict) -> str:
+    return f"{endpoint['method'].upper()} {endpoint['path']}"
+
+def entry_key(key: str, occurrence: int) -> str:
+    """Manifest key of the n-th definition of an endpoint key; the first keeps the bare key"""
+    return key if occurrence == 1 else f"{key}#{occurrence}"
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+def endpoint_hash(endpoint: Dict) -> str:
+    """Hash an endpoint record exactly as ApiDefinition.add_endpoint stored it"""
+    return _digest(as_dict(endpoint))
+
+def case_hash(case: Dict[str, Any]) -> str:
+    return _digest(case)[:16]
+
+
+class IncrementalStore:
+    """Reuse cases from the previous run for endpoints whose definition is unchanged.
+
+    Next to the reports it keeps a manifest (endpoint -> definition hash,
+    offset into the case store, per-case hashes) and a JSON Lines case
+    store with one line of cases per endpoint. A run only generates cases
+    for new or changed endpoints and splices everything else back in from
+    the store, preserving endpoint order. A method and path defined more
+    than once gets one entry per definition. The manifest also records the
+    generator fingerprint; when it changes, every endpoint is regenerated.
+    """
+
+    def __init__(self, output_dir: str, fingerprint: Any = None):
+        self.output_dir = Path(output_dir)
+        self.manifest_path = self.output_dir / MANIFEST_NAME
+        self.store_path = self.output_dir / CASE_STORE_NAME
+        self.fingerprint = _digest([MANIFEST_VERSION, fingerprint])
+        self.previous = self._load_manifest()
+        self.diff: Dict[str, Any] = {}
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('fingerprint') != self.fingerprint or not self.store_path.exists():
+            return {}
+        return manifest.get('endpoints', {})
+
+    def iter_cases(self, endpoints: List[Dict],
+                   generate: Callable[[List[Dict]], Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Yield cases for every endpoint, calling generate() only for new or changed ones.
+
+        The manifest and store are only replaced once the stream has been
+        fully consumed, so an interrupted run leaves the previous state intact.
+        """
+        occurrences = Counter()
+        walk = []
+        for endpoint in endpoints:
+            key = endpoint_key(endpoint)
+            occurrences[key] += 1
+            walk.append((key, occurrences[key], endpoint, endpoint_hash(endpoint)))
+
+        # A spec may define the same method and path more than once. Their
+        # cases cannot be told apart, so the n-th definitions of each key are
+        # generated as their own stream, in which every key is unique
+        changed = {1: []}
+        for key, occurrence, endpoint, digest in walk:
+            if self.previous.get(entry_key(key, occurrence), {}).get('hash') != digest:
+                changed.setdefault(occurrence, []).append(endpoint)
+        # generate() yields in endpoint order, so each changed endpoint's cases
+        # are pulled from its stream as the walk below reaches that endpoint
+        streams = {}
+        for occurrence, selected in changed.items():
+            stream = iter(generate(selected))
+            streams[occurrence] = [stream, next(stream, None)]
+
+        entries = {}
+        added_cases, removed_cases, changed_cases = [], [], []
+        endpoint_diff = {'added': [], 'removed': [], 'changed': [], 'unchanged': 0}
+        tmp_store = self.store_path.with_name(self.store_path.name + '.tmp')
+        old_store = open(self.store_path, 'rb') if self.previous else None
+        try:
+            with open(tmp_store, 'wb') as out:
+                for key, occurrence, endpoint, digest in walk:
+                    stored_key = entry_key(key, occurrence)
+                    old = self.previous.get(stored_key)
+                    offset = out.tell()
+                    if old is not None and old['hash'] == digest:
+                        old_store.seek(old['offset'])
+                        line = old_store.readline()
+                        out.write(line)
+                        entries[stored_key] = {'hash': digest, 'offset': offset, 'cases': old['cases']}
+                        endpoint_diff['unchanged'] += 1
+                        yield from json.loads(line)
+                        continue
+
+                    endpoint_diff['changed' if old else 'added'].append(stored_key)
+                    stream = streams[occurrence]
+                    case_hashes = {}
+                    out.write(b'[')
+                    while stream[1] is not None:
+                        case = as_dict(stream[1])
+                        request = case['request']
+                        if f"{request['method'].upper()} {request['path']}" != key:
+                            break
+                        if case_hashes:
+                            out.write(b',')
+                        out.write(json.dumps(case, separators=(',', ':')).encode('utf-8'))
+                        case_hashes[case['name']] = case_hash(case)
+                        yield case
+                        stream[1] = next(stream[0], None)
+                    out.write(b']\n')
+                    entries[stored_key] = {'hash': digest, 'offset': offset, 'cases': case_hashes}
+
+                    old_hashes = old['cases'] if old else {}
+                    added_cases.extend(n for n in case_hashes if n not in old_hashes)
+                    removed_cases.extend(n for n in old_hashes if n not in case_hashes)
+                    changed_cases.extend(n for n, h in case_hashes.items()
+                                         if n in old_hashes and old_hashes[n] != h)
+        finally:
+            if old_store is not None:
+                old_store.close()
+
+        for key, old in self.previous.items():
+            if key not in entries:
+                endpoint_diff['removed'].append(key)
+                removed_cases.extend(old['cases'])
+
+        os.replace(tmp_store, self.store_path)
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'endpoints': entries}, f, separators=(',', ':'))
+
+        self.diff = {
+            'endpoints': endpoint_diff,
+            'cases': {'added': added_cases, 'removed': removed_cases, 'changed': changed_cases}
+        }
+
+    def summary(self) -> str:
+        endpoints = self.diff.get('endpoints', {})
+        cases = self.diff.get('cases', {})
+        return (f"Endpoints: {len(endpoints.get('added', []))} added, {len(endpoints.get('changed', []))} changed, "
+                f"{len(endpoints.get('removed', []))} removed, {endpoints.get('unchanged', 0)} reused; "
+                f"cases: {len(cases.get('added', []))} added, {len(cases.get('changed', []))} changed, "
+                f"{len(cases.get('removed', []))} removed")
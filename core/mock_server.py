@@ -0,0 +1,381 @@
+import asyncio
+import json
+import re
+from collections import Counter
+from http import HTTPStatus
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import parse_qsl, unquote
+from core.parsers.iapi_parser import ApiDefinition
+from core.samples import SampleEngine
+from core.responses import DEFAULT_SUCCESS_STATUS, declared_statuses, declared_response
+
+# Largest request head accepted before the connection is dropped
+MAX_HEAD_BYTES = 64 * 1024
+
+# Nested $ref levels followed when building a response body from a schema
+MAX_REF_DEPTH = 8
+
+_TEMPLATE_PARAM = re.compile(r"\{\{?([^{}/]+)\}?\}|:([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class MockResponse:
+    """A response the mock sends, encoded to bytes once and reused"""
+    __slots__ = ('status', 'content_type', 'body', 'headers', '_encoded')
+
+    def __init__(self, status: int, body: bytes = b'', content_type: str = 'application/json',
+                 headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.headers = headers or {}
+        self._encoded = None
+
+    @classmethod
+    def error(cls, status: int, message: str, **details: Any) -> 'MockResponse':
+        return cls(status, json.dumps(dict(error=message, **details)).encode('utf-8'))
+
+    def encode(self) -> bytes:
+        if self._encoded is None:
+            try:
+                reason = HTTPStatus(self.status).phrase
+            except ValueError:
+                reason = 'Unknown'
+            lines = [f"HTTP/1.1 {self.status} {reason}", f"Content-Length: {len(self.body)}"]
+            if self.body:
+                lines.append(f"Content-Type: {self.content_type}")
+            lines.extend(f"{name}: {value}" for name, value in self.headers.items())
+            self._encoded = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + self.body
+        return self._encoded
+
+
+class _Node:
+    __slots__ = ('static', 'param', 'patterns', 'value')
+
+    def __init__(self):
+        self.static: Dict[str, '_Node'] = {}
+        self.param: Optional['_Node'] = None
+        self.patterns: List[Tuple[Any, '_Node']] = []
+        self.value: Any = None
+
+
+def split_path(path: str) -> List[str]:
+    """Path segments without empty leading/trailing parts; '/' has none"""
+    path = path.split('?', 1)[0].strip('/')
+    return path.split('/') if path else []
+
+
+class PathRouter:
+    """Radix tree over path segments, matching concrete paths to templates.
+
+    Templates may use OpenAPI '{id}', Postman ':id' / '{{id}}' or mixed
+    segments such as '{name}.json'. Matching walks one tree level per
+    segment, trying literal children before parameters, so it costs
+    O(path length) however many routes are registered; it only backtracks
+    when a literal branch dead-ends deeper down.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self.size = 0
+
+    def setdefault(self, template: str, value: Any) -> Tuple[Any, List[str]]:
+        """Value stored for a template, storing value first if it has none, plus its parameter names"""
+        node = self._root
+        names = []
+        for segment in split_path(template):
+            whole = _TEMPLATE_PARAM.fullmatch(segment)
+            if whole:
+                names.append(whole.group(1) or whole.group(2))
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            elif _TEMPLATE_PARAM.search(segment):
+                regex, segment_names = self._segment_pattern(segment)
+                names.extend(segment_names)
+                for pattern, child in node.patterns:
+                    if pattern.pattern == regex.pattern:
+                        node = child
+                        break
+                else:
+                    child = _Node()
+                    node.patterns.append((regex, child))
+                    node = child
+            else:
+                node = node.static.setdefault(unquote(segment), _Node())
+        if node.value is None:
+            self.size += 1
+            node.value = value
+        return node.value, names
+
+    @staticmethod
+    def _segment_pattern(segment: str):
+        parts, names, position = [], [], 0
+        for match in _TEMPLATE_PARAM.finditer(segment):
+            parts.append(re.escape(segment[position:match.start()]))
+            parts.append('([^/]+?)')
+            names.append(match.group(1) or match.group(2))
+            position = match.end()
+        parts.append(re.escape(segment[position:]))
+        return re.compile(''.join(parts)), names
+
+    def match(self, path: str) -> Optional[Tuple[Any, List[str]]]:
+        """(value, captured parameter values in path order) for a concrete path, or None"""
+        segments = [unquote(segment) for segment in split_path(path)]
+        stack = [(self._root, 0, [])]
+        while stack:
+            node, index, captured = stack.pop()
+            if index == len(segments):
+                if node.value is not None:
+                    return node.value, captured
+                continue
+            segment = segments[index]
+            # Pushed in reverse priority: literal children are tried first
+            if node.param is not None:
+                stack.append((node.param, index + 1, captured + [segment]))
+            for pattern, child in reversed(node.patterns):
+                found = pattern.fullmatch(segment)
+                if found:
+                    stack.append((child, index + 1, captured + list(found.groups())))
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, index + 1, captured))
+        return None
+
+
+class _Route:
+    __slots__ = ('endpoint', 'path_names', 'required', 'response')
+
+    def __init__(self, endpoint: Dict, path_names: List[str], required: Dict[str, List[str]],
+                 response: MockResponse):
+        self.endpoint = endpoint
+        self.path_names = path_names
+        self.required = required
+        self.response = response
+
+
+class MockServer:
+    """asyncio HTTP/1.1 stub answering requests according to an ApiDefinition.
+
+    Every endpoint gets a route in a PathRouter and one precomputed
+    response: the example of its lowest 2xx response (an 'example',
+    the first of 'examples', Swagger 2 'examples', or a value built from the
+    response schema), encoded once. Requests missing a required path,
+    query, header or body parameter get 400 when validate is on; unknown paths get
+    404 and unsupported methods 405. Connections are kept alive and
+    pipelined requests are answered in order.
+    """
+
+    def __init__(self, api_def: ApiDefinition, host: str = '127.0.0.1', port: int = 0,
+                 validate: bool = True):
+        self.api_def = api_def
+        self.host = host
+        self.port = port
+        self.validate = validate
+        self.router = PathRouter()
+        self.requests = 0
+        self.status_counts: Counter = Counter()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._samples = SampleEngine('schema')
+        for endpoint in api_def.endpoints:
+            self.add_endpoint(endpoint)
+
+    def add_endpoint(self, endpoint: Dict):
+        # Methods of one path template share a route table
+        routes, path_names = self.router.setdefault(endpoint['path'], {})
+        required = {}
+        for bucket in ('query_params', 'header_params', 'body_params'):
+            params = endpoint.get('parameters', {}).get(bucket, [])
+            names_required = [p['name'] for p in params if p.get('required', False)]
+            if names_required:
+                required[bucket] = names_required
+        routes[endpoint['method'].upper()] = _Route(endpoint, path_names, required,
+                                                    self._example_response(endpoint.get('responses') or {}))
+
+    def dispatch(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> MockResponse:
+        """Answer one request; headers are keyed by lower-case name"""
+        self.requests += 1
+        response = self._dispatch(method.upper(), target, headers, body)
+        self.status_counts[response.status] += 1
+        return response
+
+    def _dispatch(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> MockResponse:
+        path, _, query = target.partition('?')
+        matched = self.router.match(path)
+        if matched is None:
+            return MockResponse.error(404, 'no such path', path=path)
+        routes, captured = matched
+        route = routes.get(method)
+        if route is None:
+            response = MockResponse.error(405, 'method not allowed', allowed=sorted(routes))
+            response.headers['Allow'] = ', '.join(sorted(routes))
+            return response
+        if self.validate:
+            # A placeholder left in the path, e.g. '/pets/{petId}', means the value was never filled in
+            missing = [name for name, value in zip(route.path_names, captured)
+                       if not value or _TEMPLATE_PARAM.fullmatch(value)]
+            if route.required:
+                found = self._missing(route, query, headers, body)
+                if found is None:
+                    return MockResponse.error(400, 'request body is not valid JSON')
+                missing.extend(found)
+            if missing:
+                return MockResponse.error(400, 'missing required parameters', missing=missing)
+        return route.response
+
+    @staticmethod
+    def _missing(route: _Route, query: str, headers: Dict[str, str], body: bytes) -> Optional[List[str]]:
+        """Required parameters absent from the request, or None if the body cannot be read"""
+        missing = []
+        if 'query_params' in route.required:
+            present = {name for name, _ in parse_qsl(query, keep_blank_values=True)}
+            missing.extend(name for name in route.required['query_params'] if name not in present)
+        if 'header_params' in route.required:
+            missing.extend(name for name in route.required['header_params'] if name.lower() not in headers)
+        if 'body_params' in route.required:
+            fields: Dict[str, Any] = {}
+            if body:
+                if 'application/x-www-form-urlencoded' in headers.get('content-type', ''):
+                    fields = dict(parse_qsl(body.decode('utf-8', errors='replace'), keep_blank_values=True))
+                else:
+                    try:
+                        fields = json.loads(body)
+                    except ValueError:
+                        return None
+                    if not isinstance(fields, dict):
+                        fields = {}
+            missing.extend(name for name in route.required['body_params'] if name not in fields)
+        return missing
+
+    def _example_response(self, responses: Dict[str, Any]) -> MockResponse:
+        """Precompute the success response for an endpoint from its response definitions"""
+        # Status keys may be ints (YAML 200:) or strings ('201', 2XX, default)
+        statuses = [code for code in declared_statuses(responses) if 200 <= code < 300]
+        status = statuses[0] if statuses else DEFAULT_SUCCESS_STATUS
+        response = declared_response(responses, status)
+        if not isinstance(response, dict):
+            return MockResponse(status)
+        if status in (204, 304):
+            return MockResponse(status)
+
+        content = response.get('content') or {}
+        content_type = next((ct for ct in content if 'json' in ct), next(iter(content), 'application/json'))
+        media = content.get(content_type) or {}
+        swagger_examples = response.get('examples') or {}
+
+        found, value = True, None
+        if 'example' in media:
+            value = media['example']
+        elif media.get('examples'):
+            first = next(iter(media['examples'].values()))
+            value = first.get('value') if isinstance(first, dict) else first
+        elif swagger_examples:
+            content_type, value = next(iter(swagger_examples.items()))
+        elif isinstance(media.get('schema') or response.get('schema'), dict):
+            schema = self._resolve_refs(media.get('schema') or response.get('schema'), MAX_REF_DEPTH)
+            value = self._samples.compile(schema)(None)
+        else:
+            found = False
+
+        if not found:
+            return MockResponse(status)
+        if isinstance(value, (bytes, str)):
+            body = value.encode('utf-8') if isinstance(value, str) else value
+        else:
+            body = json.dumps(value).encode('utf-8')
+        return MockResponse(status, body, content_type)
+
+    def _resolve_refs(self, schema: Any, depth: int) -> Any:
+        """Replace $refs with the parsed models they name, down to depth levels"""
+        if isinstance(schema, list):
+            return [self._resolve_refs(item, depth) for item in schema]
+        if not isinstance(schema, dict):
+            return schema
+        if '$ref' in schema:
+            if depth <= 0:
+                return {}
+            name = schema['$ref'].rsplit('/', 1)[-1]
+            return self._resolve_refs(self.api_def.models.get(name, {}), depth - 1)
+        return {key: self._resolve_refs(value, depth) for key, value in schema.items()}
+
+    async def start(self) -> Tuple[str, int]:
+        """Start listening; returns the bound (host, port)"""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _MockProtocol(self), self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.host, self.port
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+
+class _MockProtocol(asyncio.Protocol):
+    """Minimal HTTP/1.1 request parser feeding MockServer.dispatch"""
+
+    def __init__(self, server: MockServer):
+        self.server = server
+        self.transport = None
+        self.buffer = bytearray()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        self.buffer += data
+        while self.transport is not None:
+            end = self.buffer.find(b'\r\n\r\n')
+            if end < 0:
+                if len(self.buffer) > MAX_HEAD_BYTES:
+                    self._reply(MockResponse.error(431, 'request head too large'), False)
+                return
+            lines = bytes(self.buffer[:end]).decode('latin-1').split('\r\n')
+            parts = lines[0].split(' ')
+            if len(parts) != 3:
+                self._reply(MockResponse.error(400, 'malformed request line'), False)
+                return
+            method, target, version = parts
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            if 'chunked' in headers.get('transfer-encoding', '').lower():
+                self._reply(MockResponse.error(411, 'chunked request bodies are not supported'), False)
+                return
+            try:
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                self._reply(MockResponse.error(400, 'invalid Content-Length'), False)
+                return
+            total = end + 4 + length
+            if len(self.buffer) < total:
+                return
+            body = bytes(self.buffer[end + 4:total])
+            del self.buffer[:total]
+
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+            self._reply(self.server.dispatch(method, target, headers, body), keep_alive)
+
+    def _reply(self, response: MockResponse, keep_alive: bool):
+        self.transport.write(response.encode())
+        if not keep_alive:
+            self.transport.close()
+            self.transport = None
+
+    def connection_lost(self, exc):
+        self.transport = None
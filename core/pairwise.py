@@ -0,0 +1,81 @@
+from itertools import product
+from typing import List, Optional, Sequence
+
+def pairwise_rows(sizes: Sequence[int], max_rows: Optional[int] = None) -> List[List[int]]:
+    """Rows of value indexes covering every pair of values across parameters.
+
+    sizes[i] is the number of candidate values of parameter i. Uses the
+    in-parameter-order strategy (IPO): start from all combinations of the
+    two largest domains, then add one parameter at a time, first extending
+    existing rows with the value covering the most new pairs, then adding
+    rows for pairs still missing. The row count grows roughly with
+    largest_domain ** 2 * log(parameters), not with the product of domains.
+
+    With max_rows, no rows are added past that count; pairs that would need
+    more rows are left uncovered.
+    """
+    if not sizes:
+        return []
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+    ordered = [sizes[i] for i in order]
+    if len(ordered) == 1:
+        rows = [[v] for v in range(ordered[0])]
+    else:
+        rows = [list(pair) + [None] * (len(ordered) - 2)
+                for pair in product(range(ordered[0]), range(ordered[1]))]
+    if max_rows is not None:
+        rows = rows[:max_rows]
+
+    for k in range(2, len(ordered)):
+        # uncovered[j][a] holds the values of parameter k not yet paired with value a of parameter j
+        uncovered = [[set(range(ordered[k])) for _ in range(ordered[j])] for j in range(k)]
+        remaining = ordered[k] * sum(ordered[:k])
+
+        # Horizontal growth: pick the value of parameter k that covers the most new pairs
+        for row in rows:
+            if not remaining:
+                row[k] = 0
+                continue
+            gains = [0] * ordered[k]
+            for j in range(k):
+                if row[j] is not None:
+                    for value in uncovered[j][row[j]]:
+                        gains[value] += 1
+            best = max(range(ordered[k]), key=gains.__getitem__)
+            row[k] = best
+            for j in range(k):
+                if row[j] is not None and best in uncovered[j][row[j]]:
+                    uncovered[j][row[j]].discard(best)
+                    remaining -= 1
+
+        # Vertical growth: fill a free cell of a row with the right value of k, else add a row
+        if not remaining:
+            continue
+        # Rows that still have free cells, grouped by their value of k
+        open_rows = [[] for _ in range(ordered[k])]
+        for row in rows:
+            if None in row[:k]:
+                open_rows[row[k]].append(row)
+        for j in range(k):
+            for a in range(ordered[j]):
+                for b in sorted(uncovered[j][a]):
+                    for row in open_rows[b]:
+                        if row[j] is None:
+                            row[j] = a
+                            break
+                    else:
+                        if max_rows is not None and len(rows) >= max_rows:
+                            continue
+                        row = [None] * len(ordered)
+                        row[j], row[k] = a, b
+                        rows.append(row)
+                        open_rows[b].append(row)
+
+    result = []
+    for row in rows:
+        # Unconstrained cells take the first (default) value; restore original parameter order
+        filled = [0] * len(sizes)
+        for position, index in enumerate(order):
+            filled[index] = 0 if row[position] is None else row[position]
+        result.append(filled)
+    return result
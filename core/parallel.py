@@ -0,0 +1,72 @@
+import copy
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Sequence
+from core.generator import TestCaseGenerator, CASE_TYPES
+
+# Chunks handed to each worker; more than one per worker evens out
+# endpoints that generate very different numbers of cases
+CHUNKS_PER_WORKER = 4
+
+_worker_generator = None
+_worker_case_types = CASE_TYPES
+
+def resolve_jobs(jobs: int) -> int:
+    """Translate a --jobs value into a worker count (0 means one per CPU)"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+def chunk_size_for(endpoint_count: int, jobs: int) -> int:
+    """Size chunks so every worker gets several of them regardless of spec size"""
+    return max(1, math.ceil(endpoint_count / (jobs * CHUNKS_PER_WORKER)))
+
+def _init_worker(generator: TestCaseGenerator, case_types: Sequence[str]):
+    global _worker_generator, _worker_case_types
+    _worker_generator = generator
+    _worker_case_types = case_types
+
+def _generate_chunk(endpoints: List[Dict]) -> List[Dict[str, Any]]:
+    cases = []
+    for endpoint in endpoints:
+        cases.extend(_worker_generator.generate_all(endpoint, _worker_case_types))
+    return cases
+
+def generate_parallel(generator: TestCaseGenerator, endpoints: Sequence[Dict], jobs: int = 1,
+                      case_types: Iterable[str] = CASE_TYPES) -> List[Dict[str, Any]]:
+    """Generate cases for endpoints across a process pool and return them as a list"""
+    return list(iter_parallel(generator, endpoints, jobs, case_types))
+
+def iter_parallel(generator: TestCaseGenerator, endpoints: Sequence[Dict], jobs: int = 1,
+                  case_types: Iterable[str] = CASE_TYPES) -> Iterator[Dict[str, Any]]:
+    """Lazily yield cases for endpoints, generated across a process pool.
+
+    Results are merged in endpoint order, so the output is identical to a
+    sequential run no matter how many workers are used. Only a bounded
+    window of chunks is in flight at once, so a slow consumer (e.g. a
+    report writer) keeps memory flat.
+    """
+    case_types = tuple(case_types)
+    jobs = min(resolve_jobs(jobs), len(endpoints))
+    if jobs <= 1:
+        yield from generator.iter_cases(endpoints, case_types)
+        return
+    
+    size = chunk_size_for(len(endpoints), jobs)
+    chunks = (list(endpoints[i:i + size]) for i in range(0, len(endpoints), size))
+    
+    # Workers receive endpoint records directly; don't ship the parser and its raw spec
+    worker_generator = copy.copy(generator)
+    worker_generator.parser = None
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(worker_generator, case_types)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_generate_chunk, chunk))
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
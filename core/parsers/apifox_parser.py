@@ -1,6 +1,6 @@
-import json
 from typing import Dict, Any
 from core.parsers.iapi_parser import IApiParser, ApiDefinition
+from core.parsers.loader import load_json_file, read_spec_head, SpecHead
 
 class ApifoxParser(IApiParser):
     def __init__(self):
@@ -8,14 +8,17 @@ class ApifoxParser(IApiParser):
         
     def can_parse(self, file_path: str) -> bool:
         """Check if file is Apifox format"""
-        return file_path.endswith('.json')
+        return self.sniff(read_spec_head(file_path))
+
+    def sniff(self, head: SpecHead) -> bool:
+        """Apifox exports keep their operations in a top-level `interfaces` list"""
+        return head.format == 'json' and 'interfaces' in head.keys
         
     def parse(self, file_path: str) -> ApiDefinition:
         """Parse Apifox file into standardized ApiDefinition"""
         self.api_def = ApiDefinition()
         
-        with open(file_path, 'r') as f:
-            apifox_data = json.load(f)
+        apifox_data = load_json_file(file_path)
             
         for interface in apifox_data.get('interfaces', []):
             method = interface.get('method', '').upper()
@@ -57,7 +60,8 @@ class ApifoxParser(IApiParser):
                     params['body_params'].append({
                         'name': prop_name,
                         'required': prop_name in schema.get('required', []),
-                        'type': prop_schema.get('type', 'string')
+                        'type': prop_schema.get('type', 'string'),
+                        'schema': prop_schema
                     })
                     
         return params
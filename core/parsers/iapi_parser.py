@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from core.records import Endpoint
 
 class IApiParser(ABC):
     @abstractmethod
@@ -12,19 +13,29 @@ class IApiParser(ABC):
         """Check if this parser can handle the given file"""
         pass
 
+    def sniff(self, head) -> bool:
+        """Check a SpecHead (the first few KB of a file) for this parser's format"""
+        return False
+
 
 class ApiDefinition:
     def __init__(self):
         self.endpoints = []
         self.models = {}
+        # (METHOD, path) -> endpoint, kept in sync by add_endpoint
+        self._index: Dict[Tuple[str, str], Endpoint] = {}
+
+    def add_endpoint(self, method: str, path: str, parameters: Dict, responses: Dict,
+                     metadata: Optional[Dict] = None):
+        # Slotted record with interned strings; endpoint['method'] style reads still work
+        endpoint = Endpoint(method, path, parameters, responses, metadata)
+        self.endpoints.append(endpoint)
+        # First definition wins, matching the order endpoints were declared in
+        self._index.setdefault((method.upper(), path), endpoint)
 
-    def add_endpoint(self, method: str, path: str, parameters: Dict, responses: Dict):
-        self.endpoints.append({
-            'method': method,
-            'path': path,
-            'parameters': parameters,
-            'responses': responses
-        })
+    def get_endpoint(self, method: str, path: str) -> Optional[Endpoint]:
+        """Look up an endpoint by HTTP method and path"""
+        return self._index.get((method.upper(), path))
 
     def add_model(self, name: str, schema: Dict):
         self.models[name] = schema
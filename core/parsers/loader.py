@@ -0,0 +1,92 @@
+import json
+import re
+from typing import Any, Set
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON backend
+    orjson = None
+
+# LibYAML-backed loader when PyYAML was built with it, pure Python otherwise
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+YAML_BACKEND = 'libyaml' if YamlLoader is not yaml.SafeLoader else 'pure-python'
+
+
+def loads_json(data: Any) -> Any:
+    """Decode a JSON document from bytes or str with the fastest available backend"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(file_path: str) -> Any:
+    """Load a JSON file"""
+    with open(file_path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def load_yaml_file(file_path: str) -> Any:
+    """Load a YAML file with the C loader when available"""
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def load_spec_file(file_path: str) -> Any:
+    """Load a YAML or JSON spec based on its file extension"""
+    if file_path.endswith('.yaml') or file_path.endswith('.yml'):
+        return load_yaml_file(file_path)
+    return load_json_file(file_path)
+
+
+# How much of a spec file is read to work out which parser handles it
+SNIFF_BYTES = 8192
+
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:]')
+_YAML_TOP_LEVEL_KEY = re.compile(r'''^(?:"([^"\n]+)"|'([^'\n]+)'|([^\s#:'"\-][^:#\n]*?))\s*:(?:\s|$)''', re.M)
+
+
+class SpecHead:
+    """The first few KB of a spec file plus the top-level keys found in them"""
+
+    def __init__(self, text: str, truncated: bool):
+        self.text = text
+        self.truncated = truncated
+        self.format = 'json' if text.lstrip('\ufeff \t\r\n').startswith('{') else 'yaml'
+        if self.format == 'json':
+            self.keys = _json_top_level_keys(text)
+        else:
+            self.keys = {next(g for g in m.groups() if g) for m in _YAML_TOP_LEVEL_KEY.finditer(text)}
+
+
+def _json_top_level_keys(text: str) -> Set[str]:
+    """Keys of the outermost object, tolerating a document cut off part way through"""
+    keys = set()
+    depth = 0
+    pending = None
+    for match in _JSON_TOKEN.finditer(text):
+        token = match.group()
+        if token == ':':
+            if depth == 1 and pending is not None:
+                keys.add(pending)
+            pending = None
+        elif token in '{[':
+            depth += 1
+            pending = None
+        elif token in '}]':
+            depth -= 1
+            pending = None
+        else:
+            pending = token[1:-1]
+    return keys
+
+
+def read_spec_head(file_path: str, size: int = SNIFF_BYTES) -> SpecHead:
+    """Read just enough of a spec file to sniff its format"""
+    with open(file_path, 'rb') as f:
+        data = f.read(size + 1)
+    truncated = len(data) > size
+    # A multi-byte character split at the cut is simply dropped
+    return SpecHead(data[:size].decode('utf-8', errors='ignore'), truncated)
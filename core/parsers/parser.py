@@ -1,91 +1,153 @@
-import yaml
-import json
-from typing import Dict, Any
+import time
+from typing import Dict, Any, List
 from core.parsers.iapi_parser import IApiParser, ApiDefinition
+from core.parsers.ref_resolver import RefResolver
+from core.parsers.loader import load_spec_file, read_spec_head, SpecHead
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
 
 class SwaggerParser(IApiParser):
     def __init__(self):
         self.spec = None
         self.api_def = None
+        self.resolver = None
+        self.stats = {}
         
     def can_parse(self, file_path: str) -> bool:
         """Check if file is Swagger/OpenAPI format"""
-        return (file_path.endswith('.yaml') or 
-               file_path.endswith('.yml') or
-               file_path.endswith('.json'))
+        return self.sniff(read_spec_head(file_path))
+
+    def sniff(self, head: SpecHead) -> bool:
+        """OpenAPI 3 documents declare `openapi`, Swagger 2 documents `swagger`"""
+        return 'openapi' in head.keys or 'swagger' in head.keys
         
     def parse(self, file_path: str) -> ApiDefinition:
         """Parse Swagger file into standardized ApiDefinition"""
         self.api_def = ApiDefinition()
+        started = time.perf_counter()
         
-        # Load spec
-        with open(file_path, 'r') as f:
-            if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                self.spec = yaml.safe_load(f)
-            else:  # assume JSON
-                self.spec = json.load(f)
+        # Load spec (LibYAML / orjson when available)
+        self.spec = load_spec_file(file_path)
+        loaded = time.perf_counter()
+        self.resolver = RefResolver(self.spec)
         
-        # Parse all paths and methods
-        paths = self.spec.get('paths', {})
+        # Parse all paths and methods in a single walk over the spec
+        paths = self.spec.get('paths', {}) or {}
+        operations = 0
         for path, path_item in paths.items():
-            for method in ['get', 'post', 'put', 'delete', 'patch']:
-                if method in path_item:
-                    parameters = self.parse_parameters(path, method)
-                    responses = self.parse_responses(path, method)
-                    self.api_def.add_endpoint(method.upper(), path, parameters, responses)
+            path_item = self.resolver.resolve(path_item)
+            path_level_params = path_item.get('parameters', [])
+            for method in HTTP_METHODS:
+                method_item = path_item.get(method)
+                if method_item is None:
+                    continue
+                parameters = self._build_parameters(path_level_params, method_item)
+                responses = self._build_responses(method_item)
+                self.api_def.add_endpoint(method.upper(), path, parameters, responses)
+                operations += 1
         
-        # Parse models/schemas
-        schemas = self.spec.get('components', {}).get('schemas', {})
+        # Parse models/schemas (OpenAPI 3 components or Swagger 2 definitions)
+        schemas = dict(self.spec.get('definitions', {}) or {})
+        schemas.update(self.spec.get('components', {}).get('schemas', {}) or {})
         for model_name, schema in schemas.items():
-            self.api_def.add_model(model_name, schema)
-            
+            self.api_def.add_model(model_name, self.resolver.schema(schema))
+        
+        finished = time.perf_counter()
+        self.stats = {
+            'paths': len(paths),
+            'operations': operations,
+            'load_time': loaded - started,
+            'parse_time': finished - loaded,
+            'total_time': finished - started,
+            'resolved_refs': self.resolver.resolved_count,
+            'ref_cycles': sorted(self.resolver.cycles)
+        }
         return self.api_def
     
     def parse_paths(self) -> Dict[str, Dict]:
         """Extract all API paths and their methods"""
-        if not self.spec:
-            self.load_spec()
-        return self.spec.get('paths', {})
+        if self.spec is None:
+            raise ValueError("No spec loaded; call parse() first")
+        return self.spec.get('paths', {}) or {}
     
     def parse_parameters(self, path: str, method: str) -> Dict[str, Any]:
         """Parse parameters for a specific path and method"""
-        path_item = self.parse_paths().get(path, {})
+        path_item = self._resolve(self.parse_paths().get(path, {}))
+        method_item = path_item.get(method.lower(), {})
+        return self._build_parameters(path_item.get('parameters', []), method_item)
+    
+    def parse_responses(self, path: str, method: str) -> Dict[str, Any]:
+        """Parse response definitions for a specific path and method"""
+        path_item = self._resolve(self.parse_paths().get(path, {}))
         method_item = path_item.get(method.lower(), {})
+        return self._build_responses(method_item)
+
+    def _resolve(self, node: Any) -> Any:
+        """Resolve a $ref against the loaded spec, reusing the memoized resolver"""
+        return self._get_resolver().resolve(node)
+
+    def _schema(self, node: Any) -> Dict[str, Any]:
+        """Resolve a schema and flatten any allOf/oneOf/anyOf composition"""
+        return self._get_resolver().schema(node)
+
+    def _get_resolver(self) -> RefResolver:
+        if self.resolver is None or self.resolver.spec is not self.spec:
+            self.resolver = RefResolver(self.spec)
+        return self.resolver
+
+    def _build_responses(self, method_item: Dict) -> Dict[str, Any]:
+        """Resolve response objects that are $ref'd from components/responses"""
+        responses = method_item.get('responses', {}) or {}
+        return {status: self._resolve(response) for status, response in responses.items()}
+
+    def _build_parameters(self, path_level_params: List[Dict], method_item: Dict) -> Dict[str, Any]:
+        """Split path- and operation-level parameters into location buckets in one pass"""
+        buckets = {
+            'path_params': [],
+            'query_params': [],
+            'header_params': [],
+            'body_params': []
+        }
+        
+        # Operation-level parameters override path-level ones with the same name and location
+        merged = {}
+        for param in path_level_params:
+            param = self._resolve(param)
+            merged[(param.get('name'), param.get('in'))] = param
+        for param in method_item.get('parameters', []):
+            param = self._resolve(param)
+            merged[(param.get('name'), param.get('in'))] = param
         
-        parameters = []
-        # Get path-level parameters
-        parameters.extend(path_item.get('parameters', []))
-        # Get method-level parameters
-        parameters.extend(method_item.get('parameters', []))
+        for param in merged.values():
+            bucket = buckets.get(f"{param.get('in')}_params")
+            if bucket is not None and param.get('in') != 'body':
+                if isinstance(param.get('schema'), dict):
+                    schema = self._get_resolver().expand(param['schema'])
+                    if schema is not param['schema']:
+                        param = dict(param, schema=schema)
+                bucket.append(param)
         
         # Handle requestBody parameters
-        body_params = []
         if 'requestBody' in method_item:
-            content = method_item['requestBody'].get('content', {})
+            content = self._resolve(method_item['requestBody']).get('content', {})
             for media_type, media_schema in content.items():
-                if 'schema' in media_schema and 'properties' in media_schema['schema']:
-                    for prop_name, prop_schema in media_schema['schema']['properties'].items():
-                        body_params.append({
+                schema = self._schema(media_schema.get('schema'))
+                if schema and 'properties' in schema:
+                    required = schema.get('required', [])
+                    for prop_name, prop_schema in schema['properties'].items():
+                        prop_schema = self._schema(prop_schema)
+                        buckets['body_params'].append({
                             'name': prop_name,
                             'in': 'body',
-                            'required': prop_name in media_schema['schema'].get('required', []),
+                            'required': prop_name in required,
                             'type': prop_schema.get('type', 'string'),
                             'minimum': prop_schema.get('minimum'),
                             'maximum': prop_schema.get('maximum'),
                             'minLength': prop_schema.get('minLength'),
                             'maxLength': prop_schema.get('maxLength'),
-                            'enum': prop_schema.get('enum')
+                            'enum': prop_schema.get('enum'),
+                            # Full property schema (formats, patterns, nesting) for sample values
+                            'schema': self._get_resolver().expand(prop_schema)
                         })
         
-        return {
-            'path_params': [p for p in parameters if p.get('in') == 'path'],
-            'query_params': [p for p in parameters if p.get('in') == 'query'],
-            'header_params': [p for p in parameters if p.get('in') == 'header'],
-            'body_params': body_params
-        }
-    
-    def parse_responses(self, path: str, method: str) -> Dict[str, Any]:
-        """Parse response definitions for a specific path and method"""
-        path_item = self.parse_paths().get(path, {})
-        method_item = path_item.get(method.lower(), {})
-        return method_item.get('responses', {})
+        return buckets
@@ -1,36 +1,166 @@
 import json
-from typing import Dict, Any
+import re
+import warnings
+from collections import deque
+from typing import Dict, Any, Iterator, List, Tuple, BinaryIO
+from urllib.parse import urlsplit, parse_qsl
 from core.parsers.iapi_parser import IApiParser, ApiDefinition
+from core.parsers.loader import load_json_file, loads_json, read_spec_head, SpecHead
+
+try:
+    import ijson
+except ImportError:  # optional incremental JSON parser
+    ijson = None
+
+# Leading Postman variable such as {{baseUrl}} standing in for scheme and host
+_HOST_VARIABLE = re.compile(r'^\{\{[^}]+\}\}')
+
+# info.schema of a v2.x collection, e.g. https://schema.getpostman.com/json/collection/v2.1.0/collection.json
+_POSTMAN_SCHEMA = re.compile(r'"schema"\s*:\s*"https?://schema\.(?:getpostman|postman)\.com/')
 
 class PostmanParser(IApiParser):
-    def __init__(self):
+    def __init__(self, streaming: bool = False):
         self.api_def = None
+        # Parse the collection incrementally with ijson instead of loading it whole
+        self.streaming = streaming
         
     def can_parse(self, file_path: str) -> bool:
         """Check if file is Postman collection format"""
-        return file_path.endswith('.json')
+        return self.sniff(read_spec_head(file_path))
+
+    def sniff(self, head: SpecHead) -> bool:
+        """Collections name their schema in info.schema and list requests under `item`"""
+        if head.format != 'json' or 'openapi' in head.keys or 'swagger' in head.keys:
+            return False
+        return bool(_POSTMAN_SCHEMA.search(head.text)) or 'item' in head.keys
         
     def parse(self, file_path: str) -> ApiDefinition:
         """Parse Postman collection into standardized ApiDefinition"""
         self.api_def = ApiDefinition()
         
-        with open(file_path, 'r') as f:
-            collection = json.load(f)
-            
-        for item in collection.get('item', []):
+        for item, folders in self._iter_requests(file_path):
             request = item.get('request', {})
+            if isinstance(request, str):
+                # Postman allows a bare URL string as shorthand for a GET request
+                request = {'method': 'GET', 'url': request}
             method = request.get('method', '').upper()
-            url = request.get('url', {})
-            path = '/'.join(url.get('path', []))
+            url = self._normalize_url(request.get('url', {}))
+            path = '/'.join(url['path'])
             
             if method and path:
                 # Parse parameters from request
-                parameters = self._parse_parameters(request)
+                parameters = self._parse_parameters(dict(request, url=url))
                 responses = self._parse_responses(item)
+                metadata = {'name': item.get('name', ''), 'folders': list(folders)}
                 
-                self.api_def.add_endpoint(method, path, parameters, responses)
+                self.api_def.add_endpoint(method, path, parameters, responses, metadata)
                 
         return self.api_def
+
+    def _iter_requests(self, file_path: str) -> Iterator[Tuple[Dict, Tuple[str, ...]]]:
+        """Yield (request item, enclosing folder names) for every request in the collection"""
+        if self.streaming:
+            if ijson is not None:
+                with open(file_path, 'rb') as f:
+                    yield from self._iter_streamed_requests(f)
+                return
+            warnings.warn("ijson is not installed; loading the Postman collection in one piece")
+        
+        collection = load_json_file(file_path)
+        yield from self._walk_items(collection.get('item', []))
+
+    @staticmethod
+    def _walk_items(items: List[Dict]) -> Iterator[Tuple[Dict, Tuple[str, ...]]]:
+        """Depth-first walk over nested folders using an explicit stack, in document order"""
+        stack = [(item, ()) for item in reversed(items)]
+        while stack:
+            item, folders = stack.pop()
+            if 'item' in item:
+                # Folder: descend, remembering where its requests came from
+                sub_folders = folders + (item.get('name', ''),)
+                stack.extend((child, sub_folders) for child in reversed(item['item'] or []))
+            elif 'request' in item:
+                yield item, folders
+
+    @staticmethod
+    def _iter_streamed_requests(stream: BinaryIO) -> Iterator[Tuple[Dict, Tuple[str, ...]]]:
+        """Yield request items from an ijson event stream, one item in memory at a time.
+
+        Each element of an "item" array gets a frame. Scalar and nested values of
+        request items are built with ijson's ObjectBuilder; a frame whose own
+        "item" key is seen becomes a folder, so its children stream through
+        as frames of their own instead of being built in memory.
+
+        JSON key order is not fixed, so a folder's "name" may only arrive
+        after its "item" array. Requests inside a folder whose name is still
+        unknown are held back until the name is seen or the folder closes;
+        requests are always yielded in document order.
+        """
+        frames = []  # [prefix, data, is_folder, closed]
+        pending = deque()  # (request item, enclosing folder frames) awaiting folder names
+        builder = None
+        builder_key = None
+        depth = 0
+        
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                if depth == 0:
+                    frames[-1][1][builder_key] = builder.value
+                    builder = None
+                continue
+            
+            frame = frames[-1] if frames else None
+            if event == 'start_map' and (prefix == 'item.item' or
+                                         (frame and frame[2] and prefix == frame[0] + '.item.item')):
+                frames.append([prefix, {}, False, False])
+            elif frame is None or not prefix.startswith(frame[0]):
+                continue
+            elif event == 'end_map' and prefix == frame[0]:
+                frames.pop()
+                frame[3] = True
+                if not frame[2] and 'request' in frame[1]:
+                    pending.append((frame[1], tuple(f for f in frames if f[2])))
+                while pending and all(f[3] or 'name' in f[1] for f in pending[0][1]):
+                    item, folders = pending.popleft()
+                    yield item, tuple(f[1].get('name', '') for f in folders)
+            elif event == 'map_key' and prefix == frame[0]:
+                builder_key = value
+                if value == 'item':
+                    frame[2] = True
+            elif prefix == f"{frame[0]}.{builder_key}" and builder_key != 'item':
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    depth = 1
+                else:
+                    frame[1][builder_key] = value
+
+    @staticmethod
+    def _normalize_url(url: Any) -> Dict[str, Any]:
+        """Return a url object with 'path' as a list of segments, whatever form it was given in"""
+        if isinstance(url, str):
+            url = {'raw': url}
+        else:
+            url = dict(url or {})
+        
+        path = url.get('path')
+        if path is None and url.get('raw'):
+            raw = _HOST_VARIABLE.sub('', url['raw'].strip())
+            if '://' not in raw and not raw.startswith('/'):
+                raw = 'http://' + raw
+            parts = urlsplit(raw if '://' in raw else 'http://placeholder' + raw)
+            path = parts.path
+            if 'query' not in url and parts.query:
+                url['query'] = [{'key': k, 'value': v} for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+        if isinstance(path, str):
+            path = [segment for segment in path.split('/') if segment]
+        url['path'] = path or []
+        return url
         
     def _parse_parameters(self, request: Dict) -> Dict[str, Any]:
         """Extract parameters from Postman request"""
@@ -42,7 +172,7 @@ class PostmanParser(IApiParser):
         }
         
         # Parse URL path parameters
-        url = request.get('url', {})
+        url = self._normalize_url(request.get('url', {}))
         if 'variable' in url:
             for var in url['variable']:
                 params['path_params'].append({
@@ -72,7 +202,7 @@ class PostmanParser(IApiParser):
         body = request.get('body', {})
         if body.get('mode') == 'raw':
             try:
-                body_json = json.loads(body.get('raw', '{}'))
+                body_json = loads_json(body.get('raw', '{}'))
                 if isinstance(body_json, dict):
                     for key in body_json.keys():
                         params['body_params'].append({
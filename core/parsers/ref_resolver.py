@@ -0,0 +1,146 @@
+from typing import Dict, Any, Set, Tuple
+from urllib.parse import unquote
+
+class RefResolver:
+    """Resolve local JSON references ('#/components/...') inside a loaded spec.
+
+    Targets are memoized by ref pointer, so a component shared by many
+    operations is looked up once. Resolution is shallow: nested refs are
+    only followed when a caller asks for them, and composed schemas
+    (allOf/oneOf/anyOf) are only merged when their properties are needed.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self.cycles: Set[str] = set()
+        self.unresolved: Set[str] = set()
+        self._cache: Dict[str, Any] = {}
+        self._merged: Dict[int, Dict[str, Any]] = {}
+        self._expanded: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._resolving: Set[str] = set()
+        self._merging: Set[int] = set()
+
+    @property
+    def resolved_count(self) -> int:
+        """Number of distinct ref pointers resolved so far"""
+        return len(self._cache)
+
+    def resolve(self, node: Any) -> Any:
+        """Follow a $ref chain until reaching a concrete node"""
+        if not isinstance(node, dict) or '$ref' not in node:
+            return node
+        ref = node['$ref']
+        if ref in self._cache:
+            return self._cache[ref]
+        if ref in self._resolving:
+            # A ref chain that points back at itself has no concrete target
+            self.cycles.add(ref)
+            return {}
+        
+        self._resolving.add(ref)
+        try:
+            target = self.resolve(self._lookup(ref))
+        finally:
+            self._resolving.discard(ref)
+        self._cache[ref] = target
+        return target
+
+    def schema(self, node: Any) -> Dict[str, Any]:
+        """Resolve a schema and flatten allOf/oneOf/anyOf into one object schema"""
+        schema = self.resolve(node)
+        if not isinstance(schema, dict):
+            return {}
+        if not any(key in schema for key in ('allOf', 'oneOf', 'anyOf')):
+            return schema
+        
+        key = id(schema)
+        if key in self._merged:
+            return self._merged[key]
+        if key in self._merging:
+            # allOf member that (indirectly) includes itself
+            if isinstance(node, dict) and '$ref' in node:
+                self.cycles.add(node['$ref'])
+            return {k: v for k, v in schema.items() if k not in ('allOf', 'oneOf', 'anyOf')}
+        
+        self._merging.add(key)
+        try:
+            merged = self._merge(schema)
+        finally:
+            self._merging.discard(key)
+        self._merged[key] = merged
+        return merged
+
+    def expand(self, node: Any, depth: int = 4) -> Dict[str, Any]:
+        """Resolve a schema together with its nested properties and items, down to depth levels.
+
+        Used where a whole value has to be built from the schema (sample
+        payloads). Anything deeper, including recursive schemas, becomes {}.
+        Subschemas without nested refs are returned as-is, not copied.
+        """
+        schema = self.schema(node)
+        if depth <= 0:
+            return {}
+        key = (id(schema), depth)
+        if key not in self._expanded:
+            self._expanded[key] = self._expand(schema, depth)
+        return self._expanded[key]
+
+    def _expand(self, schema: Dict[str, Any], depth: int) -> Dict[str, Any]:
+        expanded = None
+        properties = schema.get('properties')
+        if isinstance(properties, dict):
+            nested = {name: self.expand(prop, depth - 1) for name, prop in properties.items()}
+            if any(nested[name] is not prop for name, prop in properties.items()):
+                expanded = dict(schema, properties=nested)
+        for keyword in ('items', 'additionalProperties'):
+            sub = schema.get(keyword)
+            if isinstance(sub, dict):
+                resolved = self.expand(sub, depth - 1)
+                if resolved is not sub:
+                    expanded = dict(expanded or schema, **{keyword: resolved})
+        return schema if expanded is None else expanded
+
+    def _merge(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine allOf members with the schema's own keywords"""
+        merged = {k: v for k, v in schema.items() if k not in ('allOf', 'oneOf', 'anyOf')}
+        properties = {}
+        required = []
+        
+        parts = [self.schema(member) for member in schema.get('allOf', [])]
+        if not schema.get('properties') and not parts:
+            # oneOf/anyOf: describe the request by its first alternative
+            alternatives = schema.get('oneOf') or schema.get('anyOf') or []
+            if alternatives:
+                parts.append(self.schema(alternatives[0]))
+        
+        for part in parts:
+            properties.update(part.get('properties', {}))
+            required.extend(r for r in part.get('required', []) if r not in required)
+            for keyword, value in part.items():
+                if keyword not in ('properties', 'required'):
+                    merged.setdefault(keyword, value)
+        properties.update(schema.get('properties', {}))
+        required.extend(r for r in schema.get('required', []) if r not in required)
+        
+        if properties:
+            merged['properties'] = properties
+        if required:
+            merged['required'] = required
+        return merged
+
+    def _lookup(self, ref: str) -> Any:
+        """Walk a local JSON pointer through the spec"""
+        if not ref.startswith('#'):
+            self.unresolved.add(ref)
+            return {}
+        node = self.spec
+        for token in ref[1:].split('/')[1:]:
+            token = unquote(token).replace('~1', '/').replace('~0', '~')
+            if isinstance(node, dict) and token in node:
+                node = node[token]
+            elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                node = node[int(token)]
+            else:
+                self.unresolved.add(ref)
+                return {}
+        return node
@@ -0,0 +1,75 @@
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+from core.parsers.iapi_parser import IApiParser
+from core.parsers.parser import SwaggerParser
+from core.parsers.postman_parser import PostmanParser
+from core.parsers.apifox_parser import ApifoxParser
+from core.parsers.loader import read_spec_head, SNIFF_BYTES
+
+# File types worth sniffing when a whole directory is processed
+SPEC_SUFFIXES = ('.json', '.yaml', '.yml')
+
+
+class ParserRegistry:
+    """Choose a parser for a spec file from its content rather than its name.
+
+    Only the first few KB of a file are read for detection. Parsers are
+    registered as instances and asked in registration order, so the same
+    warm instance handles every file of its format in a batch.
+    """
+
+    def __init__(self, sniff_bytes: int = SNIFF_BYTES):
+        self.sniff_bytes = sniff_bytes
+        self._parsers: Dict[str, IApiParser] = {}
+
+    def register(self, name: str, parser: IApiParser):
+        self._parsers[name] = parser
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._parsers)
+
+    def get(self, name: str) -> IApiParser:
+        if name not in self._parsers:
+            raise ValueError(f"Unknown spec format '{name}' (expected one of: {', '.join(self._parsers)})")
+        return self._parsers[name]
+
+    def detect(self, file_path: str) -> Optional[str]:
+        """Name of the first parser that recognises the file, or None"""
+        head = read_spec_head(file_path, self.sniff_bytes)
+        for name, parser in self._parsers.items():
+            if parser.sniff(head):
+                return name
+        return None
+
+    def parser_for(self, file_path: str, fmt: Optional[str] = None) -> IApiParser:
+        """Parser for a file; fmt forces a registered format instead of sniffing"""
+        if fmt:
+            return self.get(fmt)
+        name = self.detect(file_path)
+        if name is None:
+            raise ValueError(f"Could not detect the spec format of {file_path} from its first "
+                             f"{self.sniff_bytes} bytes; pass the format explicitly "
+                             f"({', '.join(self._parsers)})")
+        return self._parsers[name]
+
+    def spec_files(self, directory: str) -> List[str]:
+        """Files in a directory worth sniffing, sorted by name"""
+        return [entry.path for entry in sorted(os.scandir(directory), key=lambda e: e.name)
+                if entry.is_file() and entry.name.endswith(SPEC_SUFFIXES)]
+
+    def iter_specs(self, directory: str) -> Iterator[Tuple[str, IApiParser]]:
+        """Yield (path, parser) for every recognisable spec in a directory, sorted by name"""
+        for path in self.spec_files(directory):
+            name = self.detect(path)
+            if name is not None:
+                yield path, self._parsers[name]
+
+
+def default_registry(streaming: bool = False) -> ParserRegistry:
+    """Registry of the built-in parsers; OpenAPI is checked first since it is the most specific"""
+    registry = ParserRegistry()
+    registry.register('openapi', SwaggerParser())
+    registry.register('apifox', ApifoxParser())
+    registry.register('postman', PostmanParser(streaming=streaming))
+    return registry
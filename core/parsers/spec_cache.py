@@ -0,0 +1,67 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional
+from core.parsers.iapi_parser import IApiParser, ApiDefinition
+
+class SpecCache:
+    """On-disk cache of parsed ApiDefinitions keyed by spec content hash"""
+
+    # Bump whenever ApiDefinition or a parser's output shape changes
+    VERSION = 3
+
+    def __init__(self, cache_dir: str = ".testgen_cache"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file_path: str, parser: IApiParser) -> str:
+        """Hash the spec content together with the parser that reads it"""
+        digest = hashlib.sha256()
+        digest.update(f"{self.VERSION}:{type(parser).__module__}.{type(parser).__name__}\0".encode())
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def parse(self, parser: IApiParser, file_path: str) -> ApiDefinition:
+        """Return the cached definition for file_path, parsing and storing it on a miss"""
+        key = self.key(file_path, parser)
+        entry = self._load(key)
+        if entry is not None:
+            self.hits += 1
+            parser.api_def = entry['api_def']
+            if hasattr(parser, 'stats'):
+                parser.stats = dict(entry.get('stats') or {}, cached=True)
+            return parser.api_def
+        
+        self.misses += 1
+        api_def = parser.parse(file_path)
+        self._store(key, {'api_def': api_def, 'stats': getattr(parser, 'stats', None)})
+        return api_def
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def _load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Missing or stale entry; it is rewritten after the next parse
+            return None
+
+    def _store(self, key: str, entry: dict):
+        # Write to a temp file first so concurrent runs never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
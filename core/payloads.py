@@ -0,0 +1,195 @@
+import hashlib
+import os
+import random
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple
+from core.parsers.loader import load_json_file, load_yaml_file
+
+# Where a payload can be placed, keyed by the generator's parameter buckets
+PARAM_LOCATIONS = {
+    'path_params': 'path',
+    'query_params': 'query',
+    'header_params': 'header',
+    'body_params': 'body'
+}
+LOCATIONS = ('path', 'query', 'header', 'body')
+
+# Any of these statuses would indicate proper handling
+SECURITY_STATUSES = (400, 401, 403, 500)
+
+# Upper bound on security cases per endpoint (0 or None for no limit)
+MAX_SECURITY_CASES = 30
+
+# By default each string parameter gets one SQL injection case, as before the
+# payload engine existed; other categories and further payloads are opt-in
+DEFAULT_CATEGORIES = ('sqli',)
+ALL_CATEGORIES = 'all'
+
+# Payloads sent per (parameter, category) pairing (0 or None for all of them)
+DEFAULT_DEPTH = 1
+
+OVERSIZED_LENGTH = 10000
+
+CORPUS_EXTENSIONS = ('.txt', '.json', '.yaml', '.yml')
+
+
+class PayloadCategory:
+    """A family of attack strings, the locations it targets and what a safe response looks like"""
+    __slots__ = ('name', 'payloads', 'locations', 'status', 'not_contains')
+
+    def __init__(self, name: str, payloads: Sequence[str], locations: Sequence[str] = LOCATIONS,
+                 status: Sequence[int] = SECURITY_STATUSES, not_contains: Sequence[str] = ()):
+        unknown = [location for location in locations if location not in LOCATIONS]
+        if unknown:
+            raise ValueError(f"Unknown payload location for {name}: {', '.join(unknown)}")
+        if not payloads:
+            raise ValueError(f"Payload category {name} has no payloads")
+        self.name = name
+        self.payloads = tuple(str(payload) for payload in payloads)
+        self.locations = frozenset(locations)
+        self.status = tuple(status)
+        self.not_contains = tuple(not_contains)
+
+    def label(self, rank: int) -> str:
+        """Case name fragment for the payload at rank; the first keeps the bare category name"""
+        return self.name if rank == 0 else f"{self.name}{rank + 1}"
+
+    def __repr__(self):
+        return f"PayloadCategory({self.name!r}, {len(self.payloads)} payloads)"
+
+
+BUILTIN_CATEGORIES = (
+    PayloadCategory('sqli', ["admin' OR '1'='1", "1; DROP TABLE users--", "' UNION SELECT NULL--",
+                             "1' AND SLEEP(5)--"],
+                    not_contains=['SQL syntax', 'error in your SQL', 'SQLSTATE', 'ORA-0', 'syntax error at or near']),
+    PayloadCategory('xss', ['<script>alert(1)</script>', '"><img src=x onerror=alert(1)>', '<svg onload=alert(1)>'],
+                    ('query', 'body'),
+                    not_contains=['<script>alert(1)</script>', '<img src=x onerror=alert(1)>', '<svg onload=alert(1)>']),
+    PayloadCategory('path_traversal', ['../../../../etc/passwd', '..\\..\\..\\..\\windows\\win.ini',
+                                       '....//....//....//etc/passwd'],
+                    ('path', 'query'), status=SECURITY_STATUSES + (404,),
+                    not_contains=['root:x:0:0', '[fonts]']),
+    PayloadCategory('ssti', ['{{7*191}}', '${7*191}', '<%= 7*191 %>'], ('query', 'body'), not_contains=['1337']),
+    PayloadCategory('command_injection', ['; cat /etc/passwd', '| id', '$(id)'], ('query', 'body'),
+                    not_contains=['root:x:0:0', 'uid=']),
+    # Raw CRLF cannot be sent inside a header value, so these go where they get URL-encoded
+    PayloadCategory('header_injection', ['\r\nX-Injected: true', '\r\nSet-Cookie: injected=1'], ('path', 'query')),
+    PayloadCategory('oversized', ['A' * OVERSIZED_LENGTH], ('query', 'header', 'body'), status=(400, 413, 414, 431)),
+)
+
+
+def _category_from(name: str, spec: Any) -> PayloadCategory:
+    if isinstance(spec, list):
+        return PayloadCategory(name, spec)
+    if not isinstance(spec, dict) or 'payloads' not in spec:
+        raise ValueError(f"Payload category {name} needs a list of payloads")
+    return PayloadCategory(name, spec['payloads'], spec.get('locations', LOCATIONS),
+                           spec.get('status', SECURITY_STATUSES), spec.get('not_contains', ()))
+
+
+@lru_cache(maxsize=None)
+def _load_corpus_file(file_path: str, mtime: float) -> Tuple[PayloadCategory, ...]:
+    if file_path.endswith('.txt'):
+        with open(file_path, encoding='utf-8') as f:
+            payloads = [line.rstrip('\r\n') for line in f]
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return (PayloadCategory(name, [p for p in payloads if p and not p.startswith('#')]),)
+    data = load_json_file(file_path) if file_path.endswith('.json') else load_yaml_file(file_path)
+    if not isinstance(data, dict):
+        raise ValueError(f"{file_path}: expected a mapping of category name to payloads")
+    return tuple(_category_from(name, spec) for name, spec in data.items())
+
+
+def load_corpus(path: str) -> List[PayloadCategory]:
+    """Payload categories from a corpus file or a directory of them.
+
+    A .txt file is one category named after the file, one payload per line
+    (blank lines and # comments are skipped) aimed at every location. A
+    JSON or YAML file maps category names to a payload list or to a mapping
+    with payloads, locations, status and not_contains. Files are parsed
+    once per process and shared by every engine that loads them.
+    """
+    if os.path.isdir(path):
+        files = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(CORPUS_EXTENSIONS))
+    else:
+        files = [path]
+    categories = []
+    for file_path in files:
+        file_path = os.path.abspath(file_path)
+        categories.extend(_load_corpus_file(file_path, os.path.getmtime(file_path)))
+    return categories
+
+
+class PayloadEngine:
+    """Security payloads by category, matched to parameter locations and sampled to a per-endpoint budget.
+
+    Corpora are loaded once, when the engine is built, and shared by every
+    endpoint. Without explicit categories the engine uses DEFAULT_CATEGORIES
+    plus every corpus category; "all" selects every built-in and corpus
+    category. For an endpoint, each string parameter is paired with every
+    category that targets its location and gets up to depth payloads of
+    it; the first payload of each pairing comes before any second one, so
+    a budget keeps breadth across parameters and categories. When a rank
+    does not fit entirely, the pairings that do are drawn at random, seeded
+    per endpoint so reruns produce the same cases.
+    """
+
+    def __init__(self, categories: Optional[Sequence[str]] = None, corpus: Sequence[str] = (),
+                 max_cases: Optional[int] = MAX_SECURITY_CASES, seed: int = 0,
+                 depth: Optional[int] = DEFAULT_DEPTH):
+        available = {category.name: category for category in BUILTIN_CATEGORIES}
+        from_corpus = []
+        # A corpus category replaces the built-in one of the same name
+        for path in corpus:
+            for category in load_corpus(path):
+                available[category.name] = category
+                if category.name not in from_corpus:
+                    from_corpus.append(category.name)
+        if not categories:
+            categories = list(DEFAULT_CATEGORIES) + [name for name in from_corpus if name not in DEFAULT_CATEGORIES]
+        if list(categories) == [ALL_CATEGORIES]:
+            self.categories = tuple(available.values())
+        else:
+            unknown = [name for name in categories if name not in available]
+            if unknown:
+                raise ValueError(f"Unknown payload category: {', '.join(unknown)} "
+                                 f"(available: {', '.join(available)}, or {ALL_CATEGORIES})")
+            self.categories = tuple(available[name] for name in categories)
+        self.corpus = tuple(corpus)
+        self.max_cases = max_cases or None
+        self.seed = seed
+        self.depth = depth or None
+        self._by_location = {location: tuple(c for c in self.categories if location in c.locations)
+                             for location in LOCATIONS}
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """Settings that change the cases produced; empty for the built-in defaults"""
+        builtin = {category.name: category for category in BUILTIN_CATEGORIES}
+        if (self.categories == tuple(builtin[name] for name in DEFAULT_CATEGORIES)
+                and self.max_cases == MAX_SECURITY_CASES and self.seed == 0 and self.depth == DEFAULT_DEPTH):
+            return {}
+        digest = hashlib.sha1()
+        for category in self.categories:
+            for part in (category.name, *category.payloads, *sorted(category.locations)):
+                digest.update(part.encode('utf-8') + b'\0')
+            digest.update(repr((category.status, category.not_contains)).encode('utf-8'))
+        return {'categories': [c.name for c in self.categories], 'digest': digest.hexdigest(),
+                'max_cases': self.max_cases, 'seed': self.seed, 'depth': self.depth}
+
+    def attacks(self, method: str, path: str,
+                targets: Sequence[Tuple[str, Dict]]) -> Iterator[Tuple[str, Dict, PayloadCategory, int]]:
+        """(bucket, param, category, rank) for each payload to send, given (bucket, param) targets"""
+        pairs = [(bucket, param, category) for bucket, param in targets
+                 for category in self._by_location[PARAM_LOCATIONS[bucket]]]
+        remaining = self.max_cases
+        rank = 0
+        while pairs and (remaining is None or remaining > 0) and (self.depth is None or rank < self.depth):
+            tier = [(bucket, param, category, rank) for bucket, param, category in pairs]
+            if remaining is not None:
+                if len(tier) > remaining:
+                    rng = random.Random(f"{self.seed}:{method}:{path}:{rank}")
+                    tier = [tier[i] for i in sorted(rng.sample(range(len(tier)), remaining))]
+                remaining -= len(tier)
+            yield from tier
+            rank += 1
+            pairs = [pair for pair in pairs if rank < len(pair[2].payloads)]
@@ -0,0 +1,145 @@
+from contextlib import nullcontext
+from typing import Dict, Any, Callable, Optional
+from core.parsers.iapi_parser import IApiParser
+from core.parsers.spec_cache import SpecCache
+from core.generator import TestCaseGenerator, CASE_TYPES, MAX_COMBINATIONS
+from core.samples import SampleEngine
+from core.payloads import PayloadEngine, MAX_SECURITY_CASES, DEFAULT_DEPTH
+from core.profiling import Profiler
+from core.parallel import iter_parallel
+from core.incremental import IncrementalStore
+from core.case_store import open_case_report
+from core.report_generator import ReportGenerator, CaseValidator
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# Options a spec is processed with unless the caller overrides them
+DEFAULT_OPTIONS = {
+    'case_types': CASE_TYPES,
+    'format': None,
+    'stream': False,
+    'cache_dir': None,
+    'jobs': 1,
+    'json_format': 'json',
+    'compact': False,
+    'delta': False,
+    'metadata': None,
+    'html': 'single',
+    'page_size': 500,
+    'samples': 'fixed',
+    'seed': 0,
+    'max_combinations': MAX_COMBINATIONS,
+    'security_categories': (),
+    'payloads': (),
+    'max_security_cases': MAX_SECURITY_CASES,
+    'payload_depth': DEFAULT_DEPTH,
+    'profile': False,
+    'profile_stats': None,
+    'validate': False,
+    'incremental': False
+}
+
+
+def payload_engine(options: Dict[str, Any]) -> PayloadEngine:
+    """Payload engine for the options; corpora are loaded once and shared by every spec"""
+    return PayloadEngine(options['security_categories'], options['payloads'],
+                         options['max_security_cases'], options['seed'], options['payload_depth'])
+
+
+def write_html(report_generator: ReportGenerator, test_cases, options: Dict[str, Any]) -> Optional[str]:
+    """Drain the case stream into the selected HTML report"""
+    if options['html'] == 'paged':
+        return report_generator.generate_paged_html_report(test_cases, page_size=options['page_size'])
+    if options['html'] == 'single':
+        return report_generator.generate_html_report(test_cases)
+    for _ in test_cases:
+        pass
+    return None
+
+
+def generate_for_spec(parser: IApiParser, spec_path: str, output_dir: str, options: Dict[str, Any],
+                      payloads: Optional[PayloadEngine] = None,
+                      log: Optional[Callable[[str], None]] = print) -> Dict[str, Any]:
+    """Parse one spec, generate its cases and write its reports to output_dir.
+
+    Progress goes to log (None for quiet). Returns a summary with the
+    endpoint and case counts and the report paths.
+    """
+    log = log or (lambda message: None)
+    test_generator = TestCaseGenerator(parser, SampleEngine(options['samples'], options['seed']),
+                                       options['max_combinations'], payloads or payload_engine(options))
+    report_generator = ReportGenerator(output_dir)
+
+    profiler = None
+    if options['profile'] or options['profile_stats']:
+        profiler = Profiler(stats_path=options['profile_stats'])
+
+    with profiler.stage('parse') if profiler else nullcontext():
+        if options['cache_dir']:
+            api_def = SpecCache(options['cache_dir']).parse(parser, spec_path)
+        else:
+            api_def = parser.parse(spec_path)
+    stats = getattr(parser, 'stats', None)
+    if stats and stats.get('cached'):
+        log(f"Loaded {stats['operations']} operations from spec cache")
+    elif stats:
+        log(f"Parsed {stats['operations']} operations across {stats['paths']} paths "
+            f"in {stats['total_time']:.3f}s (load {stats['load_time']:.3f}s, walk {stats['parse_time']:.3f}s)")
+
+    endpoints = [e for e in api_def.endpoints if e['method'].lower() in HTTP_METHODS]
+    case_types = tuple(options['case_types'])
+    def generate(selected):
+        if profiler:
+            return profiler.iter_cases(test_generator, selected, options['jobs'], case_types)
+        return iter_parallel(test_generator, selected, options['jobs'], case_types)
+
+    incremental = None
+    if options['incremental']:
+        incremental = IncrementalStore(output_dir, {'generator': test_generator.fingerprint(),
+                                                     'case_types': case_types})
+        test_cases = incremental.iter_cases(endpoints, generate)
+    else:
+        test_cases = generate(endpoints)
+
+    validator = None
+    if options['validate']:
+        validator = CaseValidator()
+        test_cases = validator.tap(test_cases)
+
+    # Cases stream through the JSON writer into the HTML renderer
+    metadata_mode = options['metadata']
+    if (incremental or profiler) and metadata_mode is None and options['json_format'] == 'array':
+        # A bare array has no metadata block, so put the diff/profile in a sidecar
+        metadata_mode = 'sidecar'
+    profile = None
+    with open_case_report(str(output_dir), options['json_format'], options['compact'], metadata_mode,
+                          options['delta']) as json_writer:
+        with profiler.stage('report') if profiler else nullcontext():
+            html_report = write_html(report_generator, json_writer.tap(test_cases), options)
+        extra = {}
+        if incremental:
+            extra['diff'] = incremental.diff
+        if profiler:
+            profile = extra['profile'] = profiler.finish()
+        json_writer.close(extra or None)
+
+    log(f"Generated {json_writer.total_cases} test cases")
+    log(f"JSON report saved to: {json_writer.output_path}")
+    if html_report:
+        log(f"HTML report saved to: {html_report}")
+    if incremental is not None:
+        log(incremental.summary())
+    if profile:
+        log(profiler.summary(profile))
+    if validator is not None:
+        log(f"Schema violations: {len(validator.violations)}")
+        for index, message in validator.violations[:20]:
+            log(f"  case {index}: {message}")
+
+    summary = {'format': type(parser).__name__, 'endpoints': len(endpoints), 'cases': json_writer.total_cases,
+               'json_report': str(json_writer.output_path), 'html_report': html_report}
+    if profile:
+        summary['profile'] = profile
+    if validator is not None:
+        summary['violations'] = len(validator.violations)
+    return summary
@@ -0,0 +1,190 @@
+import cProfile
+import heapq
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence
+from core.generator import TestCaseGenerator, CASE_TYPES
+from core.parallel import iter_parallel, resolve_jobs
+
+# Slowest endpoints listed in the profile
+TOP_ENDPOINTS = 10
+
+
+class Profiler:
+    """Wall time, case counts and peak memory per pipeline stage and per endpoint.
+
+    Stages are timed with stage(). Case generation is lazy and runs while
+    the report writers pull cases, so iter_cases() times it separately
+    (per endpoint and per case type) and that time is taken out of the
+    enclosing stage: the parse, generate and report figures add up to the
+    run time instead of overlapping.
+
+    Peak memory comes from tracemalloc and is only tracked when memory is
+    True, since tracing slows Python allocations down noticeably. Stages
+    report the peak traced total; endpoints report how far it rose above
+    what was allocated when the endpoint started. With
+    stats_path, the whole run is also recorded with cProfile and the
+    pstats file written there by finish().
+    """
+
+    def __init__(self, memory: bool = True, stats_path: Optional[str] = None, top: int = TOP_ENDPOINTS):
+        self.memory = memory
+        self.stats_path = stats_path
+        self.top = top
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.case_types: Dict[str, Dict[str, Any]] = defaultdict(lambda: {'seconds': 0.0, 'cases': 0})
+        self.endpoints: List[tuple] = []
+        self.jobs = 1
+        self.generated = 0
+        self._generate_seconds = 0.0
+        self._open_peaks: List[List[int]] = []
+        self._started = time.perf_counter()
+        self._profile = cProfile.Profile() if stats_path else None
+        self._started_tracing = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self._profile is not None:
+            self._profile.enable()
+
+    def _reset_peak(self) -> int:
+        """Current traced peak, folded into every open stage before resetting it"""
+        if not self.memory:
+            return 0
+        peak = tracemalloc.get_traced_memory()[1]
+        for stage_peak in self._open_peaks:
+            stage_peak[0] = max(stage_peak[0], peak)
+        tracemalloc.reset_peak()
+        return peak
+
+    @contextmanager
+    def stage(self, name: str, **counts: int):
+        """Time a block as one stage; generation pulled inside it is booked to 'generate'"""
+        self._reset_peak()
+        peak = [0]
+        self._open_peaks.append(peak)
+        generated_before = self._generate_seconds
+        started = time.perf_counter()
+        record = dict(counts)
+        try:
+            yield record
+        finally:
+            elapsed = time.perf_counter() - started - (self._generate_seconds - generated_before)
+            self._reset_peak()
+            self._open_peaks.remove(peak)
+            record['seconds'] = round(elapsed, 6)
+            if self.memory:
+                record['peak_memory'] = peak[0]
+            self.stages[name] = record
+
+    def iter_cases(self, generator: TestCaseGenerator, endpoints: Sequence[Dict], jobs: int = 1,
+                   case_types: Iterable[str] = CASE_TYPES) -> Iterator[Any]:
+        """Yield the generator's cases, timing each endpoint and case type as they are produced.
+
+        With several worker processes only the time spent waiting for
+        results is visible here, so per-endpoint figures are not collected.
+        """
+        case_types = tuple(case_types)
+        self.jobs = min(resolve_jobs(jobs), max(1, len(endpoints)))
+        if self.jobs > 1:
+            yield from self._timed(iter_parallel(generator, endpoints, jobs, case_types), None)
+            return
+
+        for endpoint in endpoints:
+            seconds_before = self._generate_seconds
+            cases = 0
+            self._reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0] if self.memory else 0
+            for case_type in case_types:
+                for case in self._timed(generator.iter_all(endpoint, (case_type,)), case_type):
+                    cases += 1
+                    yield case
+            # Memory the endpoint's cases needed on top of what was already allocated
+            growth = max(0, self._reset_peak() - baseline)
+            self.endpoints.append((self._generate_seconds - seconds_before, cases, growth,
+                                   f"{endpoint['method'].upper()} {endpoint['path']}"))
+
+    def _timed(self, cases: Iterable[Any], case_type: Optional[str]) -> Iterator[Any]:
+        """Yield from cases, adding only the time spent producing them to the generate stage"""
+        iterator = iter(cases)
+        totals = self.case_types[case_type] if case_type else None
+        while True:
+            started = time.perf_counter()
+            try:
+                case = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = time.perf_counter() - started
+                self._generate_seconds += elapsed
+                if totals is not None:
+                    totals['seconds'] += elapsed
+            self.generated += 1
+            if totals is not None:
+                totals['cases'] += 1
+            yield case
+
+    def slowest_endpoints(self) -> List[Dict[str, Any]]:
+        slowest = heapq.nlargest(self.top, self.endpoints, key=lambda e: e[0])
+        result = []
+        for seconds, cases, growth, name in slowest:
+            entry = {'endpoint': name, 'seconds': round(seconds, 6), 'cases': cases}
+            if self.memory:
+                entry['peak_memory_growth'] = growth
+            result.append(entry)
+        return result
+
+    def finish(self) -> Dict[str, Any]:
+        """Stop tracing, write pstats if requested and return the profile for report metadata"""
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(self.stats_path)
+            self._profile = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        generate = {'seconds': round(self._generate_seconds, 6), 'cases': self.generated}
+        if self.case_types:
+            generate['by_type'] = {case_type: {'seconds': round(totals['seconds'], 6), 'cases': totals['cases']}
+                                   for case_type, totals in self.case_types.items()}
+        # Generation happens between parsing and writing the reports
+        stages = {name: record for name, record in self.stages.items() if name != 'report'}
+        stages['generate'] = generate
+        if 'report' in self.stages:
+            stages['report'] = self.stages['report']
+        profile = {
+            'total_seconds': round(time.perf_counter() - self._started, 6),
+            'jobs': self.jobs,
+            'stages': stages,
+            'endpoints': len(self.endpoints),
+            'slowest_endpoints': self.slowest_endpoints()
+        }
+        if self.stats_path:
+            profile['pstats'] = self.stats_path
+        return profile
+
+    def summary(self, profile: Dict[str, Any]) -> str:
+        """Human-readable lines for a profile returned by finish()"""
+        lines = [f"Profile ({profile['total_seconds']:.3f}s total, {profile['jobs']} job(s)):"]
+        for name, stage in profile['stages'].items():
+            line = f"  {name:<10} {stage['seconds']:9.3f}s"
+            if 'cases' in stage:
+                line += f"  {stage['cases']} cases"
+            if 'peak_memory' in stage:
+                line += f"  peak {stage['peak_memory'] / 1e6:.1f} MB"
+            lines.append(line)
+            for case_type, totals in stage.get('by_type', {}).items():
+                lines.append(f"    {case_type:<14} {totals['seconds']:9.3f}s  {totals['cases']} cases")
+        if profile['slowest_endpoints']:
+            lines.append("  Slowest endpoints:")
+            for entry in profile['slowest_endpoints']:
+                line = f"    {entry['seconds']:9.3f}s  {entry['cases']:6} cases"
+                if 'peak_memory_growth' in entry:
+                    line += f"  +{entry['peak_memory_growth'] / 1e3:.0f} KB"
+                lines.append(f"{line}  {entry['endpoint']}")
+        if profile.get('pstats'):
+            lines.append(f"  cProfile stats saved to: {profile['pstats']}")
+        return '\n'.join(lines)
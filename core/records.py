@@ -0,0 +1,196 @@
+import sys
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+
+class Record:
+    """Slotted record that also answers dict-style reads.
+
+    Subclasses list their dict keys in FIELDS as (key, slot) pairs. A slot
+    that was never assigned reads as a missing key, which keeps the
+    difference between "absent" and "None" that parsers rely on without
+    spending memory on absent keys. to_dict() produces the plain dict
+    shape used by reports and caches.
+    """
+    __slots__ = ()
+    FIELDS: Tuple[Tuple[str, str], ...] = ()
+    _SLOTS: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._SLOTS = dict(cls.FIELDS)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, self._SLOTS[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        slot = self._SLOTS.get(key)
+        if slot is None:
+            raise KeyError(key)
+        setattr(self, slot, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = self._SLOTS.get(key)
+        return default if slot is None else getattr(self, slot, default)
+
+    def __contains__(self, key: str) -> bool:
+        slot = self._SLOTS.get(key)
+        return slot is not None and hasattr(self, slot)
+
+    def keys(self) -> List[str]:
+        return [key for key, slot in self.FIELDS if hasattr(self, slot)]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, getattr(self, slot)) for key, slot in self.FIELDS if hasattr(self, slot)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Record, dict)):
+            return self.to_dict() == as_dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Parameter(Record):
+    """A request parameter; keys the generator does not model are kept in `extra`"""
+    __slots__ = ('name', 'location', 'required', 'type', 'format', 'minimum', 'maximum',
+                 'minLength', 'maxLength', 'pattern', 'enum', 'example', 'default',
+                 'schema', 'description', 'extra')
+    FIELDS = (('name', 'name'), ('in', 'location'), ('required', 'required'), ('type', 'type'),
+              ('format', 'format'), ('minimum', 'minimum'), ('maximum', 'maximum'),
+              ('minLength', 'minLength'), ('maxLength', 'maxLength'), ('pattern', 'pattern'),
+              ('enum', 'enum'), ('example', 'example'), ('default', 'default'),
+              ('schema', 'schema'), ('description', 'description'))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Parameter':
+        if isinstance(data, Parameter):
+            return data
+        param = cls()
+        slots = cls._SLOTS
+        for key, value in data.items():
+            slot = slots.get(key)
+            if slot is None:
+                if not hasattr(param, 'extra'):
+                    param.extra = {}
+                param.extra[key] = value
+            else:
+                if key == 'name' and isinstance(value, str):
+                    value = sys.intern(value)
+                setattr(param, slot, value)
+        return param
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._SLOTS:
+            return super().__getitem__(key)
+        try:
+            return self.extra[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._SLOTS:
+            super().__setitem__(key, value)
+        else:
+            if not hasattr(self, 'extra'):
+                self.extra = {}
+            self.extra[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._SLOTS:
+            return super().get(key, default)
+        return getattr(self, 'extra', {}).get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._SLOTS:
+            return super().__contains__(key)
+        return key in getattr(self, 'extra', {})
+
+    def keys(self) -> List[str]:
+        return super().keys() + list(getattr(self, 'extra', {}))
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return super().items() + list(getattr(self, 'extra', {}).items())
+
+
+class Endpoint(Record):
+    """One operation of an ApiDefinition; parameters are grouped into location buckets"""
+    __slots__ = ('method', 'path', 'parameters', 'responses', 'metadata')
+    FIELDS = (('method', 'method'), ('path', 'path'), ('parameters', 'parameters'),
+              ('responses', 'responses'), ('metadata', 'metadata'))
+
+    def __init__(self, method: str, path: str, parameters: Dict[str, Iterable[Dict]],
+                 responses: Dict, metadata: Optional[Dict] = None):
+        self.method = sys.intern(method)
+        self.path = sys.intern(path)
+        self.parameters = {bucket: [Parameter.from_dict(p) for p in params]
+                           for bucket, params in parameters.items()}
+        self.responses = responses
+        if metadata:
+            self.metadata = metadata
+
+    def to_dict(self) -> Dict[str, Any]:
+        endpoint = super().to_dict()
+        endpoint['parameters'] = {bucket: [p.to_dict() for p in params]
+                                  for bucket, params in self.parameters.items()}
+        return endpoint
+
+
+class Case(Record):
+    """A generated test case, flattened; to_dict() restores the request/expect nesting"""
+    __slots__ = ('name', 'type', 'method', 'path', 'parameters', 'status', 'not_contains')
+    FIELDS = (('name', 'name'), ('type', 'type'))
+
+    def __init__(self, name: str, case_type: str, method: str, path: str,
+                 parameters: Optional[Dict[str, Any]] = None, status: Any = 200,
+                 not_contains: Optional[List[str]] = None):
+        self.name = name
+        self.type = case_type
+        self.method = method
+        self.path = path
+        self.parameters = {} if parameters is None else parameters
+        self.status = status
+        if not_contains is not None:
+            self.not_contains = not_contains
+
+    def __reduce__(self):
+        # Positional state pickles far smaller than a slot-name dict per case
+        return (Case, (self.name, self.type, self.method, self.path, self.parameters,
+                       self.status, getattr(self, 'not_contains', None)))
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'request':
+            return {'method': self.method, 'path': self.path, 'parameters': self.parameters}
+        if key == 'expect':
+            expect = {'status': self.status}
+            if hasattr(self, 'not_contains'):
+                expect['not_contains'] = self.not_contains
+            return expect
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in ('request', 'expect'):
+            return self[key]
+        return super().get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in ('request', 'expect') or super().__contains__(key)
+
+    def keys(self) -> List[str]:
+        return ['name', 'type', 'request', 'expect']
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(key, self[key]) for key in self.keys()]
+
+
+def as_dict(record: Any) -> Any:
+    """Plain dict form of a record; dicts (e.g. cases read back from a report) pass through"""
+    return record.to_dict() if isinstance(record, Record) else record
@@ -1,14 +1,492 @@
 import json
 import datetime
-from typing import Dict, List
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 import jsonschema
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from core.records import as_dict
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON backend
+    orjson = None
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / 'templates'
+
+JSON_FORMATS = ('json', 'array', 'jsonl')
+METADATA_MODES = ('trailer', 'sidecar', 'none')
+
+CASE_TYPE_NAMES = ["normal", "error", "boundary", "security", "combinatorial"]
+
+CASE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "type": {"enum": CASE_TYPE_NAMES},
+        "request": {
+            "type": "object",
+            "properties": {
+                "method": {"type": "string"},
+                "path": {"type": "string"},
+                "parameters": {"type": "object"}
+            },
+            "required": ["method", "path"]
+        },
+        "expect": {
+            "type": "object",
+            "properties": {
+                "status": {"type": ["number", "array"]},
+                "not_contains": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["status"]
+        }
+    },
+    "required": ["name", "type", "request", "expect"]
+}
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Test Case Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        .case { border: 1px solid #ddd; padding: 10px; margin-bottom: 10px; }
+        .normal { background-color: #e6f7ff; }
+        .error { background-color: #fff2e6; }
+        .boundary { background-color: #f6ffed; }
+        .security { background-color: #fff0f6; }
+        .combinatorial { background-color: #f9f0ff; }
+    </style>
+</head>
+<body>
+    <h1>Test Case Report</h1>
+    <p>Generated at: {{ generated_at }}</p>
+
+    {% for case in test_cases %}
+    <div class="case {{ case.type }}">
+        <h3>{{ case.name }}</h3>
+        <p><strong>Type:</strong> {{ case.type }}</p>
+        <p><strong>Request:</strong> {{ case.request.method }} {{ case.request.path }}</p>
+        <p><strong>Parameters:</strong> {{ case.request.parameters }}</p>
+        <p><strong>Expected:</strong> Status {{ case.expect.status }}</p>
+    </div>
+    {% endfor %}
+
+    <footer>
+        <p>Total cases: {{ test_cases.count }}</p>
+    </footer>
+</body>
+</html>
+"""
+
+@lru_cache(maxsize=None)
+def compile_template(source: str) -> Template:
+    """Compile a template string once per process"""
+    # Case values include attack payloads such as <script>, so HTML output is always escaped
+    return Template(source, autoescape=True)
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """Shared environment for the files in templates/, escaping .html output"""
+    # Environment keeps compiled templates cached across reports
+    return Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)),
+                       autoescape=select_autoescape(['html']))
+
+@lru_cache(maxsize=None)
+def _compile_case_validator():
+    # check_schema runs once here instead of on every jsonschema.validate() call
+    validator_cls = jsonschema.validators.validator_for(CASE_SCHEMA)
+    validator_cls.check_schema(CASE_SCHEMA)
+    return validator_cls(CASE_SCHEMA)
+
+def encode_compact(obj: Any) -> bytes:
+    """Encode a value as compact JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects non-str keys and ints wider than 64 bits, which json accepts
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _encode_pretty(obj: Any, indent: str) -> bytes:
+    # Same bytes json.dump(..., indent=2) produces for the value nested at this depth
+    text = json.dumps(obj, indent=2)
+    return text.replace('\n', '\n' + indent).encode('utf-8')
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _case_shape_ok(case: Any) -> bool:
+    """Hand-written equivalent of CASE_SCHEMA for the fixed case shape"""
+    if not isinstance(case, dict):
+        return False
+    request = case.get('request')
+    expect = case.get('expect')
+    if not (isinstance(case.get('name'), str) and case.get('type') in CASE_TYPE_NAMES
+            and isinstance(request, dict) and isinstance(expect, dict)):
+        return False
+    if not (isinstance(request.get('method'), str) and isinstance(request.get('path'), str)):
+        return False
+    if 'parameters' in request and not isinstance(request['parameters'], dict):
+        return False
+    status = expect.get('status')
+    if not (_is_number(status) or isinstance(status, list)):
+        return False
+    if 'not_contains' in expect:
+        not_contains = expect['not_contains']
+        if not (isinstance(not_contains, list) and all(isinstance(v, str) for v in not_contains)):
+            return False
+    return True
+
+
+class CaseValidator:
+    """Validate test cases against CASE_SCHEMA with a validator compiled once.
+
+    With fast=True a structural check handles well-formed cases and the
+    jsonschema validator only runs to describe cases that fail it.
+    Violations are collected as (case index, message) pairs; use tap() to
+    validate inline while cases stream to a writer.
+    """
+
+    def __init__(self, fast: bool = True):
+        self.fast = fast
+        self.violations: List[Tuple[int, str]] = []
+        self.checked = 0
+        self._validator = _compile_case_validator()
+
+    @property
+    def valid(self) -> bool:
+        return not self.violations
+
+    def check(self, case: Dict[str, Any]) -> List[str]:
+        """Validate the next case in the stream and return its error messages"""
+        index = self.checked
+        self.checked += 1
+        case = as_dict(case)
+        if self.fast and _case_shape_ok(case):
+            return []
+        
+        messages = []
+        for error in self._validator.iter_errors(case):
+            location = '/'.join(str(part) for part in error.absolute_path)
+            messages.append(f"{location}: {error.message}" if location else error.message)
+        self.violations.extend((index, message) for message in messages)
+        return messages
+
+    def validate(self, cases: Iterable[Dict[str, Any]]) -> List[Tuple[int, str]]:
+        """Validate every case and return all violations found so far"""
+        for case in cases:
+            self.check(case)
+        return self.violations
+
+    def tap(self, cases: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Validate each case as it passes through to the next consumer"""
+        for case in cases:
+            self.check(case)
+            yield case
+
+
+class CountingIterator:
+    """Iterator wrapper that counts the items consumed so far"""
+
+    def __init__(self, iterable: Iterable):
+        self._iterator = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._iterator)
+        self.count += 1
+        return item
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    # 1 == True in Python, but not in the JSON a report carries
+    return type(a) is type(b) and a == b
+
+
+class DeltaEncoder:
+    """Rewrite cases as parameter deltas from their endpoint's normal case.
+
+    Variants share almost every parameter with the normal case, so only
+    the differences are kept: request.delta holds the base case name, the
+    parameters that are set or changed and those that are absent. Cases of
+    an endpoint arrive together, so only the latest normal case is kept.
+    A case without a preceding normal case, or one whose delta would not be
+    smaller than its parameters, is written in full.
+    """
+
+    def __init__(self):
+        self._base = None
+
+    def encode(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        request = case['request']
+        endpoint = (request['method'], request['path'])
+        if case['type'] == 'normal':
+            self._base = (endpoint, case['name'], request['parameters'])
+            return case
+        if self._base is None or self._base[0] != endpoint:
+            return case
+
+        _, base_name, base_params = self._base
+        params = request['parameters']
+        changed = {k: v for k, v in params.items()
+                   if k not in base_params or not _same_value(base_params[k], v)}
+        unset = [k for k in base_params if k not in params]
+        if len(changed) + len(unset) >= len(params):
+            # Small parameter sets are shorter written out in full
+            return case
+        delta = {'base': base_name, 'set': changed, 'unset': unset}
+        if list(params) != [k for k in base_params if k in params] + [k for k in params if k not in base_params]:
+            # Key order differs from what expand_deltas would rebuild, keep it explicitly
+            delta['order'] = list(params)
+        return {
+            'name': case['name'],
+            'type': case['type'],
+            'request': {'method': request['method'], 'path': request['path'], 'delta': delta},
+            'expect': case['expect']
+        }
+
+
+def expand_deltas(cases: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Restore full cases from a report written with delta=True; full cases pass through"""
+    bases = {}
+    for case in cases:
+        request = case.get('request', {})
+        delta = request.get('delta')
+        if delta is None:
+            if case.get('type') == 'normal':
+                bases = {case['name']: request.get('parameters', {})}
+            yield case
+            continue
+        base = bases[delta['base']]
+        params = {k: v for k, v in base.items() if k not in delta['unset']}
+        params.update(delta['set'])
+        if 'order' in delta:
+            params = {k: params[k] for k in delta['order']}
+        request = {'method': request['method'], 'path': request['path'], 'parameters': params}
+        yield dict(case, request=request)
+
+
+class JsonReportWriter:
+    """Stream test cases to a JSON report one at a time.
+
+    Formats:
+      json  - {"test_cases": [...], "metadata": {...}} with metadata written last
+      array - a bare list of cases
+      jsonl - one case per line
+
+    metadata_mode controls where metadata such as total_cases goes: at the
+    end of the file ("trailer"), into a "<file>.meta.json" sidecar, or
+    nowhere. Only the case being written is ever held in memory. With
+    delta=True non-normal cases are stored as differences from their
+    endpoint's normal case (see DeltaEncoder); expand_deltas reverses it.
+    """
+
+    def __init__(self, output_path: str, fmt: str = 'json', compact: bool = False,
+                 metadata_mode: Optional[str] = None, metadata: Optional[Dict] = None,
+                 delta: bool = False):
+        if fmt not in JSON_FORMATS:
+            raise ValueError(f"Unknown JSON report format: {fmt}")
+        if metadata_mode is None:
+            metadata_mode = 'trailer' if fmt == 'json' else 'sidecar'
+        if metadata_mode not in METADATA_MODES:
+            raise ValueError(f"Unknown metadata mode: {metadata_mode}")
+        if fmt == 'array' and metadata_mode == 'trailer':
+            raise ValueError("A bare case array has no room for a metadata trailer")
+        
+        self.output_path = Path(output_path)
+        self.fmt = fmt
+        self.compact = compact
+        self.metadata_mode = metadata_mode
+        self.metadata = {
+            "version": "1.0",
+            "generated_at": datetime.datetime.now().isoformat()
+        }
+        if delta:
+            self.metadata['delta'] = True
+        self.metadata.update(metadata or {})
+        self._delta = DeltaEncoder() if delta else None
+        self.total_cases = 0
+        self._file = open(self.output_path, 'wb', buffering=1 << 20)
+
+    def write(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a single case to the report and return it in dict form"""
+        # Case records become plain dicts here, at the report boundary
+        case = as_dict(case)
+        stored = self._delta.encode(case) if self._delta is not None else case
+        if self.fmt == 'jsonl':
+            self._file.write(encode_compact(stored) + b'\n')
+        else:
+            if self.total_cases:
+                self._file.write(b',' if self.compact else b',\n')
+            else:
+                self._file.write(self._open_bytes())
+            if self.compact:
+                self._file.write(encode_compact(stored))
+            else:
+                indent = '  ' if self.fmt == 'array' else '    '
+                self._file.write(indent.encode() + _encode_pretty(stored, indent))
+        self.total_cases += 1
+        return case
+
+    def write_all(self, cases: Iterable[Dict[str, Any]]):
+        for case in cases:
+            self.write(case)
+
+    def tap(self, cases: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Write each case as it passes through, so another consumer can share the stream"""
+        for case in cases:
+            yield self.write(case)
+
+    def close(self, metadata: Optional[Dict] = None) -> str:
+        """Finish the report, writing metadata (plus any extra keys) where configured"""
+        if self._file.closed:
+            return str(self.output_path)
+        self.metadata.update(metadata or {})
+        self.metadata['total_cases'] = self.total_cases
+        
+        self._file.write(self._close_bytes())
+        self._file.close()
+        if self.metadata_mode == 'sidecar':
+            sidecar = self.output_path.with_name(self.output_path.name + '.meta.json')
+            with open(sidecar, 'w') as f:
+                json.dump(self.metadata, f, indent=None if self.compact else 2)
+        return str(self.output_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _open_bytes(self) -> bytes:
+        if self.fmt == 'array':
+            return b'[' if self.compact else b'[\n'
+        return b'{"test_cases":[' if self.compact else b'{\n  "test_cases": [\n'
+
+    def _close_bytes(self) -> bytes:
+        trailer = self.metadata_mode == 'trailer'
+        if self.fmt == 'jsonl':
+            return encode_compact({"metadata": self.metadata}) + b'\n' if trailer else b''
+        
+        if self.fmt == 'array':
+            if not self.total_cases:
+                return b'[]'
+            return b']' if self.compact else b'\n]'
+        
+        if self.compact:
+            tail = b']' if self.total_cases else b'{"test_cases":[]'
+            if trailer:
+                tail += b',"metadata":' + encode_compact(self.metadata)
+            return tail + b'}'
+        tail = b'\n  ]' if self.total_cases else b'{\n  "test_cases": []'
+        if trailer:
+            tail += b',\n  "metadata": ' + _encode_pretty(self.metadata, '  ')
+        return tail + b'\n}'
+
+
+class PagedHtmlReportWriter:
+    """Stream test cases into a paged HTML report.
+
+    Cases are written to "shards/shard-NNNNN.js" files of page_size cases
+    as they arrive; index.html only carries per-endpoint and per-type
+    counts plus a small summary of each shard, and loads shards on demand
+    when the reader pages or filters. Only one page of cases is held in
+    memory at a time.
+    """
+
+    def __init__(self, output_dir: str, page_size: int = 500):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.output_dir = Path(output_dir)
+        self.shard_dir = self.output_dir / 'shards'
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.shard_dir.glob('shard-*.js'):
+            stale.unlink()
+        
+        self.page_size = page_size
+        self.total_cases = 0
+        self.type_counts = Counter()
+        self.endpoint_counts: Dict[str, Counter] = {}
+        self.shards: List[Dict[str, Any]] = []
+        self._page: List[Dict[str, Any]] = []
+
+    def write(self, case: Dict[str, Any]):
+        """Add a case to the current page, flushing the page once it is full"""
+        case = as_dict(case)
+        endpoint = f"{case['request']['method']} {case['request']['path']}"
+        self.type_counts[case['type']] += 1
+        self.endpoint_counts.setdefault(endpoint, Counter())[case['type']] += 1
+        self.total_cases += 1
+        self._page.append(case)
+        if len(self._page) >= self.page_size:
+            self._flush()
+
+    def write_all(self, cases: Iterable[Dict[str, Any]]):
+        for case in cases:
+            self.write(case)
+
+    def close(self) -> str:
+        """Flush the last page and render index.html"""
+        self._flush()
+        template = get_environment().get_template('paged_report.html')
+        chunks = template.generate(
+            generated_at=datetime.datetime.now().isoformat(),
+            total_cases=self.total_cases,
+            type_counts=sorted(self.type_counts.items()),
+            endpoint_counts=[(endpoint, dict(counts)) for endpoint, counts in self.endpoint_counts.items()],
+            shards=self.shards
+        )
+        
+        index_path = self.output_dir / 'index.html'
+        with open(index_path, 'w') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return str(index_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def _flush(self):
+        if not self._page:
+            return
+        index = len(self.shards)
+        filename = f"shard-{index + 1:05d}.js"
+        with open(self.shard_dir / filename, 'wb') as f:
+            f.write(f"window.__reportShard({index}, ".encode())
+            f.write(encode_compact(self._page))
+            f.write(b");\n")
+        
+        types = Counter(case['type'] for case in self._page)
+        endpoints = Counter(f"{case['request']['method']} {case['request']['path']}" for case in self._page)
+        self.shards.append({
+            'file': f"shards/{filename}",
+            'count': len(self._page),
+            'types': dict(types),
+            'endpoints': dict(endpoints)
+        })
+        self._page = []
+
 
 class ReportGenerator:
     def __init__(self, output_dir: str = "output"):
         self.output_dir = output_dir
-        Path(self.output_dir).mkdir(exist_ok=True)
+        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
         
     def generate_json_report(self, test_cases: List[Dict], filename: str = "test_cases.json") -> str:
         """Generate JSON report from test cases"""
@@ -18,7 +496,7 @@ class ReportGenerator:
                 "generated_at": datetime.datetime.now().isoformat(),
                 "total_cases": len(test_cases)
             },
-            "test_cases": test_cases
+            "test_cases": [as_dict(case) for case in test_cases]
         }
         
         output_path = Path(self.output_dir) / filename
@@ -26,86 +504,47 @@ class ReportGenerator:
             json.dump(report, f, indent=2)
         
         return str(output_path)
+
+    def generate_json_stream(self, test_cases: Iterable[Dict], filename: str = "test_cases.json",
+                             fmt: str = 'json', compact: bool = False,
+                             metadata_mode: Optional[str] = None,
+                             metadata: Optional[Dict] = None, delta: bool = False) -> str:
+        """Write a JSON report from an iterable of cases without materializing it"""
+        output_path = Path(self.output_dir) / filename
+        with JsonReportWriter(str(output_path), fmt=fmt, compact=compact,
+                              metadata_mode=metadata_mode, metadata=metadata, delta=delta) as writer:
+            writer.write_all(test_cases)
+        return str(output_path)
     
-    def validate_schema(self, test_cases: List[Dict]) -> bool:
+    def validate_schema(self, test_cases: Iterable[Dict]) -> bool:
         """Validate test cases against JSON Schema"""
-        schema = {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string"},
-                "type": {"enum": ["normal", "error", "boundary", "security"]},
-                "request": {
-                    "type": "object",
-                    "properties": {
-                        "method": {"type": "string"},
-                        "path": {"type": "string"},
-                        "parameters": {"type": "object"}
-                    },
-                    "required": ["method", "path"]
-                },
-                "expect": {
-                    "type": "object",
-                    "properties": {
-                        "status": {"type": ["number", "array"]},
-                        "not_contains": {"type": "array", "items": {"type": "string"}}
-                    },
-                    "required": ["status"]
-                }
-            },
-            "required": ["name", "type", "request", "expect"]
-        }
-        
-        for case in test_cases:
-            try:
-                jsonschema.validate(instance=case, schema=schema)
-            except jsonschema.ValidationError:
-                return False
-        return True
-
-    def generate_html_report(self, test_cases: List[Dict], filename: str = "report.html") -> str:
-        """Generate HTML report from test cases"""
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Test Case Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                h1 { color: #333; }
-                .case { border: 1px solid #ddd; padding: 10px; margin-bottom: 10px; }
-                .normal { background-color: #e6f7ff; }
-                .error { background-color: #fff2e6; }
-                .boundary { background-color: #f6ffed; }
-                .security { background-color: #fff0f6; }
-            </style>
-        </head>
-        <body>
-            <h1>Test Case Report</h1>
-            <p>Generated at: {{ generated_at }}</p>
-            <p>Total cases: {{ total_cases }}</p>
-            
-            {% for case in test_cases %}
-            <div class="case {{ case.type }}">
-                <h3>{{ case.name }}</h3>
-                <p><strong>Type:</strong> {{ case.type }}</p>
-                <p><strong>Request:</strong> {{ case.request.method }} {{ case.request.path }}</p>
-                <p><strong>Parameters:</strong> {{ case.request.parameters }}</p>
-                <p><strong>Expected:</strong> Status {{ case.expect.status }}</p>
-            </div>
-            {% endfor %}
-        </body>
-        </html>
-        """
-        
-        template = Template(html_template)
-        html_content = template.render(
+        validator = CaseValidator(fast=True)
+        return all(not validator.check(case) for case in test_cases)
+
+    def validate_cases(self, test_cases: Iterable[Dict], fast: bool = True) -> List[Tuple[int, str]]:
+        """Return every schema violation as (case index, message)"""
+        return CaseValidator(fast=fast).validate(test_cases)
+
+    def generate_html_report(self, test_cases: Iterable[Dict], filename: str = "report.html") -> str:
+        """Generate HTML report from test cases, rendering them as they are consumed"""
+        template = compile_template(HTML_TEMPLATE)
+        # Total is only known once the loop has consumed every case, so the
+        # template renders it in a footer after the cases
+        chunks = template.generate(
             generated_at=datetime.datetime.now().isoformat(),
-            total_cases=len(test_cases),
-            test_cases=test_cases
+            test_cases=CountingIterator(map(as_dict, test_cases))
         )
         
         output_path = Path(self.output_dir) / filename
         with open(output_path, 'w') as f:
-            f.write(html_content)
+            for chunk in chunks:
+                f.write(chunk)
         
         return str(output_path)
+
+    def generate_paged_html_report(self, test_cases: Iterable[Dict], dirname: str = "report",
+                                   page_size: int = 500) -> str:
+        """Generate a paged HTML report whose case pages load on demand"""
+        with PagedHtmlReportWriter(str(Path(self.output_dir) / dirname), page_size) as writer:
+            writer.write_all(test_cases)
+        return str(writer.output_dir / 'index.html')
@@ -0,0 +1,96 @@
+from typing import Dict, List, Any, Optional, Union
+
+# What a case expects when the spec declares nothing more specific
+DEFAULT_SUCCESS_STATUS = 200
+DEFAULT_CLIENT_ERROR_STATUS = 400
+
+# Declared statuses that mean "the request was invalid"
+CLIENT_ERROR_STATUSES = (400, 422)
+
+# Keywords whose values are literal data, not schemas
+_LITERAL_KEYWORDS = ('example', 'examples', 'enum', 'const', 'default')
+
+# Keywords mapping names to schemas
+_SCHEMA_MAPS = ('properties', 'patternProperties', 'definitions', '$defs')
+
+
+def _normalized(responses: Optional[Dict]) -> Dict[str, Any]:
+    # YAML reads an unquoted 200 as an int, and OpenAPI allows range keys such as 2XX
+    return {str(key).upper(): value for key, value in (responses or {}).items()}
+
+
+def declared_statuses(responses: Optional[Dict]) -> List[int]:
+    """Explicit status codes an operation declares, in ascending order"""
+    return sorted(int(key) for key in _normalized(responses) if key.isdigit())
+
+
+def _expected(codes: List[int], default: int) -> Union[int, List[int]]:
+    if not codes:
+        return default
+    return codes[0] if len(codes) == 1 else codes
+
+
+def success_status(responses: Optional[Dict]) -> Union[int, List[int]]:
+    """Expected status of a valid request: the declared 2xx codes, else 200"""
+    return _expected([code for code in declared_statuses(responses) if 200 <= code < 300],
+                     DEFAULT_SUCCESS_STATUS)
+
+
+def client_error_status(responses: Optional[Dict]) -> Union[int, List[int]]:
+    """Expected status of an invalid request: the declared 400/422 codes, else 400"""
+    return _expected([code for code in declared_statuses(responses) if code in CLIENT_ERROR_STATUSES],
+                     DEFAULT_CLIENT_ERROR_STATUS)
+
+
+def declared_response(responses: Optional[Dict], status: int) -> Optional[Any]:
+    """Response object declared for a status: the exact code, then its range (2XX), then default"""
+    responses = _normalized(responses)
+    for key in (str(status), f"{str(status)[0]}XX", 'DEFAULT'):
+        if key in responses:
+            return responses[key] or {}
+    return None
+
+
+def response_schema(responses: Optional[Dict], status: int) -> Optional[Dict[str, Any]]:
+    """Body schema declared for a status: the exact code, then its range (2XX), then default"""
+    response = declared_response(responses, status)
+    if not isinstance(response, dict):
+        return None
+    content = response.get('content') or {}
+    if isinstance(content, dict):
+        for content_type, media in content.items():
+            if 'json' in content_type and isinstance(media, dict) and isinstance(media.get('schema'), dict):
+                return media['schema']
+    # Swagger 2 puts the schema on the response itself
+    schema = response.get('schema')
+    return schema if isinstance(schema, dict) else None
+
+
+def to_json_schema(schema: Any, models: Dict[str, Any]) -> Any:
+    """Rewrite an OpenAPI schema as plain JSON Schema.
+
+    $refs to components/schemas or definitions point at a local
+    definitions block that holds the parsed models; refs to unknown models
+    accept anything. OpenAPI 3.0 nullable becomes a null type.
+    """
+    if isinstance(schema, list):
+        return [to_json_schema(item, models) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    if '$ref' in schema:
+        name = str(schema['$ref']).rsplit('/', 1)[-1]
+        return {'$ref': f"#/definitions/{name.replace('~', '~0')}"} if name in models else {}
+    converted = {}
+    for key, value in schema.items():
+        if key in _LITERAL_KEYWORDS:
+            converted[key] = value
+        elif key in _SCHEMA_MAPS and isinstance(value, dict):
+            converted[key] = {name: to_json_schema(sub, models) for name, sub in value.items()}
+        else:
+            converted[key] = to_json_schema(value, models)
+    if converted.pop('nullable', False) is True:
+        if isinstance(converted.get('type'), str):
+            converted['type'] = [converted['type'], 'null']
+        if isinstance(converted.get('enum'), list) and None not in converted['enum']:
+            converted['enum'] = converted['enum'] + [None]
+    return converted
@@ -0,0 +1,379 @@
+import base64
+import datetime
+import random
+import string
+import uuid
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants  # Python 3.11+
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+SAMPLE_MODES = ('fixed', 'schema', 'random')
+
+# What the generator has always used for a parameter without an example
+FIXED_SAMPLES = {'integer': 123, 'boolean': True, 'number': 1.23}
+FIXED_STRING = "sample_value"
+
+# Parameter keywords that describe its value, layered under the parameter's own schema
+SCHEMA_KEYWORDS = ('type', 'format', 'pattern', 'enum', 'minimum', 'maximum', 'exclusiveMinimum',
+                   'exclusiveMaximum', 'multipleOf', 'minLength', 'maxLength', 'items',
+                   'minItems', 'maxItems', 'default')
+
+# Deterministic values for string formats; random mode draws its own
+FORMAT_SAMPLES = {
+    'date-time': '2024-01-01T00:00:00Z',
+    'date': '2024-01-01',
+    'time': '00:00:00Z',
+    'uuid': '3fa85f64-5717-4562-b3fc-2c963f66afa6',
+    'email': 'user@example.com',
+    'uri': 'https://example.com/resource',
+    'url': 'https://example.com/resource',
+    'hostname': 'example.com',
+    'ipv4': '192.0.2.1',
+    'ipv6': '2001:db8::1',
+    'byte': base64.b64encode(b'sample').decode('ascii'),
+    'binary': 'sample',
+    'password': 'Passw0rd!'
+}
+
+# Upper bounds for open-ended sizes in random mode
+RANDOM_STRING_SPAN = 16
+RANDOM_ITEMS_SPAN = 3
+REGEX_REPEAT_SPAN = 8
+RANDOM_NUMBER_SPAN = 1000
+
+_EPOCH = datetime.datetime(2020, 1, 1)
+_FIVE_YEARS = 5 * 365 * 24 * 3600
+_ALNUM = string.ascii_letters + string.digits
+_PRINTABLE = string.ascii_letters + string.digits + string.punctuation + ' '
+
+_CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: string.digits,
+    sre_constants.CATEGORY_NOT_DIGIT: string.ascii_letters + string.punctuation + ' ',
+    sre_constants.CATEGORY_SPACE: ' ',
+    sre_constants.CATEGORY_NOT_SPACE: string.ascii_letters + string.digits + string.punctuation,
+    sre_constants.CATEGORY_WORD: string.ascii_letters + string.digits + '_',
+    sre_constants.CATEGORY_NOT_WORD: string.punctuation.replace('_', '') + ' ',
+}
+
+Generator = Callable[[Optional[random.Random]], Any]
+
+
+def _const(value: Any) -> Generator:
+    return lambda rng: value
+
+
+class SampleEngine:
+    """Build sample parameter values from parameter schemas.
+
+    Modes:
+      fixed  - the example, else one constant per type (123, True, 1.23, "sample_value")
+      schema - deterministic values honouring enum, format, pattern, bounds and nesting
+      random - like schema, but drawn from a Random the caller passes in
+
+    Each parameter is compiled once into a generator function, cached by
+    identity, so a schema is interpreted once however many cases use it.
+    Random mode is reproducible: rng() derives a Random from the seed and a
+    scope such as (method, path, location), so values do not depend on how
+    endpoints are split across worker processes.
+    """
+
+    def __init__(self, mode: str = 'fixed', seed: Optional[int] = None):
+        if mode not in SAMPLE_MODES:
+            raise ValueError(f"Unknown sample mode: {mode}")
+        self.mode = mode
+        self.seed = 0 if seed is None else seed
+        self._compiled: Dict[int, Tuple[Any, Generator]] = {}
+
+    def __getstate__(self):
+        # Compiled closures cannot be pickled; workers recompile on demand
+        state = dict(self.__dict__)
+        state['_compiled'] = {}
+        return state
+
+    def fingerprint(self) -> Dict[str, Any]:
+        """Settings that change the values produced"""
+        if self.mode == 'random':
+            return {'mode': self.mode, 'seed': self.seed}
+        return {'mode': self.mode}
+
+    def rng(self, *scope: Any) -> Optional[random.Random]:
+        """Random source for a scope; None unless in random mode"""
+        if self.mode != 'random':
+            return None
+        return random.Random(':'.join(str(part) for part in (self.seed,) + scope))
+
+    def value(self, param: Dict[str, Any], rng: Optional[random.Random] = None) -> Any:
+        """Sample value for a parameter record or dict"""
+        entry = self._compiled.get(id(param))
+        if entry is None or entry[0] is not param:
+            # Keep the parameter alive alongside its function so its id is not reused
+            entry = (param, self.compile_parameter(param))
+            self._compiled[id(param)] = entry
+        return entry[1](rng)
+
+    def compile_parameter(self, param: Dict[str, Any]) -> Generator:
+        if 'example' in param:
+            return _const(param['example'])
+        if self.mode == 'fixed':
+            return _const(FIXED_SAMPLES.get(param.get('type', 'string'), FIXED_STRING))
+        return self.compile(self._effective_schema(param))
+
+    @staticmethod
+    def _effective_schema(param: Dict[str, Any]) -> Dict[str, Any]:
+        """The parameter's schema, with its own keywords filling any gaps"""
+        schema = param.get('schema')
+        merged = dict(schema) if isinstance(schema, dict) else {}
+        for keyword in SCHEMA_KEYWORDS:
+            value = param.get(keyword)
+            if value is not None:
+                merged.setdefault(keyword, value)
+        return merged
+
+    def compile(self, schema: Dict[str, Any]) -> Generator:
+        """Compile a JSON schema into a function of rng returning a sample value"""
+        if not isinstance(schema, dict):
+            return _const(None)
+        if 'example' in schema:
+            return _const(schema['example'])
+        if 'const' in schema:
+            return _const(schema['const'])
+        if schema.get('enum'):
+            values = list(schema['enum'])
+            if self.mode == 'random':
+                return lambda rng: rng.choice(values)
+            return _const(values[0])
+        if 'default' in schema and self.mode == 'schema':
+            return _const(schema['default'])
+
+        schema_type = schema.get('type')
+        if isinstance(schema_type, list):
+            # OpenAPI 3.1 / JSON Schema type lists such as ["string", "null"]
+            schema_type = next((t for t in schema_type if t != 'null'), 'null')
+        if 'properties' in schema or schema_type == 'object':
+            return self._compile_object(schema)
+        if 'items' in schema or schema_type == 'array':
+            return self._compile_array(schema)
+        if schema_type == 'integer':
+            return self._compile_number(schema, integer=True)
+        if schema_type == 'number':
+            return self._compile_number(schema, integer=False)
+        if schema_type == 'boolean':
+            if self.mode == 'random':
+                return lambda rng: rng.random() < 0.5
+            return _const(True)
+        if schema_type == 'null':
+            return _const(None)
+        return self._compile_string(schema)
+
+    def _compile_object(self, schema: Dict[str, Any]) -> Generator:
+        properties = schema.get('properties') or {}
+        fields = [(name, self.compile(sub)) for name, sub in properties.items()]
+        return lambda rng: {name: build(rng) for name, build in fields}
+
+    def _compile_array(self, schema: Dict[str, Any]) -> Generator:
+        build = self.compile(schema.get('items') or {})
+        low = schema.get('minItems') or 0
+        high = schema.get('maxItems')
+        if self.mode == 'random':
+            low = max(low, 1) if high is None or high >= 1 else low
+            top = low + RANDOM_ITEMS_SPAN if high is None else min(high, low + RANDOM_ITEMS_SPAN)
+            return lambda rng: [build(rng) for _ in range(rng.randint(low, max(low, top)))]
+        count = max(low, 1)
+        if high is not None:
+            count = min(count, high)
+        return lambda rng: [build(rng) for _ in range(count)]
+
+    def _compile_number(self, schema: Dict[str, Any], integer: bool) -> Generator:
+        low, high = _bounds(schema, integer)
+        multiple = schema.get('multipleOf')
+        if self.mode == 'random':
+            if low is None:
+                low = (high - RANDOM_NUMBER_SPAN) if high is not None else 0
+            if high is None:
+                high = low + RANDOM_NUMBER_SPAN
+            if integer:
+                draw = lambda rng: rng.randint(low, max(low, high))
+            else:
+                draw = lambda rng: round(rng.uniform(low, high), 2)
+            if multiple:
+                return lambda rng: _snap(draw(rng), multiple, low, high, integer)
+            return draw
+
+        value = FIXED_SAMPLES['integer' if integer else 'number']
+        if low is not None and value < low:
+            value = low
+        if high is not None and value > high:
+            value = high
+        if multiple:
+            value = _snap(value, multiple, low, high, integer)
+        return _const(value)
+
+    def _compile_string(self, schema: Dict[str, Any]) -> Generator:
+        fmt = schema.get('format')
+        if fmt in FORMAT_SAMPLES:
+            if self.mode == 'random':
+                return _random_format(fmt)
+            return _const(FORMAT_SAMPLES[fmt])
+        if schema.get('pattern'):
+            pattern = _compile_pattern(schema['pattern'], self.mode == 'random')
+            if pattern is not None:
+                return pattern
+
+        min_length = schema.get('minLength') or 0
+        max_length = schema.get('maxLength')
+        if self.mode == 'random':
+            top = min_length + RANDOM_STRING_SPAN if max_length is None else min(max_length, min_length + RANDOM_STRING_SPAN)
+            low = min(max(min_length, 1), top)
+            return lambda rng: ''.join(rng.choices(_ALNUM, k=rng.randint(low, max(low, top))))
+        value = FIXED_STRING
+        if len(value) < min_length:
+            value += 'a' * (min_length - len(value))
+        if max_length is not None:
+            value = value[:max_length]
+        return _const(value)
+
+
+def _bounds(schema: Dict[str, Any], integer: bool) -> Tuple[Optional[float], Optional[float]]:
+    """Inclusive bounds, accepting both OpenAPI 3.0 boolean and 3.1 numeric exclusive keywords"""
+    step = 1 if integer else 0.01
+    low, high = schema.get('minimum'), schema.get('maximum')
+    exclusive_low, exclusive_high = schema.get('exclusiveMinimum'), schema.get('exclusiveMaximum')
+    if isinstance(exclusive_low, bool):
+        if exclusive_low and low is not None:
+            low += step
+    elif exclusive_low is not None:
+        low = exclusive_low + step
+    if isinstance(exclusive_high, bool):
+        if exclusive_high and high is not None:
+            high -= step
+    elif exclusive_high is not None:
+        high = exclusive_high - step
+    if integer:
+        low = None if low is None else int(-(-low // 1))
+        high = None if high is None else int(high // 1)
+    return low, high
+
+
+def _snap(value: float, multiple: float, low: Optional[float], high: Optional[float], integer: bool) -> Any:
+    """Nearest multiple of `multiple` at or above value that stays within bounds where possible"""
+    snapped = -(-value // multiple) * multiple
+    if high is not None and snapped > high:
+        snapped -= multiple
+    if low is not None and snapped < low:
+        snapped = low
+    return int(snapped) if integer else snapped
+
+
+def _random_format(fmt: str) -> Generator:
+    if fmt in ('date-time', 'date', 'time'):
+        def build(rng):
+            moment = _EPOCH + datetime.timedelta(seconds=rng.randrange(_FIVE_YEARS))
+            if fmt == 'date':
+                return moment.date().isoformat()
+            if fmt == 'time':
+                return moment.time().isoformat() + 'Z'
+            return moment.isoformat() + 'Z'
+        return build
+    if fmt == 'uuid':
+        return lambda rng: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    if fmt == 'email':
+        return lambda rng: ''.join(rng.choices(string.ascii_lowercase, k=8)) + '@example.com'
+    if fmt in ('uri', 'url'):
+        return lambda rng: 'https://example.com/' + ''.join(rng.choices(string.ascii_lowercase, k=8))
+    if fmt == 'hostname':
+        return lambda rng: ''.join(rng.choices(string.ascii_lowercase, k=8)) + '.example.com'
+    if fmt == 'ipv4':
+        return lambda rng: '10.' + '.'.join(str(rng.randrange(256)) for _ in range(3))
+    if fmt == 'ipv6':
+        return lambda rng: 'fd00:' + ':'.join(f"{rng.getrandbits(16):x}" for _ in range(7))
+    if fmt == 'byte':
+        return lambda rng: base64.b64encode(bytes(rng.getrandbits(8) for _ in range(12))).decode('ascii')
+    return lambda rng: ''.join(rng.choices(_ALNUM, k=12))
+
+
+def _compile_pattern(pattern: str, randomize: bool) -> Optional[Generator]:
+    """Generator of strings matching a regular expression, or None if it cannot be parsed"""
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return None
+    build = _regex_sequence(list(parsed), randomize)
+    return lambda rng: build(rng, {})
+
+
+def _regex_sequence(items: List[Tuple[Any, Any]], randomize: bool) -> Callable:
+    parts = [_regex_node(op, av, randomize) for op, av in items]
+    return lambda rng, groups: ''.join(part(rng, groups) for part in parts)
+
+
+def _regex_node(op: Any, av: Any, randomize: bool) -> Callable:
+    if op is sre_constants.LITERAL:
+        char = chr(av)
+        return lambda rng, groups: char
+    if op is sre_constants.NOT_LITERAL:
+        return _choice([c for c in _ALNUM if ord(c) != av], randomize)
+    if op is sre_constants.ANY:
+        return _choice(_ALNUM, randomize)
+    if op is sre_constants.IN:
+        return _choice(_class_alphabet(av), randomize)
+    if op is sre_constants.BRANCH:
+        branches = [_regex_sequence(list(branch), randomize) for branch in av[1]]
+        if randomize:
+            return lambda rng, groups: rng.choice(branches)(rng, groups)
+        return branches[0]
+    if op is sre_constants.SUBPATTERN:
+        group, body = av[0], _regex_sequence(list(av[-1]), randomize)
+
+        def subpattern(rng, groups):
+            text = body(rng, groups)
+            if group is not None:
+                groups[group] = text
+            return text
+        return subpattern
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+              getattr(sre_constants, 'POSSESSIVE_REPEAT', None)):
+        low, high, body = av[0], av[1], _regex_sequence(list(av[2]), randomize)
+        if high is sre_constants.MAXREPEAT or high > low + REGEX_REPEAT_SPAN:
+            high = low + REGEX_REPEAT_SPAN
+        if randomize:
+            return lambda rng, groups: ''.join(body(rng, groups) for _ in range(rng.randint(low, high)))
+        count = max(low, 1) if high >= 1 else 0
+        return lambda rng, groups: ''.join(body(rng, groups) for _ in range(count))
+    if op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+        return _regex_sequence(list(av), randomize)
+    if op is sre_constants.GROUPREF:
+        return lambda rng, groups: groups.get(av, '')
+    # Anchors and lookarounds produce no characters
+    return lambda rng, groups: ''
+
+
+def _class_alphabet(items: List[Tuple[Any, Any]]) -> str:
+    """Characters a [...] class accepts, in declaration order (printable ASCII for negated classes)"""
+    negate = False
+    chars = {}
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            chars[chr(av)] = None
+        elif op is sre_constants.RANGE:
+            low, high = av
+            for code in range(low, min(high, low + 255) + 1):
+                chars[chr(code)] = None
+        elif op is sre_constants.CATEGORY:
+            for char in _CATEGORY_CHARS.get(av, ''):
+                chars[char] = None
+    if negate:
+        return ''.join(c for c in _PRINTABLE if c not in chars) or 'a'
+    return ''.join(chars) or 'a'
+
+
+def _choice(alphabet: str, randomize: bool) -> Callable:
+    if randomize:
+        return lambda rng, groups: rng.choice(alphabet)
+    first = alphabet[0]
+    return lambda rng, groups: first
@@ -0,0 +1,34 @@
+import argparse
+
+from core.parsers.registry import default_registry
+from core.executor import iter_case_file
+from core.exporters import EXPORT_FORMATS, export_suites
+
+def main():
+    parser = argparse.ArgumentParser(description='Export generated test cases as runnable pytest / Locust suites')
+    parser.add_argument('cases_file', help='test_cases.json / test_cases.jsonl / test_cases.db produced by the generator')
+    parser.add_argument('--spec', help='API spec the cases came from, used to place parameters in path/query/header/body')
+    parser.add_argument('--format', choices=['openapi', 'postman', 'apifox'],
+                        help='Spec format (detected from the file content by default)')
+    parser.add_argument('--suites', default=','.join(EXPORT_FORMATS),
+                        help='Comma-separated suites to write (pytest, locust)')
+    parser.add_argument('--base-url', default='http://localhost:8080',
+                        help='Default target URL baked into the suites (pytest reads API_BASE_URL first)')
+    parser.add_argument('-o', '--output', default='output/suite', help='Output directory')
+    args = parser.parse_args()
+
+    api_def = None
+    if args.spec:
+        api_def = default_registry().parser_for(args.spec, args.format).parse(args.spec)
+
+    suites = [s for s in args.suites.split(',') if s]
+    try:
+        paths = export_suites(iter_case_file(args.cases_file), args.output, suites, api_def,
+                              args.base_url, args.spec)
+    except ValueError as exc:
+        parser.error(str(exc))
+    for path in paths:
+        print(f"Suite saved to: {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+
+from core.parsers.registry import default_registry
+from core.mock_server import MockServer
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a mock API that answers from a spec')
+    parser.add_argument('spec', help='Swagger/OpenAPI, Postman or Apifox file')
+    parser.add_argument('--format', choices=['openapi', 'postman', 'apifox'],
+                        help='Spec format (detected from the file content by default)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='Answer every matched request, even when required parameters are missing')
+    args = parser.parse_args()
+
+    api_def = default_registry().parser_for(args.spec, args.format).parse(args.spec)
+    mock = MockServer(api_def, args.host, args.port, validate=not args.no_validate)
+
+    async def serve():
+        host, port = await mock.start()
+        print(f"Mocking {len(api_def.endpoints)} endpoints ({mock.router.size} paths) on http://{host}:{port}")
+        await mock.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    print(f"Served {mock.requests} requests: "
+          + ', '.join(f"{status}: {count}" for status, count in sorted(mock.status_counts.items())))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+
+from core.case_store import CaseStore, CaseStoreWriter
+from core.executor import iter_case_file
+from core.report_generator import CASE_TYPE_NAMES
+
+def main():
+    parser = argparse.ArgumentParser(description='Query a SQLite case store (test_cases.db) without loading every case')
+    parser.add_argument('store', help='test_cases.db written with --json-format sqlite')
+    parser.add_argument('--from-json', metavar='CASES_FILE',
+                        help='First (re)build the store from a test_cases.json / test_cases.jsonl report')
+    parser.add_argument('--endpoint', help='"METHOD /path", e.g. "POST /orders"')
+    parser.add_argument('--method', help='HTTP method')
+    parser.add_argument('--path', help='Path template exactly as generated, e.g. /orders/{orderId}')
+    parser.add_argument('--type', choices=CASE_TYPE_NAMES, help='Case type')
+    parser.add_argument('--status', type=int, help='Expected status code (matches cases that accept it)')
+    parser.add_argument('--name', help='Substring of the case name')
+    parser.add_argument('--limit', type=int, help='Return at most this many cases')
+    parser.add_argument('--count', action='store_true', help='Print only the number of matching cases')
+    parser.add_argument('--endpoints', action='store_true', help='List endpoints with their case counts')
+    parser.add_argument('--json', action='store_true', help='Print matching cases as JSON Lines')
+    args = parser.parse_args()
+
+    method, path = args.method, args.path
+    if args.endpoint:
+        parts = args.endpoint.split(None, 1)
+        if len(parts) != 2:
+            parser.error('--endpoint takes "METHOD /path"')
+        method, path = parts
+
+    if args.from_json:
+        with CaseStoreWriter(args.store, {'source': args.from_json}) as writer:
+            writer.write_all(iter_case_file(args.from_json))
+        print(f"Stored {writer.total_cases} test cases in: {args.store}", file=sys.stderr)
+
+    try:
+        store = CaseStore(args.store)
+    except FileNotFoundError:
+        parser.error(f"No case store at {args.store}")
+    with store:
+        if args.endpoints:
+            for endpoint_method, endpoint_path, count in store.endpoints():
+                print(f"{count:6}  {endpoint_method} {endpoint_path}")
+            return
+        filters = dict(method=method, path=path, case_type=args.type, status=args.status, name=args.name)
+        if args.count:
+            print(store.count(**filters))
+            return
+        for case in store.query(limit=args.limit, **filters):
+            if args.json:
+                print(json.dumps(case, ensure_ascii=False, separators=(',', ':')))
+            else:
+                request = case['request']
+                print(f"{request['method']:<7} {request['path']}  {case['type']:<13} "
+                      f"{json.dumps(case['expect'].get('status'))}  {case['name']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import json
+import os
+import shutil
+import pytest
+from core.batch import expand_specs, run_batch
+
+EXAMPLES = ("petstore.yaml", "order_api.yaml", "postman_collection.json", "apifox_api.json")
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    for name in EXAMPLES:
+        shutil.copy(f"examples/{name}", specs / name)
+    return specs
+
+def test_expand_specs_from_globs_and_manifests(spec_dir):
+    (spec_dir / "nested").mkdir()
+    shutil.copy("examples/petstore.yaml", spec_dir / "nested" / "petstore.yaml")
+    jobs = expand_specs([str(spec_dir / "**" / "*.yaml")])
+    assert [job["name"] for job in jobs] == ["petstore", "order_api", "petstore-2"]
+
+    (spec_dir / "specs.txt").write_text("# nightly\npetstore.yaml\n\napifox_api.json\npetstore.yaml\n")
+    jobs = expand_specs(manifest=str(spec_dir / "specs.txt"))
+    assert [job["name"] for job in jobs] == ["petstore", "apifox_api"]
+    assert jobs[0]["path"] == str(spec_dir / "petstore.yaml")
+
+    (spec_dir / "specs.json").write_text(json.dumps(
+        ["order_api.yaml", {"path": "postman_collection.json", "name": "orders", "format": "postman"}]))
+    jobs = expand_specs(manifest=str(spec_dir / "specs.json"))
+    assert [(job["name"], job["format"]) for job in jobs] == [("order_api", None), ("orders", "postman")]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_writes_per_spec_reports_and_index(spec_dir, tmp_path, workers):
+    (spec_dir / "broken.json").write_text('{"hello": "world"}')
+    output = tmp_path / "out"
+    seen = []
+    index = run_batch(expand_specs([str(spec_dir / "*")]), str(output), workers,
+                      {"html": "none", "json_format": "array"}, on_result=seen.append)
+
+    assert index["total_specs"] == len(seen) == 5
+    assert index["failed"] == 1
+    by_name = {spec["name"]: spec for spec in index["specs"]}
+    assert "Could not detect" in by_name["broken"]["error"]
+    for name in ("petstore", "order_api", "postman_collection", "apifox_api"):
+        cases = json.loads((output / name / "test_cases.json").read_text())
+        assert len(cases) == by_name[name]["cases"] > 0
+    assert index["total_cases"] == sum(spec.get("cases", 0) for spec in index["specs"])
+    assert json.loads((output / "index.json").read_text())["specs"] == index["specs"]
+    assert "petstore/test_cases.json" in (output / "index.html").read_text()
+
+def _crashing_run_spec(job, output_dir):
+    os._exit(1)
+
+def test_run_batch_records_a_broken_pool(spec_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr("core.batch.run_spec", _crashing_run_spec)
+    output = tmp_path / "out"
+    jobs = expand_specs([str(spec_dir / "*.yaml")])
+    index = run_batch(jobs, str(output), 2, {"html": "none"})
+
+    assert index["total_specs"] == len(jobs) and index["failed"] == len(jobs)
+    assert all(spec["error"].startswith("BrokenProcessPool") for spec in index["specs"])
+    assert json.loads((output / "index.json").read_text())["failed"] == len(jobs)
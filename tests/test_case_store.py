@@ -0,0 +1,41 @@
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator
+from core.case_store import CaseStore, open_case_report
+from core.executor import iter_case_file
+
+def _cases():
+    parser = SwaggerParser()
+    api_def = parser.parse(str(Path(__file__).parent.parent / "examples" / "order_api.yaml"))
+    return [case.to_dict() for case in TestCaseGenerator(parser).iter_cases(api_def.endpoints)]
+
+def test_store_round_trips_cases_in_order(tmp_path):
+    cases = _cases()
+    with open_case_report(str(tmp_path), 'sqlite') as writer:
+        writer.write_all(cases)
+        writer.close({'spec': 'order_api.yaml'})
+
+    assert Path(writer.output_path).name == "test_cases.db"
+    with CaseStore(writer.output_path) as store:
+        assert list(store) == cases
+        assert store.metadata()['total_cases'] == len(cases)
+        assert store.metadata()['spec'] == 'order_api.yaml'
+        assert [(m, p) for m, p, _ in store.endpoints()] == [("POST", "/orders"), ("GET", "/orders/{orderId}")]
+    assert list(iter_case_file(writer.output_path)) == cases
+
+def test_store_filters_on_indexed_columns(tmp_path):
+    cases = _cases()
+    with open_case_report(str(tmp_path), 'sqlite') as writer:
+        writer.write_all(cases)
+
+    with CaseStore(writer.output_path) as store:
+        security = list(store.query(method="post", path="/orders", case_type="security"))
+        assert security == [c for c in cases if c['type'] == 'security' and c['request']['path'] == "/orders"]
+        assert store.count(method="POST", path="/orders", case_type="security") == len(security)
+
+        # A case matches a status filter when it accepts that status among several
+        accepts_403 = [c for c in cases if 403 in (c['expect']['status'] if isinstance(c['expect']['status'], list)
+                                                   else [c['expect']['status']])]
+        assert accepts_403 and list(store.query(status=403)) == accepts_403
+        assert [c['name'] for c in store.query(name="_normal", limit=1)] == [cases[0]['name']]
+        assert store.count(case_type="combinatorial") == 0
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.executor import CaseRunner, build_request, run_cases, iter_case_file
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+async def _start_stub(connections):
+    """Minimal keep-alive HTTP/1.1 server that echoes the request it received"""
+    async def handle(reader, writer):
+        connections.append(writer)
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode().split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode().partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            status = 500 if 'boom' in target else 200
+            payload = json.dumps({"method": method, "target": target,
+                                  "trace": headers.get("x-trace-id"),
+                                  "body": body.decode() or None}).encode()
+            if 'sqli' in target:
+                payload += b" You have an error in your SQL syntax"
+            writer.write(f"HTTP/1.1 {status} OK\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+            await writer.drain()
+        writer.close()
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+def _case(name, method, path, parameters, status=200, **expect):
+    return {"name": name, "type": "normal",
+            "request": {"method": method, "path": path, "parameters": parameters},
+            "expect": dict(status=status, **expect)}
+
+def test_build_request_places_parameters_from_spec():
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "petstore.yaml"))
+    case = _case("c", "GET", "/pets/{petId}", {"petId": "a b", "extra": 1})
+    method, target, headers, body = build_request(case, api_def.get_endpoint("GET", "/pets/{petId}"))
+    assert (method, target, body) == ("GET", "/pets/a%20b?extra=1", None)
+
+    case = _case("c", "POST", "/pets", {"name": "rex"})
+    method, target, headers, body = build_request(case, api_def.get_endpoint("POST", "/pets"))
+    assert json.loads(body) == {"name": "rex"}
+    assert headers["Content-Type"] == "application/json"
+
+def test_runner_reuses_connections_and_checks_expectations():
+    cases = [_case(f"ok{i}", "GET", "/items/{id}", {"id": i}) for i in range(20)]
+    cases.append(_case("bad_status", "GET", "/boom", {}))
+    cases.append(_case("sqli", "GET", "/sqli", {}, status=[200], not_contains=["SQL syntax"]))
+
+    async def scenario():
+        connections = []
+        server, port = await _start_stub(connections)
+        results = []
+        async with server:
+            runner = CaseRunner(f"http://127.0.0.1:{port}/api", concurrency=4)
+            summary = await runner.run(iter(cases), results.append)
+        return summary, results, len(connections)
+
+    summary, results, connection_count = asyncio.run(scenario())
+    assert summary["total"] == 22
+    assert summary["passed"] == 20 and summary["failed"] == 2
+    assert connection_count <= 4
+    by_name = {r["name"]: r for r in results}
+    assert by_name["ok3"]["url"].endswith("/api/items/3")
+    assert by_name["bad_status"]["failures"] == ["status 500 not in [200]"]
+    assert by_name["sqli"]["failures"] == ["response contains 'SQL syntax'"]
+
+def test_run_cases_streams_results_to_jsonl(tmp_path):
+    cases_file = tmp_path / "cases.jsonl"
+    cases_file.write_text("\n".join(json.dumps(_case(f"c{i}", "GET", "/x", {})) for i in range(3)))
+
+    async def serve_and_run():
+        server, port = await _start_stub([])
+        async with server:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: run_cases(
+                iter_case_file(str(cases_file)), f"http://127.0.0.1:{port}",
+                str(tmp_path / "results.jsonl"), concurrency=2, rate=1000))
+
+    summary = asyncio.run(serve_and_run())
+    assert summary["passed"] == 3
+    lines = (tmp_path / "results.jsonl").read_text().splitlines()
+    assert sorted(json.loads(l)["index"] for l in lines) == [0, 1, 2]
+    meta = json.loads((tmp_path / "results.jsonl.meta.json").read_text())
+    assert meta["total_cases"] == 3 and meta["passed"] == 3
+
+def test_response_validator_compiles_once_per_operation():
+    from core.parsers.iapi_parser import ApiDefinition
+    from core.executor import ResponseValidator
+
+    api_def = ApiDefinition()
+    api_def.add_model("Pet", {"type": "object", "required": ["id", "name"],
+                              "properties": {"id": {"type": "integer"}, "name": {"type": "string"},
+                                             "tag": {"type": "string", "nullable": True},
+                                             "parent": {"$ref": "#/components/schemas/Pet"}}})
+    api_def.add_endpoint("GET", "/pets/{petId}", {}, {
+        200: {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}}},
+        "4XX": {"schema": {"type": "object", "required": ["error"]}},
+        "default": {"description": "no body schema"}})
+    validator = ResponseValidator(api_def)
+
+    for _ in range(3):
+        assert validator.check("GET", "/pets/{petId}", 200, b'{"id": 1, "name": "rex", "tag": null}') == []
+    assert validator.check("get", "/pets/{petId}", 200, b'{"id": "1", "parent": {"id": 2}}') == [
+        "response body: 'name' is a required property",
+        "response body at id: '1' is not of type 'integer'",
+        "response body at parent: 'name' is a required property"]
+    assert validator.check("GET", "/pets/{petId}", 404, b'{"error": "gone"}') == []
+    assert validator.check("GET", "/pets/{petId}", 404, b'not json') == [
+        "response body is not valid JSON for status 404"]
+    assert validator.check("GET", "/pets/{petId}", 500, b'anything') == []
+    assert validator.check("GET", "/unknown", 200, b'') == []
+    assert validator.compiled == 2 and validator.checked == 6
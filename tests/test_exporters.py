@@ -0,0 +1,57 @@
+import asyncio
+import json
+import os
+import py_compile
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator
+from core.exporters import export_suites, DATA_NAME, INDEX_NAME
+from core.mock_server import MockServer
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+def _export(tmp_path):
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "order_api.yaml"))
+    cases = list(TestCaseGenerator(parser).iter_cases(api_def.endpoints, ("normal", "error")))
+    paths = export_suites(iter(cases), str(tmp_path), api_def=api_def, spec="order_api.yaml")
+    return api_def, cases, paths
+
+def test_index_points_at_endpoint_blocks(tmp_path):
+    api_def, cases, paths = _export(tmp_path)
+    assert [Path(p).name for p in paths] == ["test_api.py", "locustfile.py"]
+    for path in paths:
+        py_compile.compile(path, doraise=True)
+
+    index = json.loads((tmp_path / INDEX_NAME).read_text())
+    data = (tmp_path / DATA_NAME).read_bytes()
+    assert index["total"] == len(cases) and index["endpoints"] == 2
+    block = index["blocks"][0]
+    lines = data[block["offset"]:block["offset"] + block["length"]].splitlines()
+    assert [json.loads(line)["name"] for line in lines] == block["names"]
+    normal = json.loads(lines[0])
+    assert (normal["method"], normal["target"]) == ("POST", "/orders")
+    assert set(json.loads(normal["body"])) == {"productId", "quantity"}
+
+def test_generated_pytest_suite_runs_against_the_mock(tmp_path):
+    api_def, cases, _ = _export(tmp_path)
+    loop = asyncio.new_event_loop()
+    mock = MockServer(api_def)
+    loop.run_until_complete(mock.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        env = dict(os.environ, API_BASE_URL=f"http://127.0.0.1:{mock.port}")
+        result = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+                                 str(tmp_path / "test_api.py")], env=env, capture_output=True, text=True)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(mock.close())
+        loop.close()
+    # Normal cases expect the 201 the spec declares for POST /orders
+    assert "5 passed" in result.stdout, result.stdout
+    assert mock.requests == len(cases)
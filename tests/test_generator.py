@@ -1,10 +1,12 @@
 import pytest
 import os
 import json
+from itertools import combinations, product
 from pathlib import Path
-from ..core.parser import SwaggerParser
-from ..core.generator import TestCaseGenerator
-from ..core.report_generator import ReportGenerator
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator
+from core.pairwise import pairwise_rows
+from core.report_generator import ReportGenerator
 
 @pytest.fixture
 def order_api_parser():
@@ -61,3 +63,121 @@ def test_report_generation(order_api_parser, tmp_path):
         report = json.load(f)
         assert report["metadata"]["total_cases"] == len(test_cases)
         assert report_gen.validate_schema(report["test_cases"])
+
+def test_endpoint_index(order_api_parser):
+    api_def = order_api_parser.api_def
+    endpoint = api_def.get_endpoint("post", "/orders")
+    assert endpoint is api_def.endpoints[0]
+    assert api_def.get_endpoint("GET", "/missing") is None
+
+def test_generate_all_matches_per_type_methods(order_api_parser):
+    generator = TestCaseGenerator(order_api_parser)
+    endpoint = order_api_parser.api_def.get_endpoint("POST", "/orders")
+
+    expected = []
+    expected.extend(generator.generate_normal_cases("/orders", "post"))
+    expected.extend(generator.generate_error_cases("/orders", "post"))
+    expected.extend(generator.generate_boundary_cases("/orders", "post"))
+    expected.extend(generator.generate_security_cases("/orders", "post"))
+
+    assert generator.generate_all(endpoint) == expected
+    assert generator.generate_all(endpoint, ("normal",)) == expected[:1]
+
+def test_parallel_generation_is_deterministic(order_api_parser):
+    from core.parallel import generate_parallel, chunk_size_for
+
+    generator = TestCaseGenerator(order_api_parser)
+    endpoints = order_api_parser.api_def.endpoints * 3
+    sequential = generate_parallel(generator, endpoints, jobs=1)
+    assert generate_parallel(generator, endpoints, jobs=2) == sequential
+    assert chunk_size_for(4000, 16) == 63
+
+def test_iter_cases_is_lazy(order_api_parser):
+    import types
+
+    generator = TestCaseGenerator(order_api_parser)
+    endpoints = order_api_parser.api_def.endpoints
+    stream = generator.iter_cases(endpoints)
+    assert isinstance(stream, types.GeneratorType)
+    expected = [c for e in endpoints for c in generator.generate_all(e)]
+    assert list(stream) == expected
+
+def test_variants_reuse_one_baseline_per_endpoint(monkeypatch):
+    from core.parsers.iapi_parser import ApiDefinition
+
+    body = [{"name": f"f{i}", "in": "body", "required": i % 4 != 3, "type": "integer", "minimum": 0}
+            for i in range(40)]
+    api_def = ApiDefinition()
+    api_def.add_endpoint("POST", "/wide", {"body_params": body}, {})
+    endpoint = api_def.endpoints[0]
+    generator = TestCaseGenerator(None)
+
+    calls = []
+    sample = generator._get_sample_value
+    monkeypatch.setattr(generator, "_get_sample_value", lambda p, rng=None: calls.append(p["name"]) or sample(p, rng))
+    errors = list(generator.iter_error_cases(endpoint))
+    boundaries = list(generator.iter_boundary_cases(endpoint))
+    assert len(calls) == 2 * 30
+
+    required = [p["name"] for p in body if p["required"]]
+    assert list(errors[0]["request"]["parameters"]) == required[1:]
+    zero_f0, min_f0 = boundaries[0], boundaries[1]
+    assert zero_f0["request"]["parameters"]["f0"] == 0 and min_f0["request"]["parameters"]["f0"] == 0
+    assert zero_f0["request"]["parameters"]["f1"] == 123
+    # Optional parameters stay out of their own boundary cases, as before
+    zero_f3 = next(c for c in boundaries if c["name"] == "POST__wide_zero_f3")
+    assert "f3" not in zero_f3["request"]["parameters"]
+    assert zero_f3["request"]["parameters"] is not zero_f0["request"]["parameters"]
+
+def test_pairwise_rows_cover_every_pair():
+    sizes = [3, 2, 4, 2, 3, 2, 2]
+    rows = pairwise_rows(sizes)
+    for i, j in combinations(range(len(sizes)), 2):
+        assert {(row[i], row[j]) for row in rows} == set(product(range(sizes[i]), range(sizes[j])))
+    # Far fewer rows than the 1152 exhaustive combinations
+    assert len(rows) <= 20
+    assert len(pairwise_rows([4] * 30, max_rows=10)) == 10
+
+def test_combinatorial_cases_vary_parameters_together(order_api_parser):
+    generator = TestCaseGenerator(order_api_parser, max_combinations=5)
+    endpoint = order_api_parser.api_def.get_endpoint("POST", "/orders")
+    cases = generator.generate_combinatorial_cases("/orders", "POST")
+    assert 1 < len(cases) <= 5
+    assert all(case["type"] == "combinatorial" and case["expect"]["status"] == 201 for case in cases)
+    normal = generator.generate_normal_cases("/orders", "POST")[0]
+    assert all(case["request"]["parameters"] != normal["request"]["parameters"] for case in cases)
+    # Not generated unless asked for
+    assert not any(case["type"] == "combinatorial" for case in generator.generate_all(endpoint))
+
+def test_combinatorial_values_stay_in_range():
+    from core.parsers.iapi_parser import ApiDefinition
+    api_def = ApiDefinition()
+    api_def.add_endpoint("GET", "/items", {"query_params": [
+        {"name": "page", "in": "query", "required": True, "type": "integer", "minimum": 1, "maximum": 10},
+        {"name": "limit", "in": "query", "type": "integer", "minimum": 5},
+        {"name": "offset", "in": "query", "type": "integer"}
+    ]}, {})
+    cases = list(TestCaseGenerator(None).iter_combinatorial_cases(api_def.endpoints[0]))
+    assert cases
+    for case in cases:
+        params = case.parameters
+        assert 1 <= params["page"] <= 10
+        assert params.get("limit", 5) >= 5
+        assert params.get("offset", 0) is not None
+
+def test_expected_statuses_follow_declared_responses():
+    from core.parsers.iapi_parser import ApiDefinition
+
+    api_def = ApiDefinition()
+    params = {"query_params": [{"name": "q", "in": "query", "required": True, "type": "string",
+                                "enum": ["a", "b"]}]}
+    api_def.add_endpoint("PUT", "/declared", params, {200: {}, "204": {}, "422": {}, "default": {}})
+    api_def.add_endpoint("PUT", "/undeclared", params, {"default": {}})
+    generator = TestCaseGenerator(None)
+
+    declared = {c.name: c.to_dict()["expect"]["status"] for c in generator.generate_all(api_def.endpoints[0])}
+    assert declared["PUT__declared_normal"] == [200, 204]
+    assert declared["PUT__declared_missing_q"] == 422
+    assert declared["PUT__declared_invalid_enum_q"] == 422
+    undeclared = {c.name: c.to_dict()["expect"]["status"] for c in generator.generate_all(api_def.endpoints[1])}
+    assert undeclared["PUT__undeclared_normal"] == 200 and undeclared["PUT__undeclared_missing_q"] == 400
@@ -0,0 +1,81 @@
+import copy
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator
+from core.incremental import IncrementalStore
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+def _run(output_dir, generator, endpoints, calls):
+    def generate(changed):
+        calls.append([e["path"] for e in changed])
+        return generator.iter_cases(changed)
+    store = IncrementalStore(str(output_dir), generator.fingerprint())
+    return store, list(store.iter_cases(endpoints, generate))
+
+def test_incremental_only_regenerates_changed_endpoints(tmp_path):
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "petstore.yaml"))
+    generator = TestCaseGenerator(parser)
+    endpoints = api_def.endpoints
+    calls = []
+
+    _, first = _run(tmp_path, generator, endpoints, calls)
+    assert first == list(generator.iter_cases(endpoints))
+
+    store, second = _run(tmp_path, generator, endpoints, calls)
+    assert second == first
+    assert calls[-1] == []
+    assert store.diff["endpoints"]["unchanged"] == 3
+
+    changed = copy.deepcopy(endpoints[:2])
+    changed[1]["parameters"]["body_params"][0]["maxLength"] = 10
+    store, third = _run(tmp_path, generator, changed, calls)
+    assert calls[-1] == ["/pets"]
+    assert store.diff["endpoints"] == {"added": [], "removed": ["GET /pets/{petId}"],
+                                       "changed": ["POST /pets"], "unchanged": 1}
+    assert store.diff["cases"]["changed"] == ["POST__pets_max_length_name"]
+    assert "GET__pets_{petId}_normal" in store.diff["cases"]["removed"]
+    assert third == list(generator.iter_cases(changed))
+
+def test_incremental_streams_regenerated_cases(tmp_path):
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "petstore.yaml"))
+    generator = TestCaseGenerator(parser)
+    endpoints = api_def.endpoints
+    pulled = []
+
+    def generate(changed):
+        for case in generator.iter_cases(changed):
+            pulled.append(case.name)
+            yield case
+
+    store = IncrementalStore(str(tmp_path), generator.fingerprint())
+    stream = store.iter_cases(endpoints, generate)
+    first = next(stream)
+    # Nothing past the first case has been generated yet
+    assert pulled == [first["name"]]
+    assert [first] + list(stream) == list(generator.iter_cases(endpoints))
+
+def test_incremental_keeps_duplicate_endpoints(tmp_path):
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "petstore.yaml"))
+    generator = TestCaseGenerator(parser)
+    # Collections often repeat a request; each definition keeps its own cases
+    endpoints = [api_def.endpoints[0], api_def.endpoints[1], api_def.endpoints[1], api_def.endpoints[0]]
+    endpoints[2] = copy.deepcopy(endpoints[2])
+    endpoints[2]["parameters"]["body_params"][0]["maxLength"] = 10
+    calls = []
+
+    store, first = _run(tmp_path, generator, endpoints, calls)
+    assert first == list(generator.iter_cases(endpoints))
+    assert store.diff["endpoints"]["added"] == ["GET /pets", "POST /pets", "POST /pets#2", "GET /pets#2"]
+
+    store, second = _run(tmp_path, generator, endpoints, calls)
+    assert second == first
+    assert store.diff["endpoints"]["unchanged"] == 4
+
+    endpoints[1] = endpoints[2]
+    store, third = _run(tmp_path, generator, endpoints, calls)
+    assert third == list(generator.iter_cases(endpoints))
+    assert store.diff["endpoints"]["changed"] == ["POST /pets"]
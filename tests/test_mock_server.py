@@ -0,0 +1,76 @@
+import asyncio
+import json
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.parsers.apifox_parser import ApifoxParser
+from core.generator import TestCaseGenerator
+from core.executor import CaseRunner
+from core.mock_server import MockServer, PathRouter
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+def test_router_prefers_literal_segments_and_backtracks():
+    router = PathRouter()
+    router.setdefault("/orders/{id}", "order")
+    router.setdefault("/orders/export", "export")
+    router.setdefault("/orders/{id}/items/:item", "item")
+    router.setdefault("/orders/export/{fmt}", "export_format")
+    router.setdefault("/files/{name}.json", "file")
+
+    assert router.match("/orders/42") == ("order", ["42"])
+    assert router.match("/orders/export") == ("export", [])
+    assert router.match("/orders/export/items/7") == ("item", ["export", "7"])
+    assert router.match("/files/a%20b.json/") == ("file", ["a b"])
+    assert router.match("/orders") is None
+    assert router.setdefault("/orders/{orderId}", "other") == ("order", ["orderId"])
+
+def test_dispatch_answers_from_spec():
+    api_def = ApifoxParser().parse(str(EXAMPLES / "apifox_api.json"))
+    mock = MockServer(api_def)
+
+    found = mock.dispatch("GET", "/pet/7", {}, b"")
+    assert found.status == 200 and set(json.loads(found.body)) == {"id", "name", "status"}
+    assert mock.dispatch("DELETE", "/pet/7", {}, b"").status == 405
+    assert mock.dispatch("GET", "/nowhere", {}, b"").status == 404
+
+    api_def = SwaggerParser().parse(str(EXAMPLES / "order_api.yaml"))
+    mock = MockServer(api_def)
+    missing = mock.dispatch("POST", "/orders", {}, json.dumps({"productId": "p"}).encode())
+    assert missing.status == 400 and json.loads(missing.body)["missing"] == ["quantity"]
+    assert mock.dispatch("POST", "/orders", {}, b"{not json").status == 400
+    created = mock.dispatch("POST", "/orders", {}, json.dumps({"productId": "p", "quantity": 1}).encode())
+    assert created.status == 201
+    assert MockServer(api_def, validate=False).dispatch("POST", "/orders", {}, b"").status == 201
+
+def test_mixed_status_key_types():
+    from core.parsers.iapi_parser import ApiDefinition
+    api_def = ApiDefinition()
+    # YAML reads 202: as an int and '201': as a string
+    api_def.add_endpoint("POST", "/jobs", {}, {202: {"description": "queued"},
+                                               "201": {"content": {"application/json": {"example": {"id": 1}}}},
+                                               "default": {"description": "error"}})
+    api_def.add_endpoint("GET", "/jobs", {}, {"2XX": {"content": {"application/json": {"example": []}}}})
+    mock = MockServer(api_def)
+    created = mock.dispatch("POST", "/jobs", {}, b"")
+    assert created.status == 201 and json.loads(created.body) == {"id": 1}
+    listed = mock.dispatch("GET", "/jobs", {}, b"")
+    assert listed.status == 200 and json.loads(listed.body) == []
+
+def test_generated_cases_replay_against_the_mock():
+    parser = SwaggerParser()
+    api_def = parser.parse(str(EXAMPLES / "petstore.yaml"))
+    cases = list(TestCaseGenerator(parser).iter_cases(api_def.endpoints, ("normal", "error")))
+
+    async def scenario():
+        async with MockServer(api_def) as mock:
+            runner = CaseRunner(f"http://127.0.0.1:{mock.port}", concurrency=4, api_def=api_def)
+            results = []
+            summary = await runner.run(cases * 10, results.append)
+        return summary, results, mock
+
+    summary, results, mock = asyncio.run(scenario())
+    assert summary["total"] == len(cases) * 10 and summary["errors"] == 0
+    assert mock.requests == summary["total"]
+    # Missing required parameters are rejected, as the error cases expect
+    assert all(r["passed"] for r in results if r["type"] == "error")
+    assert summary["connections"] <= 4
@@ -0,0 +1,247 @@
+import pytest
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+@pytest.fixture
+def petstore_parser():
+    parser = SwaggerParser()
+    parser.parse(str(EXAMPLES / "petstore.yaml"))
+    return parser
+
+def test_swagger_parse_stats(petstore_parser):
+    stats = petstore_parser.stats
+    assert stats["paths"] == 2
+    assert stats["operations"] == 3
+    assert stats["total_time"] >= stats["parse_time"]
+
+def test_swagger_parse_parameters_matches_endpoint(petstore_parser):
+    endpoint = petstore_parser.api_def.get_endpoint("GET", "/pets")
+    assert petstore_parser.parse_parameters("/pets", "get") == endpoint["parameters"]
+    assert [p["name"] for p in endpoint["parameters"]["query_params"]] == ["limit"]
+
+def test_swagger_operation_params_override_path_level(tmp_path):
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("""
+openapi: "3.0.0"
+paths:
+  /items/{id}:
+    parameters:
+      - {name: id, in: path, required: true, schema: {type: string}}
+      - {name: trace, in: header, required: false}
+    get:
+      parameters:
+        - {name: trace, in: header, required: true}
+      responses:
+        '200': {description: ok}
+""")
+    parser = SwaggerParser()
+    api_def = parser.parse(str(spec))
+    params = api_def.get_endpoint("GET", "/items/{id}")["parameters"]
+    assert [p["name"] for p in params["path_params"]] == ["id"]
+    assert params["header_params"] == [{"name": "trace", "in": "header", "required": True}]
+
+def test_swagger_parse_paths_requires_loaded_spec():
+    with pytest.raises(ValueError):
+        SwaggerParser().parse_paths()
+
+REF_SPEC = """
+openapi: "3.0.0"
+paths:
+  /orders:
+    post:
+      parameters:
+        - $ref: '#/components/parameters/TraceId'
+      requestBody:
+        $ref: '#/components/requestBodies/NewOrder'
+      responses:
+        '201':
+          $ref: '#/components/responses/Created'
+  /orders/{id}:
+    put:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              $ref: '#/components/schemas/Order'
+      responses:
+        '200': {description: ok}
+components:
+  parameters:
+    TraceId: {name: X-Trace-Id, in: header, required: true, schema: {type: string}}
+  requestBodies:
+    NewOrder:
+      content:
+        application/json:
+          schema:
+            $ref: '#/components/schemas/Order'
+  responses:
+    Created: {description: created}
+  schemas:
+    Base:
+      type: object
+      required: [id]
+      properties:
+        id: {type: integer, minimum: 1}
+    Order:
+      allOf:
+        - $ref: '#/components/schemas/Base'
+        - type: object
+          required: [status]
+          properties:
+            status: {$ref: '#/components/schemas/Status'}
+            parent: {$ref: '#/components/schemas/Order'}
+    Status: {type: string, enum: [open, closed]}
+    Loop: {$ref: '#/components/schemas/Loop'}
+"""
+
+def test_swagger_resolves_refs(tmp_path):
+    spec = tmp_path / "refs.yaml"
+    spec.write_text(REF_SPEC)
+    parser = SwaggerParser()
+    api_def = parser.parse(str(spec))
+
+    post = api_def.get_endpoint("POST", "/orders")
+    assert [p["name"] for p in post["parameters"]["header_params"]] == ["X-Trace-Id"]
+    body = {p["name"]: p for p in post["parameters"]["body_params"]}
+    assert set(body) == {"id", "status", "parent"}
+    assert body["id"]["required"] and body["id"]["minimum"] == 1
+    assert body["status"]["enum"] == ["open", "closed"]
+    assert post["responses"]["201"] == {"description": "created"}
+
+    put = api_def.get_endpoint("PUT", "/orders/{id}")
+    assert put["parameters"]["body_params"] == post["parameters"]["body_params"]
+
+    assert api_def.models["Order"]["required"] == ["id", "status"]
+    assert "#/components/schemas/Loop" in parser.stats["ref_cycles"]
+
+def test_spec_cache_reuses_parsed_definition(tmp_path):
+    from core.parsers.spec_cache import SpecCache
+
+    spec = tmp_path / "spec.yaml"
+    spec.write_text((EXAMPLES / "petstore.yaml").read_text())
+    cache = SpecCache(str(tmp_path / "cache"))
+
+    first = cache.parse(SwaggerParser(), str(spec))
+    parser = SwaggerParser()
+    second = cache.parse(parser, str(spec))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert parser.api_def is second
+    assert parser.stats["cached"]
+    assert second.endpoints == first.endpoints
+    assert second.get_endpoint("GET", "/pets") is second.endpoints[0]
+
+    spec.write_text(spec.read_text().replace("/pets/{petId}", "/pets/{id}"))
+    cache.parse(SwaggerParser(), str(spec))
+    assert cache.misses == 2
+
+def _nested_collection(depth):
+    leaf = {"name": "Get order", "request": {"method": "GET", "url": "{{baseUrl}}/orders/:id?expand=items",
+                                             "header": [{"key": "X-Trace"}]},
+            "response": [{"code": 200, "name": "ok", "body": "{}"}]}
+    node = leaf
+    for level in reversed(range(depth)):
+        node = {"name": f"folder{level}", "item": [node]}
+    return {"info": {"schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"},
+            "item": [node, {"name": "Ping", "request": "https://example.com/health/ping"}]}
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_postman_walks_nested_folders(tmp_path, streaming):
+    import json
+    from core.parsers.postman_parser import PostmanParser
+
+    if streaming:
+        pytest.importorskip("ijson")
+    collection = tmp_path / "collection.json"
+    collection.write_text(json.dumps(_nested_collection(3)))
+    api_def = PostmanParser(streaming=streaming).parse(str(collection))
+
+    first, second = api_def.endpoints
+    assert (first["method"], first["path"]) == ("GET", "orders/:id")
+    assert first["metadata"] == {"name": "Get order", "folders": ["folder0", "folder1", "folder2"]}
+    assert [p["name"] for p in first["parameters"]["query_params"]] == ["expand"]
+    assert first["responses"]["200"]["description"] == "ok"
+    assert (second["path"], second["metadata"]["folders"]) == ("health/ping", [])
+
+def test_postman_streaming_matches_load_when_name_follows_item(tmp_path):
+    import json
+    from core.parsers.postman_parser import PostmanParser
+
+    pytest.importorskip("ijson")
+    request = {"method": "GET", "url": "{{baseUrl}}/orders"}
+    # Folder names written after their "item" arrays
+    collection = {"item": [
+        {"item": [{"name": "List", "request": request},
+                  {"item": [{"name": "Inner", "request": request}], "name": "inner"}],
+         "name": "Folder1"},
+        {"name": "Ping", "request": "https://example.com/health/ping"},
+        {"item": [{"name": "Unnamed", "request": request}]}
+    ]}
+    path = tmp_path / "collection.json"
+    path.write_text(json.dumps(collection))
+
+    loaded = PostmanParser().parse(str(path)).endpoints
+    streamed = PostmanParser(streaming=True).parse(str(path)).endpoints
+    assert [e["metadata"] for e in streamed] == [e["metadata"] for e in loaded]
+    assert [e["metadata"]["folders"] for e in streamed] == [["Folder1"], ["Folder1", "inner"], [], [""]]
+    assert streamed == loaded
+
+def test_postman_stack_walk_handles_deep_nesting():
+    import sys
+    from core.parsers.postman_parser import PostmanParser
+
+    depth = sys.getrecursionlimit() * 2
+    items = _nested_collection(depth)["item"]
+    walked = list(PostmanParser._walk_items(items))
+    assert len(walked) == 2
+    assert len(walked[0][1]) == depth
+
+def test_registry_detects_format_from_content(tmp_path):
+    import json
+    import yaml
+    from core.parsers.registry import default_registry
+
+    openapi_json = tmp_path / "openapi.json"
+    with open("examples/petstore.yaml") as f:
+        openapi_json.write_text(json.dumps(yaml.safe_load(f)))
+    registry = default_registry()
+
+    # An OpenAPI document saved as .json used to be handed to the Postman parser
+    assert registry.detect(str(openapi_json)) == "openapi"
+    assert registry.detect("examples/petstore.yaml") == "openapi"
+    assert registry.detect("examples/postman_collection.json") == "postman"
+    assert registry.detect("examples/apifox_api.json") == "apifox"
+    assert registry.parser_for(str(openapi_json)).parse(str(openapi_json)).get_endpoint("GET", "/pets")
+
+def test_registry_only_reads_the_head(tmp_path):
+    from core.parsers.loader import read_spec_head
+    from core.parsers.registry import ParserRegistry, default_registry
+
+    # Padding inside a nested value pushes everything after it past the sniff window
+    spec = tmp_path / "big.json"
+    spec.write_text('{"swagger": "2.0", "info": {"description": "%s", "interfaces": []}, "paths": {}}' % ("x" * 20000))
+    head = read_spec_head(str(spec), 1024)
+    assert head.truncated and head.keys == {"swagger", "info"}
+    assert default_registry().detect(str(spec)) == "openapi"
+
+    unknown = tmp_path / "unknown.json"
+    unknown.write_text('{"hello": "world"}')
+    with pytest.raises(ValueError):
+        default_registry().parser_for(str(unknown))
+    assert default_registry().parser_for(str(unknown), "postman").__class__.__name__ == "PostmanParser"
+
+def test_registry_iterates_directory_with_warm_parsers(tmp_path):
+    import shutil
+    from core.parsers.registry import default_registry
+
+    for name in ("petstore.yaml", "order_api.yaml", "postman_collection.json", "apifox_api.json"):
+        shutil.copy(f"examples/{name}", tmp_path / name)
+    (tmp_path / "notes.json").write_text('["not a spec"]')
+    (tmp_path / "README.md").write_text("# specs")
+
+    registry = default_registry()
+    found = list(registry.iter_specs(str(tmp_path)))
+    assert [p.rsplit("/", 1)[-1] for p, _ in found] == [
+        "apifox_api.json", "order_api.yaml", "petstore.yaml", "postman_collection.json"]
+    assert found[1][1] is found[2][1] is registry.get("openapi")
@@ -0,0 +1,85 @@
+import json
+import pytest
+from core.parsers.iapi_parser import ApiDefinition
+from core.generator import TestCaseGenerator
+from core.payloads import PayloadEngine, BUILTIN_CATEGORIES, DEFAULT_CATEGORIES, load_corpus
+
+def _endpoint(params):
+    api_def = ApiDefinition()
+    api_def.add_endpoint("POST", "/items/{id}", params, {})
+    return api_def.endpoints[0]
+
+ENDPOINT_PARAMS = {
+    "path_params": [{"name": "id", "in": "path", "required": True, "schema": {"type": "string"}}],
+    "query_params": [{"name": "q", "in": "query", "type": "string"}],
+    "header_params": [{"name": "X-Trace", "in": "header", "required": True, "type": "string"}],
+    "body_params": [{"name": "title", "in": "body", "required": True, "type": "string"},
+                    {"name": "count", "in": "body", "required": True, "type": "integer"}]
+}
+
+def test_default_engine_sends_one_sqli_payload_per_string_param():
+    cases = list(TestCaseGenerator(None).iter_security_cases(_endpoint(ENDPOINT_PARAMS)))
+    assert [c.name for c in cases] == [f"POST__items_{{id}}_sqli_{p}" for p in ("id", "q", "X-Trace", "title")]
+    assert DEFAULT_CATEGORIES == ("sqli",)
+
+    depth = TestCaseGenerator(None, payloads=PayloadEngine(["sqli"], depth=2))
+    assert len(list(depth.iter_security_cases(_endpoint(ENDPOINT_PARAMS)))) == 8
+
+def test_payloads_target_their_locations():
+    generator = TestCaseGenerator(None, payloads=PayloadEngine(["all"], max_cases=0, depth=0))
+    cases = list(generator.iter_security_cases(_endpoint(ENDPOINT_PARAMS)))
+    by_category = {c.name: c for c in BUILTIN_CATEGORIES}
+    locations = {"id": "path", "q": "query", "X-Trace": "header", "title": "body"}
+
+    expected = sum(len(c.payloads) for name in locations for c in BUILTIN_CATEGORIES if locations[name] in c.locations)
+    assert len(cases) == expected
+    for case in cases:
+        target = next(n for n in locations if case.name.endswith("_" + n))
+        assert case.parameters[target] != "sample_value"
+        # Other required parameters of the same location keep their sample values
+        if target == "title":
+            assert case.parameters["count"] == 123
+    # Optional parameters are attacked too, and raw CRLF never goes into a header
+    assert any(c.name.endswith("_sqli_q") and c.parameters == {"q": "admin' OR '1'='1"} for c in cases)
+    assert not any("\r\n" in str(c.parameters.get("X-Trace", "")) for c in cases)
+    assert any(c.name.endswith("_path_traversal_id") for c in cases)
+    assert not any(c.name.endswith("_path_traversal_title") for c in cases)
+    assert by_category["oversized"].status == (400, 413, 414, 431)
+
+def test_budget_keeps_breadth_and_is_deterministic():
+    endpoint = _endpoint(ENDPOINT_PARAMS)
+    engine = PayloadEngine(["all"], max_cases=12, seed=3, depth=0)
+    generator = TestCaseGenerator(None, payloads=engine)
+    cases = list(generator.iter_security_cases(endpoint))
+    assert len(cases) == 12
+    assert [c.name for c in generator.iter_security_cases(endpoint)] == [c.name for c in cases]
+    # 17 (parameter, category) pairings: the budget is drawn from first payloads only
+    targets = [(bucket, p) for bucket, params in endpoint["parameters"].items()
+               for p in params if p["name"] != "count"]
+    assert {rank for _, _, _, rank in engine.attacks("POST", "/items/{id}", targets)} == {0}
+
+    small = TestCaseGenerator(None, payloads=PayloadEngine(["sqli"], max_cases=5, depth=0))
+    names = [c.name for c in small.iter_security_cases(endpoint)]
+    assert names[:4] == [f"POST__items_{{id}}_sqli_{p}" for p in ("id", "q", "X-Trace", "title")]
+    assert names[4].startswith("POST__items_{id}_sqli2_")
+
+def test_corpus_files_add_and_replace_categories(tmp_path):
+    (tmp_path / "ldap.txt").write_text("# LDAP injection\n*)(uid=*\n\n*)(|(objectClass=*)\n")
+    (tmp_path / "custom.json").write_text(json.dumps({
+        "sqli": {"payloads": ["' OR 1=1 --"], "locations": ["query"], "not_contains": ["ORA-"]}
+    }))
+    categories = {c.name: c for c in load_corpus(str(tmp_path))}
+    assert categories["ldap"].payloads == ("*)(uid=*", "*)(|(objectClass=*)")
+    assert load_corpus(str(tmp_path / "ldap.txt"))[0] is categories["ldap"]
+
+    engine = PayloadEngine(["sqli", "ldap"], [str(tmp_path)])
+    cases = list(TestCaseGenerator(None, payloads=engine).iter_security_cases(_endpoint(ENDPOINT_PARAMS)))
+    sqli = [c for c in cases if "_sqli_" in c.name]
+    assert [c.name for c in sqli] == ["POST__items_{id}_sqli_q"] and sqli[0].not_contains == ["ORA-"]
+    assert engine.fingerprint()["categories"] == ["sqli", "ldap"]
+    # Corpus categories are used without naming them
+    assert [c.name for c in PayloadEngine(corpus=[str(tmp_path)]).categories] == ["sqli", "ldap"]
+    assert PayloadEngine().fingerprint() == {}
+
+    with pytest.raises(ValueError):
+        PayloadEngine(["nosuch"])
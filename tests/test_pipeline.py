@@ -0,0 +1,54 @@
+import argparse
+import json
+import shutil
+import pytest
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator, CASE_TYPES
+from core.pipeline import DEFAULT_OPTIONS, generate_for_spec
+from core.cli import add_arguments, options_from_args, main
+
+SPEC = str(Path(__file__).parent.parent / "examples" / "order_api.yaml")
+
+def _options(*argv):
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
+    return options_from_args(parser.parse_args(list(argv)))
+
+def test_command_line_defaults_match_pipeline_defaults():
+    assert _options() == DEFAULT_OPTIONS
+    options = _options("--no-security", "--combinatorial", "--security-categories", "sqli,xss")
+    assert options["case_types"] == ("normal", "error", "boundary", "combinatorial")
+    assert options["security_categories"] == ("sqli", "xss")
+
+def test_generate_for_spec_writes_reports(tmp_path):
+    lines = []
+    summary = generate_for_spec(SwaggerParser(), SPEC, str(tmp_path), dict(DEFAULT_OPTIONS), log=lines.append)
+
+    report = json.loads((tmp_path / "test_cases.json").read_text())
+    parser = SwaggerParser()
+    expected = list(TestCaseGenerator(parser).iter_cases(parser.parse(SPEC).endpoints, CASE_TYPES))
+    assert report["test_cases"] == [case.to_dict() for case in expected]
+    assert summary["cases"] == report["metadata"]["total_cases"] == len(expected)
+    assert summary["html_report"] == str(tmp_path / "report.html")
+    assert f"Generated {len(expected)} test cases" in lines
+
+def test_main_reports_undetectable_specs(tmp_path, monkeypatch, capsys):
+    specs = tmp_path / "specs"
+    specs.mkdir()
+    shutil.copy(SPEC, specs / "order_api.yaml")
+    (specs / "notes.json").write_text('["not a spec"]')
+    output = tmp_path / "out"
+
+    monkeypatch.setattr("sys.argv", ["main.py", str(specs), "-o", str(output), "--html", "none"])
+    main()
+    assert f"Skipping {specs / 'notes.json'}: Could not detect" in capsys.readouterr().out
+    assert (output / "order_api" / "test_cases.json").exists()
+    # A directory runs through the batch runner and gets its index
+    assert [spec["name"] for spec in json.loads((output / "index.json").read_text())["specs"]] == ["order_api"]
+
+    monkeypatch.setattr("sys.argv", ["main.py", str(specs / "notes.json"), "-o", str(output)])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 2
+    assert "Could not detect the spec format" in capsys.readouterr().err
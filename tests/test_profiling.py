@@ -0,0 +1,28 @@
+import pstats
+from pathlib import Path
+from core.parsers.parser import SwaggerParser
+from core.generator import TestCaseGenerator
+from core.profiling import Profiler
+
+def test_profiler_times_stages_and_endpoints(tmp_path):
+    spec = str(Path(__file__).parent.parent / "examples" / "order_api.yaml")
+    parser = SwaggerParser()
+    generator = TestCaseGenerator(parser)
+    stats_path = str(tmp_path / "run.pstats")
+    profiler = Profiler(stats_path=stats_path, top=1)
+
+    with profiler.stage('parse'):
+        endpoints = parser.parse(spec).endpoints
+    with profiler.stage('report'):
+        cases = list(profiler.iter_cases(generator, endpoints, 1, ('normal', 'error')))
+    profile = profiler.finish()
+
+    assert cases == list(generator.iter_cases(endpoints, ('normal', 'error')))
+    assert list(profile['stages']) == ['parse', 'generate', 'report']
+    generate = profile['stages']['generate']
+    assert generate['cases'] == len(cases)
+    assert sum(t['cases'] for t in generate['by_type'].values()) == len(cases)
+    assert profile['stages']['parse']['peak_memory'] > 0
+    assert profile['endpoints'] == len(endpoints) and len(profile['slowest_endpoints']) == 1
+    assert profile['slowest_endpoints'][0]['endpoint'] in {f"{e['method'].upper()} {e['path']}" for e in endpoints}
+    assert pstats.Stats(stats_path).total_calls > 0
@@ -0,0 +1,50 @@
+import pickle
+import sys
+from core.records import Case, Endpoint, Parameter, as_dict
+from core.parsers.iapi_parser import ApiDefinition
+
+def test_parameter_keeps_absent_and_none_apart():
+    param = Parameter.from_dict({"name": "age", "in": "query", "type": "integer",
+                                 "minimum": None, "description": "years", "x-internal": True})
+    assert "minimum" in param and param["minimum"] is None
+    assert "maximum" not in param and param.get("maximum", 5) == 5
+    assert param["in"] == "query" and param["x-internal"] is True
+    assert param.to_dict() == {"name": "age", "in": "query", "type": "integer", "minimum": None,
+                               "description": "years", "x-internal": True}
+    param["maxLength"] = 3
+    assert param.to_dict()["maxLength"] == 3
+
+def test_endpoint_round_trips_to_the_dict_shape():
+    source = {
+        "method": "POST",
+        "path": "/pets",
+        "parameters": {"path_params": [], "query_params": [], "header_params": [],
+                       "body_params": [{"name": "name", "in": "body", "required": True, "type": "string"}]},
+        "responses": {"201": {"description": "created"}}
+    }
+    api_def = ApiDefinition()
+    api_def.add_endpoint(source["method"], "".join(["/p", "ets"]), source["parameters"], source["responses"])
+    endpoint = api_def.get_endpoint("post", "/pets")
+
+    assert isinstance(endpoint, Endpoint) and endpoint == source
+    assert endpoint.path is sys.intern("/pets")
+    assert "metadata" not in endpoint
+    assert pickle.loads(pickle.dumps(endpoint)).to_dict() == source
+
+def test_case_serializes_to_the_report_shape():
+    case = Case("POST__pets_sqli_name", "security", "POST", "/pets", {"name": "x"},
+                status=[400, 500], not_contains=["SQL syntax"])
+    expected = {
+        "name": "POST__pets_sqli_name",
+        "type": "security",
+        "request": {"method": "POST", "path": "/pets", "parameters": {"name": "x"}},
+        "expect": {"status": [400, 500], "not_contains": ["SQL syntax"]}
+    }
+    assert as_dict(case) == expected and list(as_dict(case)) == list(expected)
+    assert case["request"]["parameters"] == {"name": "x"}
+    assert case == expected
+    assert pickle.loads(pickle.dumps(case)) == case
+    assert as_dict(expected) is expected
+
+    plain = Case("GET__pets_normal", "normal", "GET", "/pets")
+    assert as_dict(plain)["expect"] == {"status": 200}
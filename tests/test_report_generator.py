@@ -0,0 +1,155 @@
+import json
+import pytest
+from core.report_generator import ReportGenerator, JsonReportWriter
+
+CASES = [
+    {"name": f"GET__items_{i}", "type": "normal",
+     "request": {"method": "GET", "path": "/items", "parameters": {"id": i}},
+     "expect": {"status": 200}}
+    for i in range(3)
+]
+
+def test_json_stream_matches_materialized_report(tmp_path):
+    report_gen = ReportGenerator(str(tmp_path))
+    path = report_gen.generate_json_stream(iter(CASES))
+    with open(path) as f:
+        report = json.load(f)
+    assert report["test_cases"] == CASES
+    assert report["metadata"]["total_cases"] == 3
+
+def test_json_stream_array_is_byte_compatible(tmp_path):
+    path = tmp_path / "cases.json"
+    with JsonReportWriter(str(path), fmt="array", metadata_mode="none") as writer:
+        writer.write_all(CASES)
+    assert path.read_text() == json.dumps(CASES, indent=2)
+
+@pytest.mark.parametrize("fmt", ["json", "array", "jsonl"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_every_format_accepts_what_json_accepts(tmp_path, fmt, compact):
+    # orjson alone rejects int keys and ints wider than 64 bits
+    case = dict(CASES[0], request={"method": "GET", "path": "/items",
+                                   "parameters": {"id": 2 ** 70, "filter": {1: "a"}}})
+    path = tmp_path / "cases.json"
+    with JsonReportWriter(str(path), fmt=fmt, compact=compact, metadata_mode="none") as writer:
+        writer.write(case)
+    text = path.read_text()
+    if fmt == "jsonl":
+        written = json.loads(text.splitlines()[0])
+    else:
+        written = json.loads(text)
+        written = written[0] if fmt == "array" else written["test_cases"][0]
+    assert written["request"]["parameters"] == {"id": 2 ** 70, "filter": {"1": "a"}}
+
+def test_jsonl_with_sidecar_metadata(tmp_path):
+    report_gen = ReportGenerator(str(tmp_path))
+    path = report_gen.generate_json_stream(iter(CASES), filename="cases.jsonl", fmt="jsonl",
+                                           metadata={"spec": "items.yaml"})
+    with open(path) as f:
+        assert [json.loads(line) for line in f] == CASES
+    with open(path + ".meta.json") as f:
+        metadata = json.load(f)
+    assert metadata["total_cases"] == 3
+    assert metadata["spec"] == "items.yaml"
+
+@pytest.mark.parametrize("fmt", ["json", "array"])
+def test_compact_stream_round_trips(tmp_path, fmt):
+    path = tmp_path / "cases.json"
+    writer = JsonReportWriter(str(path), fmt=fmt, compact=True, metadata_mode="sidecar")
+    writer.write_all(CASES)
+    writer.close()
+    data = json.loads(path.read_text())
+    assert (data if fmt == "array" else data["test_cases"]) == CASES
+    assert "\n" not in path.read_text()
+
+def test_html_report_consumes_stream_once(tmp_path):
+    report_gen = ReportGenerator(str(tmp_path))
+    with JsonReportWriter(str(tmp_path / "cases.json")) as writer:
+        html_path = report_gen.generate_html_report(writer.tap(c for c in CASES))
+    html = open(html_path).read()
+    assert writer.total_cases == 3
+    assert html.count('<div class="case normal">') == 3
+    assert "<p>Total cases: 3</p>" in html and "<script>" not in html
+
+def test_html_report_escapes_payloads(tmp_path):
+    from pathlib import Path
+    from core.parsers.parser import SwaggerParser
+    from core.generator import TestCaseGenerator
+    from core.payloads import PayloadEngine
+
+    parser = SwaggerParser()
+    api_def = parser.parse(str(Path(__file__).parent.parent / "examples" / "order_api.yaml"))
+    cases = TestCaseGenerator(parser, payloads=PayloadEngine(["xss"], depth=0)).iter_cases(api_def.endpoints)
+    html = open(ReportGenerator(str(tmp_path)).generate_html_report(cases)).read()
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "<script>alert(1)" not in html and "<svg onload" not in html
+
+def test_paged_html_report_writes_shards(tmp_path):
+    report_gen = ReportGenerator(str(tmp_path))
+    cases = CASES + [dict(CASES[0], name="POST__items_error", type="error",
+                          request={"method": "POST", "path": "/items", "parameters": {}})]
+    index_path = report_gen.generate_paged_html_report(iter(cases), page_size=2)
+
+    shards = sorted((tmp_path / "report" / "shards").glob("shard-*.js"))
+    assert len(shards) == 2
+    first = shards[0].read_text()
+    assert first.startswith("window.__reportShard(0, ")
+    assert json.loads(first[len("window.__reportShard(0, "):-3]) == cases[:2]
+
+    index = open(index_path).read()
+    assert "Total cases: 4 in 2 pages" in index
+    assert '"endpoints": {"GET /items": 1, "POST /items": 1}' in index
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_case_validator_reports_every_violation(fast):
+    from core.report_generator import CaseValidator
+
+    bad_type = dict(CASES[1], type="smoke")
+    bad_status = dict(CASES[2], expect={"status": "200", "not_contains": [1]})
+    validator = CaseValidator(fast=fast)
+    stream = validator.tap([CASES[0], bad_type, bad_status, True])
+    assert len(list(stream)) == 4
+
+    indexes = [index for index, _ in validator.violations]
+    assert indexes == [1, 2, 2, 3]
+    assert validator.violations[0][1].startswith("type: 'smoke' is not one of")
+    assert not validator.valid
+
+def test_validate_schema_and_validate_cases(tmp_path):
+    report_gen = ReportGenerator(str(tmp_path))
+    assert report_gen.validate_schema(CASES)
+    assert not report_gen.validate_schema(CASES + [{"name": "x"}])
+    assert report_gen.validate_cases(CASES + [{"name": "x"}]) == [
+        (3, "'type' is a required property"),
+        (3, "'request' is a required property"),
+        (3, "'expect' is a required property"),
+    ]
+
+def test_delta_report_round_trips(tmp_path):
+    from core.executor import iter_case_file
+
+    params = {f"p{i}": i for i in range(10)}
+    cases = [
+        {"name": "POST__x_normal", "type": "normal",
+         "request": {"method": "POST", "path": "/x", "parameters": dict(params)}, "expect": {"status": 200}},
+        {"name": "POST__x_zero_p3", "type": "boundary",
+         "request": {"method": "POST", "path": "/x", "parameters": dict(params, p3=0)}, "expect": {"status": 200}},
+        {"name": "POST__x_missing_p0", "type": "error",
+         "request": {"method": "POST", "path": "/x", "parameters": {k: v for k, v in params.items() if k != "p0"}},
+         "expect": {"status": 400}},
+        # True == 1 in Python but must survive as a changed value
+        {"name": "POST__x_flag", "type": "boundary",
+         "request": {"method": "POST", "path": "/x", "parameters": dict(params, p1=True)}, "expect": {"status": 200}},
+        {"name": "GET__y_zero_id", "type": "boundary",
+         "request": {"method": "GET", "path": "/y", "parameters": {"id": 0}}, "expect": {"status": 200}},
+    ]
+    report_gen = ReportGenerator(str(tmp_path))
+    full = report_gen.generate_json_stream(iter(cases), filename="full.jsonl", fmt="jsonl")
+    delta = report_gen.generate_json_stream(iter(cases), filename="delta.jsonl", fmt="jsonl", delta=True)
+
+    stored = [json.loads(line) for line in open(delta)]
+    assert stored[1]["request"]["delta"] == {"base": "POST__x_normal", "set": {"p3": 0}, "unset": []}
+    assert stored[2]["request"]["delta"]["unset"] == ["p0"]
+    assert stored[3]["request"]["delta"]["set"] == {"p1": True}
+    assert "parameters" in stored[4]["request"]
+    assert list(iter_case_file(delta)) == cases
+    assert tmp_path.joinpath("delta.jsonl").stat().st_size < tmp_path.joinpath("full.jsonl").stat().st_size
@@ -0,0 +1,91 @@
+import pickle
+import re
+from pathlib import Path
+from core.generator import TestCaseGenerator
+from core.parsers.iapi_parser import ApiDefinition
+from core.parsers.parser import SwaggerParser
+from core.samples import SampleEngine
+
+def test_fixed_mode_keeps_the_legacy_constants():
+    engine = SampleEngine()
+    assert engine.value({"name": "a", "type": "integer", "minimum": 500}) == 123
+    assert engine.value({"name": "b", "type": "string", "format": "email"}) == "sample_value"
+    assert engine.value({"name": "c", "type": "boolean", "example": False}) is False
+    assert engine.rng("GET", "/pets", "query_params") is None
+
+def test_schema_mode_honours_constraints():
+    engine = SampleEngine('schema')
+    assert engine.value({"name": "a", "type": "integer", "minimum": 500}) == 500
+    assert engine.value({"name": "b", "type": "integer", "maximum": 9, "multipleOf": 2}) == 8
+    assert engine.value({"name": "c", "type": "string", "format": "email"}) == "user@example.com"
+    assert engine.value({"name": "d", "type": "string", "enum": ["asc", "desc"]}) == "asc"
+    assert engine.value({"name": "e", "type": "string", "maxLength": 4}) == "samp"
+    code = engine.value({"name": "f", "type": "string", "pattern": r"^[A-Z]{3}-\d{4}$"})
+    assert re.fullmatch(r"[A-Z]{3}-\d{4}", code)
+    # OpenAPI 3 parameters keep their constraints under schema
+    assert engine.value({"name": "g", "in": "query", "schema": {"type": "integer", "maximum": 7}}) == 7
+
+def test_schema_mode_builds_nested_bodies(tmp_path):
+    spec = tmp_path / "nested.yaml"
+    spec.write_text("""
+openapi: 3.0.0
+info: {title: nested, version: '1'}
+paths:
+  /orders:
+    post:
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              required: [customer]
+              properties:
+                customer: {$ref: '#/components/schemas/Customer'}
+      responses: {'201': {description: created}}
+components:
+  schemas:
+    Customer:
+      type: object
+      properties:
+        id: {type: string, format: uuid}
+        tags: {type: array, items: {type: string, enum: [vip]}}
+""")
+    parser = SwaggerParser()
+    endpoint = parser.parse(str(spec)).endpoints[0]
+    case = next(TestCaseGenerator(parser, SampleEngine('schema')).iter_normal_cases(endpoint))
+    customer = case["request"]["parameters"]["customer"]
+    assert re.fullmatch(r"[0-9a-f-]{36}", customer["id"]) and customer["tags"] == ["vip"]
+
+def test_random_mode_is_reproducible_per_seed():
+    body = [{"name": f"f{i}", "in": "body", "required": True, "type": "string", "pattern": r"^[a-z]{4,8}$"}
+            for i in range(5)]
+    api_def = ApiDefinition()
+    api_def.add_endpoint("POST", "/items", {"body_params": body}, {})
+    endpoint = api_def.endpoints[0]
+
+    def normal(seed, engine=None):
+        generator = TestCaseGenerator(None, engine or SampleEngine('random', seed))
+        return next(generator.iter_normal_cases(endpoint))["request"]["parameters"]
+
+    first = normal(1)
+    assert all(re.fullmatch(r"[a-z]{4,8}", value) for value in first.values())
+    assert normal(1) == first and normal(2) != first
+    # Worker processes receive a pickled engine and must produce the same values
+    engine = pickle.loads(pickle.dumps(SampleEngine('random', 1)))
+    assert normal(1, engine) == first
+    # Every case type starts from the same random baseline
+    error = next(TestCaseGenerator(None, SampleEngine('random', 1)).iter_error_cases(endpoint))
+    assert error["request"]["parameters"] == {k: v for k, v in first.items() if k != "f0"}
+
+def test_random_combinatorial_cases_include_optional_params():
+    from core.parallel import generate_parallel
+
+    parser = SwaggerParser()
+    api_def = parser.parse(str(Path(__file__).parent.parent / "examples" / "order_api.yaml"))
+    generator = TestCaseGenerator(parser, SampleEngine('random', 7))
+    cases = generate_parallel(generator, api_def.endpoints, 1, ('combinatorial',))
+    assert cases and all(case["type"] == "combinatorial" for case in cases)
+    # The optional paymentMethod enum is varied alongside the required fields
+    methods = {case["request"]["parameters"].get("paymentMethod") for case in cases}
+    assert methods == {"credit_card", "paypal", "wechat"}
+    assert generate_parallel(generator, api_def.endpoints * 2, 2, ('combinatorial',)) == cases * 2